@@ -7,6 +7,7 @@ This script starts both the FastMCP server and a simple HTTP status server.
 import sys
 import os
 import asyncio
+import concurrent.futures
 import json
 import threading
 from http.server import HTTPServer, BaseHTTPRequestHandler
@@ -15,6 +16,74 @@ from urllib.parse import urlparse
 # Add src directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
+def get_mcp_client():
+    """Return the running MCP server's OpenProject client, if loaded."""
+    mcp_server = sys.modules.get("mcp_server")
+    return getattr(mcp_server, "openproject_client", None)
+
+
+def get_circuit_breaker_state():
+    """Return the circuit breaker state of the running MCP server's client, if loaded.
+    
+    The breaker belongs to the MCP server's event loop; its stats are a
+    read-only snapshot, so reading them from this thread cannot move it
+    between states.
+    """
+    client = get_mcp_client()
+    return client.get_circuit_breaker_state() if client else None
+
+
+# Seconds to wait for the connection check on the MCP server's event loop
+HEALTH_CHECK_TIMEOUT = 10
+
+
+def check_openproject_connection():
+    """Test the OpenProject connection, reusing the running MCP server's client when possible.
+    
+    The client's connection pool belongs to the MCP server's event loop, so
+    the check is scheduled there. Until that client has sent a request its
+    loop is unknown, and a short-lived client is used instead.
+    """
+    client = get_mcp_client()
+    loop = getattr(client, "loop", None)
+    if loop is not None and loop.is_running():
+        future = asyncio.run_coroutine_threadsafe(client.test_connection(), loop)
+        try:
+            return future.result(timeout=HEALTH_CHECK_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            return {"success": False, "message": "OpenProject connection check timed out"}
+    
+    from openproject_client import OpenProjectClient
+    
+    async def check():
+        client = OpenProjectClient()
+        try:
+            return await client.test_connection()
+        finally:
+            await client.close()
+    
+    return asyncio.run(check())
+
+
+_webhook_handler = None
+_webhook_lock = threading.Lock()
+
+
+def get_webhook_handler():
+    """Return the webhook handler bound to the running MCP server's client, if loaded."""
+    global _webhook_handler
+    client = get_mcp_client()
+    if client is None:
+        return None
+    with _webhook_lock:
+        if _webhook_handler is None or _webhook_handler.client is not client:
+            from config import settings
+            from handlers.webhooks import WebhookHandler
+            _webhook_handler = WebhookHandler(client, settings.webhook_secret)
+        return _webhook_handler
+
+
 class StatusHandler(BaseHTTPRequestHandler):
     """HTTP handler for status endpoints."""
     
@@ -29,42 +98,78 @@ class StatusHandler(BaseHTTPRequestHandler):
         else:
             self.send_error(404, "Not Found")
     
+    def do_POST(self):
+        """Handle POST requests."""
+        if urlparse(self.path).path == '/webhook':
+            self.send_webhook_response()
+        else:
+            self.send_error(404, "Not Found")
+    
+    def send_webhook_response(self):
+        """Verify an OpenProject webhook and queue it for cache invalidation."""
+        from handlers.webhooks import MAX_BODY_BYTES, SIGNATURE_HEADER
+        
+        handler = get_webhook_handler()
+        content_length = self.headers.get('Content-Length')
+        try:
+            length = int(content_length) if content_length is not None else None
+        except ValueError:
+            length = -1
+        
+        # The body is only read once its declared size is known to be sane
+        if handler is None:
+            status, result = 503, {"success": False, "error": "MCP server is not running"}
+        elif length is None:
+            status, result = 411, {"success": False, "error": "Content-Length required"}
+        elif length < 0:
+            status, result = 400, {"success": False, "error": "Invalid Content-Length"}
+        elif length > MAX_BODY_BYTES:
+            status, result = 413, {"success": False, "error": "Webhook body too large"}
+        else:
+            body = self.rfile.read(length)
+            status, result = handler.handle(body, self.headers.get(SIGNATURE_HEADER))
+        
+        self.send_response(status)
+        self.send_header('Content-type', 'application/json')
+        self.end_headers()
+        self.wfile.write(json.dumps(result).encode())
+    
     def send_health_response(self):
         """Send health check response."""
         try:
             # Import here to avoid issues during module loading
-            from openproject_client import OpenProjectClient
             from config import settings
             
-            # Create a new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
-            async def check_health():
-                client = OpenProjectClient()
-                try:
-                    connection_result = await client.test_connection()
-                    if connection_result.get('success'):
-                        return {
-                            "status": "healthy",
-                            "message": "OpenProject MCP Server is currently running",
-                            "openproject_connection": "connected",
-                            "openproject_version": connection_result.get('openproject_version', 'unknown'),
-                            "openproject_url": settings.openproject_url
-                        }
-                    else:
-                        return {
-                            "status": "degraded", 
-                            "message": "OpenProject MCP Server is running but OpenProject connection failed",
-                            "openproject_connection": "failed",
-                            "error": connection_result.get('message', 'Unknown connection error'),
-                            "openproject_url": settings.openproject_url
-                        }
-                finally:
-                    await client.close()
-            
-            result = loop.run_until_complete(check_health())
-            loop.close()
+            circuit_breaker = get_circuit_breaker_state()
+            if circuit_breaker and circuit_breaker["state"] == "open":
+                # The MCP server is already failing fast; don't probe OpenProject again
+                result = {
+                    "status": "degraded",
+                    "message": "OpenProject MCP Server is running but OpenProject is unavailable",
+                    "openproject_connection": "circuit_open",
+                    "openproject_url": settings.openproject_url,
+                    "circuit_breaker": circuit_breaker
+                }
+            else:
+                connection_result = check_openproject_connection()
+                if connection_result.get('success'):
+                    result = {
+                        "status": "healthy",
+                        "message": "OpenProject MCP Server is currently running",
+                        "openproject_connection": "connected",
+                        "openproject_version": connection_result.get('openproject_version', 'unknown'),
+                        "openproject_url": settings.openproject_url,
+                        "circuit_breaker": circuit_breaker
+                    }
+                else:
+                    result = {
+                        "status": "degraded", 
+                        "message": "OpenProject MCP Server is running but OpenProject connection failed",
+                        "openproject_connection": "failed",
+                        "error": connection_result.get('message', 'Unknown connection error'),
+                        "openproject_url": settings.openproject_url,
+                        "circuit_breaker": circuit_breaker
+                    }
             
             self.send_response(200)
             self.send_header('Content-type', 'application/json')
@@ -93,6 +198,7 @@ class StatusHandler(BaseHTTPRequestHandler):
             "message": "OpenProject MCP Server is currently running",
             "endpoints": {
                 "/health": "Health check with OpenProject connection status",
+                "/webhook": "OpenProject webhook receiver (POST, requires OPENPROJECT_WEBHOOK_SECRET)",
                 "/": "Basic server information"
             },
             "mcp_tools": [
@@ -23,6 +23,69 @@ class Settings:
         self.mcp_host: str = os.getenv("MCP_HOST", "localhost")
         self.mcp_port: int = int(os.getenv("MCP_PORT", "8080"))
         self.log_level: str = os.getenv("MCP_LOG_LEVEL", "INFO")
+        # Emit tool and resource JSON without indentation (smaller payloads for machine clients)
+        self.json_compact: bool = os.getenv("MCP_JSON_COMPACT", "false").lower() == "true"
+        
+        # HTTP client configuration (timeouts in seconds)
+        self.http_max_connections: int = int(os.getenv("OPENPROJECT_HTTP_MAX_CONNECTIONS", "20"))
+        self.http_max_keepalive_connections: int = int(os.getenv("OPENPROJECT_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+        self.http_keepalive_expiry: float = float(os.getenv("OPENPROJECT_HTTP_KEEPALIVE_EXPIRY", "30"))
+        self.http2: bool = os.getenv("OPENPROJECT_HTTP2", "false").lower() == "true"
+        self.http_connect_timeout: float = float(os.getenv("OPENPROJECT_HTTP_CONNECT_TIMEOUT", "5"))
+        self.http_read_timeout: float = float(os.getenv("OPENPROJECT_HTTP_READ_TIMEOUT", "30"))
+        self.http_write_timeout: float = float(os.getenv("OPENPROJECT_HTTP_WRITE_TIMEOUT", "30"))
+        self.http_pool_timeout: float = float(os.getenv("OPENPROJECT_HTTP_POOL_TIMEOUT", "10"))
+        
+        # Retry configuration for transient failures (connection errors, 429, 5xx)
+        self.max_retries: int = int(os.getenv("OPENPROJECT_MAX_RETRIES", "3"))
+        self.retry_backoff_base: float = float(os.getenv("OPENPROJECT_RETRY_BACKOFF_BASE", "0.5"))
+        self.retry_backoff_max: float = float(os.getenv("OPENPROJECT_RETRY_BACKOFF_MAX", "10"))
+        self.retry_deadline: float = float(os.getenv("OPENPROJECT_RETRY_DEADLINE", "60"))
+        self.retry_post: bool = os.getenv("OPENPROJECT_RETRY_POST", "false").lower() == "true"
+        
+        # Client-side rate limiting (requests per second, 0 disables a limit; all off by default)
+        self.rate_limit: float = float(os.getenv("OPENPROJECT_RATE_LIMIT", "0"))
+        self.rate_limit_burst: float = float(os.getenv("OPENPROJECT_RATE_LIMIT_BURST", "0"))
+        self.rate_limit_read: float = float(os.getenv("OPENPROJECT_RATE_LIMIT_READ", "0"))
+        self.rate_limit_write: float = float(os.getenv("OPENPROJECT_RATE_LIMIT_WRITE", "0"))
+        
+        # Circuit breaker: fail fast after consecutive backend failures
+        self.circuit_breaker_failure_threshold: int = int(os.getenv("OPENPROJECT_CIRCUIT_BREAKER_FAILURE_THRESHOLD", "5"))
+        self.circuit_breaker_recovery_timeout: float = float(os.getenv("OPENPROJECT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT", "30"))
+        
+        # Pagination configuration
+        self.pagination_size: int = int(os.getenv("OPENPROJECT_PAGINATION_SIZE", "100"))
+        self.max_concurrent_requests: int = int(os.getenv("OPENPROJECT_MAX_CONCURRENT_REQUESTS", "4"))
+        self.max_paginated_results: int = int(os.getenv("OPENPROJECT_MAX_PAGINATED_RESULTS", "10000"))
+        
+        # Cache configuration (TTLs in seconds; 0 disables caching for that namespace)
+        self.cache_timeout_minutes: int = int(os.getenv("OPENPROJECT_CACHE_TIMEOUT_MINUTES", "5"))
+        self.cache_ttl_reference: int = int(os.getenv("OPENPROJECT_CACHE_TTL_REFERENCE", "3600"))
+        self.cache_ttl_projects: int = int(os.getenv("OPENPROJECT_CACHE_TTL_PROJECTS", "900"))
+        self.cache_ttl_work_packages: int = int(os.getenv("OPENPROJECT_CACHE_TTL_WORK_PACKAGES", "30"))
+        self.cache_max_entries: int = int(os.getenv("OPENPROJECT_CACHE_MAX_ENTRIES", "1000"))
+        self.cache_max_bytes: int = int(os.getenv("OPENPROJECT_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+        
+        # Conditional requests (ETag / Last-Modified); cached responses carrying a
+        # validator are kept this long for revalidation after their TTL expires
+        self.conditional_requests: bool = os.getenv("OPENPROJECT_CONDITIONAL_REQUESTS", "true").lower() == "true"
+        self.revalidation_cache_ttl: int = int(os.getenv("OPENPROJECT_REVALIDATION_CACHE_TTL", "86400"))
+        
+        # Optional SQLite cache surviving restarts (disabled when the path is empty)
+        self.persistent_cache_path: str = os.getenv("OPENPROJECT_PERSISTENT_CACHE_PATH", "")
+        self.persistent_cache_max_entries: int = int(os.getenv("OPENPROJECT_PERSISTENT_CACHE_MAX_ENTRIES", "50000"))
+        self.persistent_cache_max_bytes: int = int(os.getenv("OPENPROJECT_PERSISTENT_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+        
+        # Shared secret for verifying OpenProject webhook signatures (webhooks disabled when empty)
+        self.webhook_secret: str = os.getenv("OPENPROJECT_WEBHOOK_SECRET", "")
+        
+        # Local project mirrors refreshed with updatedAt deltas
+        self.mirror_enabled: bool = os.getenv("OPENPROJECT_MIRROR_ENABLED", "true").lower() == "true"
+        self.mirror_full_sync_interval: int = int(os.getenv("OPENPROJECT_MIRROR_FULL_SYNC_INTERVAL", "3600"))
+        self.mirror_max_projects: int = int(os.getenv("OPENPROJECT_MIRROR_MAX_PROJECTS", "20"))
+        
+        # Last seen lockVersion per work package, used for optimistic updates
+        self.lock_version_cache_size: int = int(os.getenv("OPENPROJECT_LOCK_VERSION_CACHE_SIZE", "5000"))
         
         # Validate configuration
         self._validate_config()
@@ -44,6 +107,60 @@ class Settings:
         
         if not (1 <= self.mcp_port <= 65535):
             raise ValueError("MCP_PORT must be between 1 and 65535")
+        
+        if self.http_max_connections <= 0:
+            raise ValueError("OPENPROJECT_HTTP_MAX_CONNECTIONS must be a positive integer")
+        
+        if not (0 <= self.http_max_keepalive_connections <= self.http_max_connections):
+            raise ValueError("OPENPROJECT_HTTP_MAX_KEEPALIVE_CONNECTIONS must be between 0 and OPENPROJECT_HTTP_MAX_CONNECTIONS")
+        
+        if min(self.http_connect_timeout, self.http_read_timeout, self.http_write_timeout, self.http_pool_timeout) <= 0:
+            raise ValueError("HTTP timeouts must be positive")
+        
+        if self.max_retries < 0:
+            raise ValueError("OPENPROJECT_MAX_RETRIES must be zero or a positive integer")
+        
+        if self.retry_backoff_base < 0 or self.retry_backoff_max < 0:
+            raise ValueError("Retry backoff settings must not be negative")
+        
+        if self.retry_deadline <= 0:
+            raise ValueError("OPENPROJECT_RETRY_DEADLINE must be positive")
+        
+        if min(self.rate_limit, self.rate_limit_burst, self.rate_limit_read, self.rate_limit_write) < 0:
+            raise ValueError("Rate limit settings must not be negative")
+        
+        if self.circuit_breaker_failure_threshold <= 0:
+            raise ValueError("OPENPROJECT_CIRCUIT_BREAKER_FAILURE_THRESHOLD must be a positive integer")
+        
+        if self.circuit_breaker_recovery_timeout <= 0:
+            raise ValueError("OPENPROJECT_CIRCUIT_BREAKER_RECOVERY_TIMEOUT must be positive")
+        
+        if self.pagination_size <= 0:
+            raise ValueError("OPENPROJECT_PAGINATION_SIZE must be a positive integer")
+        
+        if self.max_concurrent_requests <= 0:
+            raise ValueError("OPENPROJECT_MAX_CONCURRENT_REQUESTS must be a positive integer")
+        
+        if self.max_paginated_results <= 0:
+            raise ValueError("OPENPROJECT_MAX_PAGINATED_RESULTS must be a positive integer")
+        
+        if min(self.cache_timeout_minutes, self.cache_ttl_reference, self.cache_ttl_projects, self.cache_ttl_work_packages) < 0:
+            raise ValueError("Cache TTLs must be zero or positive")
+        
+        if self.cache_max_entries <= 0 or self.cache_max_bytes <= 0:
+            raise ValueError("OPENPROJECT_CACHE_MAX_ENTRIES and OPENPROJECT_CACHE_MAX_BYTES must be positive integers")
+        
+        if self.revalidation_cache_ttl <= 0:
+            raise ValueError("OPENPROJECT_REVALIDATION_CACHE_TTL must be a positive integer")
+        
+        if self.persistent_cache_max_entries <= 0 or self.persistent_cache_max_bytes <= 0:
+            raise ValueError("Persistent cache size limits must be positive integers")
+        
+        if self.mirror_full_sync_interval <= 0 or self.mirror_max_projects <= 0:
+            raise ValueError("OPENPROJECT_MIRROR_FULL_SYNC_INTERVAL and OPENPROJECT_MIRROR_MAX_PROJECTS must be positive integers")
+        
+        if self.lock_version_cache_size < 0:
+            raise ValueError("OPENPROJECT_LOCK_VERSION_CACHE_SIZE must be zero or a positive integer")
 
 
 # Global settings instance
@@ -1,5 +1,5 @@
 """MCP resource handlers for OpenProject data browsing."""
-import json
+import asyncio
 from typing import List, Dict, Any
 import sys
 import os
@@ -7,6 +7,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from openproject_client import OpenProjectClient, OpenProjectAPIError
 from config import settings
+from utils.records import normalize_work_package, normalize_work_packages
+from utils.serialization import dumps
 
 
 class ResourceHandler:
@@ -83,7 +85,7 @@ class ResourceHandler:
                     {
                         "uri": "openproject://projects",
                         "mimeType": "application/json",
-                        "text": json.dumps({
+                        "text": dumps({
                             "projects": formatted_projects,
                             "total": len(formatted_projects),
                             "retrieved_at": "now"
@@ -108,7 +110,7 @@ class ResourceHandler:
                     {
                         "uri": "openproject://users",
                         "mimeType": "application/json", 
-                        "text": json.dumps({
+                        "text": dumps({
                             "message": "User listing not yet implemented",
                             "note": "This feature requires additional OpenProject API integration"
                         }, indent=2)
@@ -124,23 +126,28 @@ class ResourceHandler:
     async def _get_project_resource(self, project_id: int) -> Dict[str, Any]:
         """Get specific project resource data."""
         try:
-            projects = await self.client.get_projects()
-            project = next((p for p in projects if p.get("id") == project_id), None)
+            # Get the project and its work packages (from the local mirror) in parallel
+            project, work_packages = await asyncio.gather(
+                self.client.get_project_by_id(project_id),
+                self.client.get_mirrored_work_packages(project_id),
+                return_exceptions=True
+            )
+            if isinstance(project, BaseException):
+                raise project
             
             if not project:
                 return {
                     "error": f"Project with ID {project_id} not found"
                 }
-            
-            # Get work packages for this project
-            work_packages = await self.client.get_work_packages(project_id)
+            if isinstance(work_packages, BaseException):
+                raise work_packages
             
             return {
                 "contents": [
                     {
                         "uri": f"openproject://project/{project_id}",
                         "mimeType": "application/json",
-                        "text": json.dumps({
+                        "text": dumps({
                             "project": {
                                 "id": project.get("id"),
                                 "name": project.get("name"),
@@ -167,24 +174,24 @@ class ResourceHandler:
     async def _get_work_packages_resource(self, project_id: int) -> Dict[str, Any]:
         """Get work packages resource data for a project."""
         try:
-            work_packages = await self.client.get_work_packages(project_id)
+            work_packages = normalize_work_packages(await self.client.get_work_packages(project_id))
             
             formatted_wps = []
             for wp in work_packages:
                 formatted_wps.append({
-                    "id": wp.get("id"),
-                    "subject": wp.get("subject"),
-                    "description": wp.get("description", {}).get("raw", ""),
+                    "id": wp.id,
+                    "subject": wp.subject,
+                    "description": wp.description,
                     "project_id": project_id,
-                    "start_date": wp.get("startDate"),
-                    "due_date": wp.get("dueDate"),
-                    "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                    "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                    "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                    "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                    "created_at": wp.get("createdAt"),
-                    "updated_at": wp.get("updatedAt"),
-                    "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                    "start_date": wp.start_date,
+                    "due_date": wp.due_date,
+                    "status": wp.status or "Unknown",
+                    "type": wp.type or "Unknown",
+                    "priority": wp.priority or "Unknown",
+                    "assignee": wp.assignee or "Unassigned",
+                    "created_at": wp.created_at,
+                    "updated_at": wp.updated_at,
+                    "url": f"{settings.openproject_url}/work_packages/{wp.id}"
                 })
             
             return {
@@ -192,7 +199,7 @@ class ResourceHandler:
                     {
                         "uri": f"openproject://work-packages/{project_id}",
                         "mimeType": "application/json",
-                        "text": json.dumps({
+                        "text": dumps({
                             "work_packages": formatted_wps,
                             "project_id": project_id,
                             "total": len(formatted_wps),
@@ -211,30 +218,30 @@ class ResourceHandler:
     async def _get_work_package_resource(self, wp_id: int) -> Dict[str, Any]:
         """Get specific work package resource data."""
         try:
-            work_package = await self.client.get_work_package_by_id(wp_id)
+            work_package = normalize_work_package(await self.client.get_work_package_by_id(wp_id))
             
             return {
                 "contents": [
                     {
                         "uri": f"openproject://work-package/{wp_id}",
                         "mimeType": "application/json",
-                        "text": json.dumps({
+                        "text": dumps({
                             "work_package": {
-                                "id": work_package.get("id"),
-                                "subject": work_package.get("subject"),
-                                "description": work_package.get("description", {}).get("raw", ""),
-                                "project": work_package.get("_links", {}).get("project", {}).get("title", "Unknown"),
-                                "start_date": work_package.get("startDate"),
-                                "due_date": work_package.get("dueDate"),
-                                "status": work_package.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                                "type": work_package.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                                "priority": work_package.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                                "assignee": work_package.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                                "estimated_time": work_package.get("estimatedTime"),
-                                "done_ratio": work_package.get("doneRatio", 0),
-                                "created_at": work_package.get("createdAt"),
-                                "updated_at": work_package.get("updatedAt"),
-                                "url": f"{settings.openproject_url}/work_packages/{work_package.get('id')}"
+                                "id": work_package.id,
+                                "subject": work_package.subject,
+                                "description": work_package.description,
+                                "project": work_package.project or "Unknown",
+                                "start_date": work_package.start_date,
+                                "due_date": work_package.due_date,
+                                "status": work_package.status or "Unknown",
+                                "type": work_package.type or "Unknown",
+                                "priority": work_package.priority or "Unknown",
+                                "assignee": work_package.assignee or "Unassigned",
+                                "estimated_time": work_package.estimated_time,
+                                "done_ratio": work_package.done_ratio or 0,
+                                "created_at": work_package.created_at,
+                                "updated_at": work_package.updated_at,
+                                "url": f"{settings.openproject_url}/work_packages/{work_package.id}"
                             },
                             "retrieved_at": "now"
                         }, indent=2)
@@ -258,7 +265,7 @@ class ResourceHandler:
                     {
                         "uri": f"openproject://project-members/{project_id}",
                         "mimeType": "application/json",
-                        "text": json.dumps({
+                        "text": dumps({
                             "message": "Project members listing not yet implemented",
                             "project_id": project_id,
                             "note": "This feature requires additional OpenProject API integration"
@@ -0,0 +1,100 @@
+"""Webhook receiver for push-based cache invalidation."""
+import hashlib
+import hmac
+from typing import Any, Dict, Optional, Tuple
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from openproject_client import OpenProjectClient
+from utils.logging import get_logger
+from utils.serialization import loads
+
+logger = get_logger(__name__)
+
+# Header carrying "sha1=<hex HMAC of the raw body>"
+SIGNATURE_HEADER = "X-OP-Signature"
+
+# Largest webhook body accepted, in bytes
+MAX_BODY_BYTES = 1024 * 1024
+
+SIGNATURE_ALGORITHMS = {
+    "sha1": hashlib.sha1,
+    "sha256": hashlib.sha256,
+}
+
+
+def verify_signature(body: bytes, signature: Optional[str], secret: str) -> bool:
+    """Check a webhook body against its HMAC signature header.
+
+    OpenProject signs the raw body with the webhook secret and sends
+    "sha1=<hexdigest>"; "sha256=" is accepted as well.
+    """
+    if not signature or not secret:
+        return False
+    algorithm, _, digest = signature.strip().partition("=")
+    digestmod = SIGNATURE_ALGORITHMS.get(algorithm.lower())
+    if digestmod is None or not digest:
+        return False
+    expected = hmac.new(secret.encode(), body, digestmod).hexdigest()
+    return hmac.compare_digest(expected, digest.lower())
+
+
+class WebhookHandler:
+    """Verify and parse OpenProject webhooks and hand them to the client.
+
+    The HTTP server calls handle() from its own thread; events are queued on
+    the client, which applies them on its event loop before the next read.
+    """
+
+    def __init__(self, client: OpenProjectClient, secret: str):
+        self.client = client
+        self.secret = secret
+        self.accepted = 0
+        self.rejected = 0
+
+    def handle(self, body: bytes, signature: Optional[str]) -> Tuple[int, Dict[str, Any]]:
+        """Process one webhook delivery.
+
+        Args:
+            body: Raw request body
+            signature: Value of the X-OP-Signature header
+
+        Returns:
+            Tuple of HTTP status code and JSON response body
+        """
+        if not self.secret:
+            return 404, {"success": False, "error": "Webhooks are disabled (OPENPROJECT_WEBHOOK_SECRET is not set)"}
+
+        if len(body) > MAX_BODY_BYTES:
+            self.rejected += 1
+            return 413, {"success": False, "error": "Webhook body too large"}
+
+        if not verify_signature(body, signature, self.secret):
+            self.rejected += 1
+            logger.warning("Rejected webhook with invalid signature")
+            return 401, {"success": False, "error": "Invalid webhook signature"}
+
+        try:
+            payload = loads(body)
+        except ValueError:
+            self.rejected += 1
+            return 400, {"success": False, "error": "Webhook body is not valid JSON"}
+
+        action = payload.get("action") if isinstance(payload, dict) else None
+        if not isinstance(action, str) or ":" not in action:
+            self.rejected += 1
+            return 400, {"success": False, "error": "Webhook body has no action"}
+
+        self.client.enqueue_webhook_event(action, payload)
+        self.accepted += 1
+        logger.info("Webhook accepted", action=action)
+        return 202, {"success": True, "action": action}
+
+    def stats(self) -> Dict[str, Any]:
+        """Return delivery counters."""
+        return {
+            "enabled": bool(self.secret),
+            "accepted": self.accepted,
+            "rejected": self.rejected
+        }
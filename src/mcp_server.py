@@ -1,13 +1,19 @@
 """FastMCP server for OpenProject integration."""
 import asyncio
-import json
-from typing import Dict, Any, Optional, Union
+import math
+from typing import Awaitable, Dict, Any, List, Optional, Tuple, Union
 from fastmcp import FastMCP
 from openproject_client import OpenProjectClient, OpenProjectAPIError
-from models import ProjectCreateRequest, WorkPackageCreateRequest, WorkPackageRelationCreateRequest
+from models import ProjectCreateRequest, WorkPackageCreateRequest, WorkPackageBatchItem, WorkPackageRelationCreateRequest
 from pydantic import ValidationError
 from config import settings
 from handlers.resources import ResourceHandler
+from utils.graph import RELATION_TYPES, REVERSE_RELATION_TYPES
+from utils.schedule import compute_schedule
+from utils.filters import STATUS_SCOPE_OPERATORS, build_select, build_work_package_filters
+from utils.pagination import DEFAULT_PAGE_LIMIT, next_cursor, query_fingerprint, resolve_page
+from utils.records import WorkPackageRecord, normalize_work_package, normalize_work_packages
+from utils.serialization import dumps, set_compact_output
 from utils.logging import get_logger, log_tool_execution, log_error
 
 logger = get_logger(__name__)
@@ -18,10 +24,16 @@ import os
 os.environ['FASTMCP_QUIET'] = '1'  # Try to suppress FastMCP banner
 app = FastMCP("OpenProject MCP Server")
 
+# Indented JSON responses unless compact output is configured
+set_compact_output(settings.json_compact)
+
 # Initialize OpenProject client and resource handler
 openproject_client = OpenProjectClient()
 resource_handler = ResourceHandler(openproject_client)
 
+# Maximum number of items accepted by batch tools
+MAX_BATCH_SIZE = 200
+
 
 # Helper function for status resolution
 async def _resolve_status(status: Optional[Union[str, int]]) -> Optional[Dict[str, Any]]:
@@ -57,6 +69,59 @@ async def _resolve_status(status: Optional[Union[str, int]]) -> Optional[Dict[st
         return next((s for s in statuses if s.get("name", "").lower() == status_lower), None)
 
 
+# Helper function for project lookups
+async def _get_project_with(project_id: int, work_packages: Awaitable[Any]) -> Tuple[Optional[Dict[str, Any]], Any]:
+    """Fetch a project concurrently with its work packages.
+    
+    Returns (None, None) when the project does not exist, discarding the
+    work package request's error; any other error is raised.
+    """
+    project, result = await asyncio.gather(
+        openproject_client.get_project_by_id(project_id),
+        work_packages,
+        return_exceptions=True
+    )
+    if isinstance(project, BaseException):
+        raise project
+    if project is None:
+        return None, None
+    if isinstance(result, BaseException):
+        raise result
+    return project, result
+
+
+async def _summarize_work_packages(project_id: int, sample_size: int = 0) -> Tuple[Dict[str, Any], List[WorkPackageRecord]]:
+    """Aggregate a project's open work packages in one pass over the stream.
+    
+    Returns:
+        Tuple of summary counts and the first sample_size work packages
+    """
+    total_wp = 0
+    with_dates = 0
+    assigned = 0
+    status_counts = {}
+    sample = []
+    async for wp in openproject_client.iter_project_work_packages(project_id):
+        total_wp += 1
+        if wp.start_date or wp.due_date:
+            with_dates += 1
+        if wp.assignee_id is not None:
+            assigned += 1
+        status = wp.status or "Unknown"
+        status_counts[status] = status_counts.get(status, 0) + 1
+        if len(sample) < sample_size:
+            sample.append(wp)
+    
+    return {
+        "total_work_packages": total_wp,
+        "work_packages_with_dates": with_dates,
+        "assigned_work_packages": assigned,
+        "unassigned_work_packages": total_wp - assigned,
+        "status_breakdown": status_counts,
+        "gantt_ready": with_dates > 0
+    }, sample
+
+
 # Add health check tool for MCP
 @app.tool()
 async def health_check() -> str:
@@ -75,7 +140,13 @@ async def health_check() -> str:
                 "message": "OpenProject MCP Server is currently running",
                 "openproject_connection": "connected",
                 "openproject_version": connection_result.get('openproject_version', 'unknown'),
-                "openproject_url": settings.openproject_url
+                "openproject_url": settings.openproject_url,
+                "cache": openproject_client.get_cache_stats(),
+                "connection_pool": openproject_client.get_connection_stats(),
+                "rate_limit": openproject_client.get_rate_limit_stats(),
+                "circuit_breaker": openproject_client.get_circuit_breaker_state(),
+                "mirrors": openproject_client.get_mirror_stats(),
+                "work_package_store": openproject_client.work_package_store.stats()
             }
         else:
             result = {
@@ -83,11 +154,12 @@ async def health_check() -> str:
                 "message": "OpenProject MCP Server is running but OpenProject connection failed",
                 "openproject_connection": "failed",
                 "error": connection_result.get('message', 'Unknown connection error'),
-                "openproject_url": settings.openproject_url
+                "openproject_url": settings.openproject_url,
+                "circuit_breaker": openproject_client.get_circuit_breaker_state()
             }
         
-        log_tool_execution(logger, "health_check", {}, result)
-        return json.dumps(result, indent=2)
+        log_tool_execution(logger, "health_check", result["status"] == "healthy", status=result["status"])
+        return dumps(result, indent=2)
         
     except Exception as e:
         error_result = {
@@ -96,7 +168,7 @@ async def health_check() -> str:
             "error": str(e)
         }
         log_error(logger, e, {"tool": "health_check"})
-        return json.dumps(error_result, indent=2)
+        return dumps(error_result, indent=2)
 
 
 @app.tool()
@@ -113,7 +185,7 @@ async def create_project(name: str, description: str = "") -> str:
     try:
         # Validate input
         if not name or not name.strip():
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Project name is required and cannot be empty"
             })
@@ -127,7 +199,7 @@ async def create_project(name: str, description: str = "") -> str:
         # Call OpenProject API
         result = await openproject_client.create_project(project_request)
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Project '{name}' created successfully",
             "project": {
@@ -140,13 +212,13 @@ async def create_project(name: str, description: str = "") -> str:
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -181,26 +253,26 @@ async def create_work_package(
     try:
         # Validate input
         if not subject or not subject.strip():
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Work package subject is required and cannot be empty"
             })
         
         if project_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Project ID must be a positive integer"
             })
         
         # Validate date format if provided
         if start_date and not _is_valid_date_format(start_date):
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Start date must be in YYYY-MM-DD format"
             })
         
         if due_date and not _is_valid_date_format(due_date):
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Due date must be in YYYY-MM-DD format"
             })
@@ -220,7 +292,7 @@ async def create_work_package(
         # Call OpenProject API
         result = await openproject_client.create_work_package(wp_request)
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Work package '{subject}' created successfully",
             "work_package": {
@@ -236,19 +308,114 @@ async def create_work_package(
         }, indent=2)
         
     except ValidationError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": "Validation error",
             "details": [{"field": err["loc"][-1], "message": err["msg"]} for err in e.errors()]
         }, indent=2)
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
+
+
+@app.tool()
+async def create_work_packages_batch(work_packages: List[Dict[str, Any]]) -> str:
+    """Create many work packages in one call, e.g. a full project plan.
+    
+    All items are validated before anything is created. Items are created
+    concurrently; an item with parent_ref is created after the item whose
+    ref it names, and is linked to it as a child.
+    
+    Args:
+        work_packages: List of work packages (max 200). Each accepts the
+            create_work_package fields (project_id, subject, description,
+            start_date, due_date, parent_id, assignee_id, estimated_hours,
+            type_id, status_id, priority_id) plus optional "ref" (batch-local
+            name) and "parent_ref" (ref of the parent item in this batch)
+    
+    Returns:
+        JSON string with per-item creation results
+    """
+    try:
+        if not work_packages:
+            return dumps({
+                "success": False,
+                "error": "At least one work package is required"
+            })
+        
+        if len(work_packages) > MAX_BATCH_SIZE:
+            return dumps({
+                "success": False,
+                "error": f"A batch can contain at most {MAX_BATCH_SIZE} work packages"
+            })
+        
+        # Validate every item up front so nothing is created from an invalid batch
+        items = []
+        errors = []
+        for index, data in enumerate(work_packages):
+            try:
+                item = WorkPackageBatchItem(**data)
+            except ValidationError as e:
+                errors.extend(
+                    {"index": index, "field": err["loc"][-1], "message": err["msg"]} for err in e.errors()
+                )
+                continue
+            if not item.subject.strip():
+                errors.append({"index": index, "field": "subject", "message": "Subject cannot be empty"})
+            items.append(item)
+        
+        if errors:
+            return dumps({
+                "success": False,
+                "error": "Validation error",
+                "details": errors
+            }, indent=2)
+        
+        try:
+            results = await openproject_client.create_work_packages_batch(items)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": f"Invalid batch: {str(e)}"
+            })
+        
+        formatted = []
+        for result in results:
+            entry = {"index": result["index"], "ref": result["ref"], "success": result["success"]}
+            if result["success"]:
+                wp = result["work_package"]
+                parent_href = wp.get("_links", {}).get("parent", {}).get("href")
+                entry["work_package"] = {
+                    "id": wp.get("id"),
+                    "subject": wp.get("subject"),
+                    "parent_id": int(parent_href.split("/")[-1]) if parent_href else None,
+                    "start_date": wp.get("startDate"),
+                    "due_date": wp.get("dueDate"),
+                    "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                }
+            else:
+                entry["error"] = result["error"]
+            formatted.append(entry)
+        
+        created = sum(1 for r in formatted if r["success"])
+        return dumps({
+            "success": created == len(formatted),
+            "message": f"Created {created} of {len(formatted)} work packages",
+            "created": created,
+            "failed": len(formatted) - created,
+            "results": formatted
+        }, indent=2)
+        
+    except Exception as e:
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -305,26 +472,119 @@ async def create_work_package_dependency(
             "url": f"{settings.openproject_url}/relations/{result.get('id')}" if result.get('id') else None
         }
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Relation created: Work package {from_work_package_id} {relation_type} work package {to_work_package_id}",
             "relation": relation_data
         }, indent=2)
         
     except ValidationError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": "Validation error",
             "details": [{"field": err["loc"][-1], "message": err["msg"]} for err in e.errors()]
         }, indent=2)
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
+            "success": False,
+            "error": f"OpenProject API error: {e.message}",
+            "details": e.response_data
+        }, indent=2)
+    except Exception as e:
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
+
+
+@app.tool()
+async def create_work_package_dependencies_batch(relations: List[Dict[str, Any]]) -> str:
+    """Create many work package dependencies in one call, e.g. a Gantt import.
+    
+    All relations are validated and checked for dependency cycles before
+    anything is created. Relations that already exist (in either direction,
+    e.g. "A precedes B" vs "B follows A") or repeat within the batch are
+    skipped; the rest are created concurrently.
+    
+    Args:
+        relations: List of relations (max 200), each with from_work_package_id,
+            to_work_package_id and optional relation_type (default "follows"),
+            description and lag
+    
+    Returns:
+        JSON string with per-relation results
+    """
+    try:
+        if not relations:
+            return dumps({
+                "success": False,
+                "error": "At least one relation is required"
+            })
+        
+        if len(relations) > MAX_BATCH_SIZE:
+            return dumps({
+                "success": False,
+                "error": f"A batch can contain at most {MAX_BATCH_SIZE} relations"
+            })
+        
+        requests = []
+        errors = []
+        for index, data in enumerate(relations):
+            try:
+                requests.append(WorkPackageRelationCreateRequest(**data))
+            except ValidationError as e:
+                errors.extend(
+                    {"index": index, "field": err["loc"][-1], "message": err["msg"]} for err in e.errors()
+                )
+        
+        if errors:
+            return dumps({
+                "success": False,
+                "error": "Validation error",
+                "details": errors
+            }, indent=2)
+        
+        try:
+            results = await openproject_client.create_work_package_relations_bulk(requests)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        formatted = []
+        for result in results:
+            entry = {
+                "index": result["index"],
+                "from_id": result["from_id"],
+                "to_id": result["to_id"],
+                "relation_type": result["relation_type"],
+                "status": result["status"]
+            }
+            if result.get("relation"):
+                entry["relation_id"] = result["relation"].get("id")
+            if result.get("error"):
+                entry["error"] = result["error"]
+            formatted.append(entry)
+        
+        counts = {status: sum(1 for r in formatted if r["status"] == status)
+                  for status in ("created", "exists", "duplicate", "failed")}
+        return dumps({
+            "success": counts["failed"] == 0,
+            "message": f"Created {counts['created']} of {len(formatted)} relations "
+                       f"({counts['exists']} already existed, {counts['duplicate']} duplicates, {counts['failed']} failed)",
+            **counts,
+            "results": formatted
+        }, indent=2)
+        
+    except OpenProjectAPIError as e:
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -342,7 +602,7 @@ async def get_work_package_relations(work_package_id: int) -> str:
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Work package ID must be a positive integer"
             })
@@ -372,7 +632,7 @@ async def get_work_package_relations(work_package_id: int) -> str:
             }
             relation_list.append(relation_data)
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Found {len(relation_list)} relations for work package {work_package_id}",
             "work_package_id": work_package_id,
@@ -380,13 +640,13 @@ async def get_work_package_relations(work_package_id: int) -> str:
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -404,40 +664,332 @@ async def delete_work_package_relation(relation_id: int) -> str:
     """
     try:
         if relation_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Relation ID must be a positive integer"
             })
         
         await openproject_client.delete_work_package_relation(relation_id)
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Relation {relation_id} deleted successfully"
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
 
 
 @app.tool()
-async def get_projects() -> str:
+async def get_dependency_graph(
+    work_package_ids: Optional[List[int]] = None,
+    project_id: Optional[int] = None,
+    max_depth: int = 3,
+    relation_types: Optional[List[str]] = None
+) -> str:
+    """Get the dependency graph around work packages or of a whole project.
+    
+    With work_package_ids, relations are followed breadth-first up to
+    max_depth hops. With project_id, every relation touching the project's
+    work packages is loaded with a few paginated requests.
+    
+    Relations are returned in canonical direction: "A precedes B" is
+    reported as "B follows A", "blocked" as "blocks", etc.
+    
+    Args:
+        work_package_ids: Start work package IDs for traversal (optional)
+        project_id: Project ID to load the complete graph for (optional)
+        max_depth: Relation hops to follow from the start nodes (1-10, default: 3)
+        relation_types: Only follow these relation types, e.g. ["follows", "blocks"] (optional)
+    
+    Returns:
+        JSON string with nodes, edges and an adjacency list (from_id -> to_ids)
+    """
+    try:
+        if bool(work_package_ids) == bool(project_id):
+            return dumps({
+                "success": False,
+                "error": "Provide either work_package_ids or project_id"
+            })
+        
+        if work_package_ids and any(not isinstance(wp_id, int) or wp_id <= 0 for wp_id in work_package_ids):
+            return dumps({
+                "success": False,
+                "error": "Work package IDs must be positive integers"
+            })
+        
+        if project_id is not None and project_id <= 0:
+            return dumps({
+                "success": False,
+                "error": "Project ID must be a positive integer"
+            })
+        
+        if not 1 <= max_depth <= 10:
+            return dumps({
+                "success": False,
+                "error": "max_depth must be between 1 and 10"
+            })
+        
+        types = None
+        if relation_types:
+            types = {REVERSE_RELATION_TYPES.get(t.lower(), t.lower()) for t in relation_types}
+            unknown = types - RELATION_TYPES
+            if unknown:
+                return dumps({
+                    "success": False,
+                    "error": f"Unknown relation types: {', '.join(sorted(unknown))}"
+                })
+        
+        depths = {}
+        truncated = False
+        if project_id:
+            edges = {}
+            for relation in await openproject_client.get_project_relations(project_id):
+                key = OpenProjectClient.relation_key(relation)
+                if key and (not types or key[2] in types):
+                    edges[relation.get("id")] = key
+        else:
+            graph = await openproject_client.get_dependency_graph(
+                work_package_ids, max_depth=max_depth, relation_types=types
+            )
+            edges = graph["relations"]
+            depths = graph["depths"]
+            truncated = graph["truncated"]
+        
+        node_ids = list(depths) or list(dict.fromkeys(wp_id for key in edges.values() for wp_id in key[:2]))
+        work_packages = await openproject_client.get_work_packages_by_ids(node_ids) if node_ids else []
+        by_id = {wp.id: wp for wp in normalize_work_packages(work_packages)}
+        
+        nodes = []
+        for wp_id in node_ids:
+            wp = by_id.get(wp_id) or WorkPackageRecord()
+            node = {
+                "id": wp_id,
+                "subject": wp.subject,
+                "status": wp.status,
+                "start_date": wp.start_date,
+                "due_date": wp.due_date,
+                "visible": wp_id in by_id
+            }
+            if depths:
+                node["depth"] = depths[wp_id]
+            nodes.append(node)
+        
+        adjacency: Dict[str, List[int]] = {}
+        edge_list = []
+        for relation_id, (from_id, to_id, relation_type) in edges.items():
+            edge_list.append({"relation_id": relation_id, "from_id": from_id, "to_id": to_id, "type": relation_type})
+            adjacency.setdefault(str(from_id), []).append(to_id)
+        
+        return dumps({
+            "success": True,
+            "message": f"Dependency graph with {len(nodes)} work packages and {len(edge_list)} relations",
+            "nodes": nodes,
+            "edges": edge_list,
+            "adjacency": adjacency,
+            "truncated": truncated
+        }, indent=2)
+        
+    except OpenProjectAPIError as e:
+        return dumps({
+            "success": False,
+            "error": f"OpenProject API error: {e.message}",
+            "details": e.response_data
+        }, indent=2)
+    except Exception as e:
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
+
+
+@app.tool()
+async def compute_critical_path(project_id: int) -> str:
+    """Compute the critical path and schedule slack of a project.
+    
+    Loads the project's work packages and relations once and runs a
+    critical path analysis over the follows/precedes relations (with lag).
+    Durations come from start/due dates (inclusive, calendar days), falling
+    back to estimated hours (8h per day) or one day. Planned start dates act
+    as "start no earlier than" constraints; a task with only a due date is
+    planned to start duration - 1 days before it. Parent work packages are
+    left out because their dates are derived from their children.
+    
+    Args:
+        project_id: ID of the project to analyse
+    
+    Returns:
+        JSON string with the critical path, per-task earliest/latest dates
+        and slack, and date conflicts where a successor is planned to start
+        before its predecessor (plus lag) has finished
+    """
+    try:
+        from datetime import date, datetime, timedelta
+        
+        if project_id <= 0:
+            return dumps({
+                "success": False,
+                "error": "Project ID must be a positive integer"
+            })
+        
+        work_packages = normalize_work_packages(await openproject_client.get_all_project_work_packages(project_id))
+        relations = await openproject_client.get_relations_involving([wp.id for wp in work_packages])
+        
+        def parse(value: Optional[str]) -> Optional[date]:
+            return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+        
+        parent_ids = {wp.parent_id for wp in work_packages if wp.parent_id is not None}
+        tasks = [wp for wp in work_packages if wp.id not in parent_ids]
+        
+        if not tasks:
+            return dumps({
+                "success": True,
+                "message": "Project has no work packages to schedule",
+                "critical_path": [],
+                "tasks": [],
+                "conflicts": []
+            }, indent=2)
+        
+        index_of = {wp.id: i for i, wp in enumerate(tasks)}
+        starts = [parse(wp.start_date) for wp in tasks]
+        dues = [parse(wp.due_date) for wp in tasks]
+        
+        durations = []
+        for wp, start, due in zip(tasks, starts, dues):
+            if start and due:
+                durations.append(max((due - start).days + 1, 1))
+            else:
+                hours = wp.estimated_hours
+                durations.append(max(math.ceil(hours / 8), 1) if hours else 1)
+        
+        # Complete the planned dates of tasks that have only one of them
+        starts = [
+            start or (due - timedelta(days=duration - 1) if due else None)
+            for start, due, duration in zip(starts, dues, durations)
+        ]
+        dues = [
+            due or (start + timedelta(days=duration - 1) if start else None)
+            for start, due, duration in zip(starts, dues, durations)
+        ]
+        anchor = min((start for start in starts if start), default=date.today())
+        earliest_starts = [(start - anchor).days if start else 0 for start in starts]
+        
+        edges = []
+        for relation in relations:
+            key = OpenProjectClient.relation_key(relation)
+            if not key or key[2] != "follows":
+                continue
+            successor, predecessor = key[0], key[1]
+            if predecessor in index_of and successor in index_of:
+                edges.append((index_of[predecessor], index_of[successor], relation.get("lag") or 0))
+        
+        try:
+            schedule = compute_schedule(durations, edges, earliest_starts)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": f"Cannot compute critical path: {str(e)}"
+            })
+        
+        def day(offset: int) -> str:
+            return (anchor + timedelta(days=offset)).isoformat()
+        
+        task_list = []
+        for i, wp in enumerate(tasks):
+            task_list.append({
+                "id": wp.id,
+                "subject": wp.subject,
+                "duration_days": durations[i],
+                "earliest_start": day(schedule["es"][i]),
+                "earliest_finish": day(schedule["ef"][i] - 1),
+                "latest_start": day(schedule["ls"][i]),
+                "latest_finish": day(schedule["lf"][i] - 1),
+                "slack_days": schedule["slack"][i],
+                "critical": schedule["slack"][i] == 0
+            })
+        
+        conflicts = []
+        for predecessor, successor, lag in edges:
+            predecessor_finish = dues[predecessor]
+            successor_start = starts[successor]
+            if not predecessor_finish or not successor_start:
+                continue
+            required_start = predecessor_finish + timedelta(days=1 + lag)
+            if successor_start < required_start:
+                conflicts.append({
+                    "predecessor_id": tasks[predecessor].id,
+                    "successor_id": tasks[successor].id,
+                    "lag": lag,
+                    "predecessor_due_date": predecessor_finish.isoformat(),
+                    "successor_start_date": successor_start.isoformat(),
+                    "required_start_date": required_start.isoformat(),
+                    "days_early": (required_start - successor_start).days
+                })
+        
+        critical_path = [
+            {"id": task_list[i]["id"], "subject": task_list[i]["subject"],
+             "earliest_start": task_list[i]["earliest_start"], "earliest_finish": task_list[i]["earliest_finish"]}
+            for i in schedule["critical_path"]
+        ]
+        
+        return dumps({
+            "success": True,
+            "message": f"Critical path of {len(critical_path)} work packages; {len(conflicts)} date conflicts",
+            "project_start": anchor.isoformat(),
+            "project_finish": day(schedule["project_finish"] - 1),
+            "duration_days": schedule["project_finish"],
+            "critical_path": critical_path,
+            "tasks": task_list,
+            "conflicts": conflicts
+        }, indent=2)
+        
+    except OpenProjectAPIError as e:
+        return dumps({
+            "success": False,
+            "error": f"OpenProject API error: {e.message}",
+            "details": e.response_data
+        }, indent=2)
+    except Exception as e:
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
+
+
+@app.tool()
+async def get_projects(limit: Optional[int] = None, cursor: Optional[str] = None) -> str:
     """Get list of all projects from OpenProject.
     
+    Args:
+        limit: Maximum number of projects to return; the response then carries a next_cursor (optional)
+        cursor: next_cursor from a previous call, to fetch the following page (optional)
+    
     Returns:
         JSON string with list of projects
     """
     try:
-        projects = await openproject_client.get_projects()
+        fingerprint = query_fingerprint("projects")
+        try:
+            page = resolve_page(limit, cursor, fingerprint)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        if page is None:
+            projects = await openproject_client.get_projects()
+        else:
+            projects, total = await openproject_client.get_projects_page(*page)
         
         project_list = []
         for project in projects:
@@ -450,20 +1002,29 @@ async def get_projects() -> str:
                 "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
             })
         
-        return json.dumps({
+        if page is None:
+            return dumps({
+                "success": True,
+                "message": f"Found {len(project_list)} projects",
+                "projects": project_list
+            }, indent=2)
+        
+        return dumps({
             "success": True,
-            "message": f"Found {len(project_list)} projects",
-            "projects": project_list
+            "message": f"Found {total} projects, returning {len(project_list)}",
+            "projects": project_list,
+            "total": total,
+            "next_cursor": next_cursor(page[0], page[1], len(project_list), total, fingerprint)
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -483,7 +1044,7 @@ async def get_work_package(work_package_id: int) -> str:
         # T006: Input validation - work_package_id must be positive
         if work_package_id <= 0:
             log_tool_execution(logger, "get_work_package", False, work_package_id=work_package_id, error="Invalid ID")
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Work package ID must be a positive integer"
             })
@@ -492,50 +1053,15 @@ async def get_work_package(work_package_id: int) -> str:
         logger.info(f"Retrieving work package with ID: {work_package_id}")
 
         # Call OpenProject API
-        wp = await openproject_client.get_work_package_by_id(work_package_id)
-
-        # T007: Parse HAL+JSON response and extract all fields per data-model.md
-        # Extract project ID from href (e.g., "/api/v3/projects/5" -> 5)
-        project_href = wp.get("_links", {}).get("project", {}).get("href", "")
-        project_id = int(project_href.split("/")[-1]) if project_href else None
-
-        # Parse ISO duration for estimated hours (e.g., "PT16H" -> 16.0)
-        estimated_time = wp.get("estimatedTime")
-        estimated_hours = None
-        if estimated_time:
-            estimated_hours = _parse_iso_duration(estimated_time)
-
-        # Extract description from raw format
-        description_obj = wp.get("description", {})
-        description = description_obj.get("raw", "") if isinstance(description_obj, dict) else ""
-
-        # Build response with all fields from data-model.md
-        work_package_data = {
-            "id": wp.get("id"),
-            "subject": wp.get("subject"),
-            "description": description,
-            "status": wp.get("_links", {}).get("status", {}).get("title"),
-            "type": wp.get("_links", {}).get("type", {}).get("title"),
-            "priority": wp.get("_links", {}).get("priority", {}).get("title"),
-            "assignee": wp.get("_links", {}).get("assignee", {}).get("title"),
-            "responsible": wp.get("_links", {}).get("responsible", {}).get("title"),
-            "project_id": project_id,
-            "project_name": wp.get("_links", {}).get("project", {}).get("title"),
-            "start_date": wp.get("startDate"),
-            "due_date": wp.get("dueDate"),
-            "estimated_hours": estimated_hours,
-            "done_ratio": wp.get("percentageDone", 0),
-            "created_at": wp.get("createdAt"),
-            "updated_at": wp.get("updatedAt")
-        }
+        wp = normalize_work_package(await openproject_client.get_work_package_by_id(work_package_id))
 
         result = {
             "success": True,
-            "work_package": work_package_data
+            "work_package": _format_work_package_details(wp)
         }
 
         log_tool_execution(logger, "get_work_package", True, work_package_id=work_package_id)
-        return json.dumps(result, indent=2)
+        return dumps(result, indent=2)
 
     except OpenProjectAPIError as e:
         # T011, T012: Handle specific error codes
@@ -547,7 +1073,7 @@ async def get_work_package(work_package_id: int) -> str:
             error_msg = "Permission denied: You do not have access to view this work package"
 
         log_error(logger, e, {"tool": "get_work_package", "work_package_id": work_package_id})
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": error_msg
         }, indent=2)
@@ -559,93 +1085,306 @@ async def get_work_package(work_package_id: int) -> str:
         # Check if it's a connection error
         error_str = str(e).lower()
         if "connect" in error_str or "timeout" in error_str or "network" in error_str:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Failed to connect to OpenProject. Please check your connection and try again."
             }, indent=2)
 
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
 
 
-def _parse_iso_duration(duration: str) -> float:
-    """Parse ISO 8601 duration string to hours.
+@app.tool()
+async def get_work_packages_by_ids(work_package_ids: List[int]) -> str:
+    """Get all details of several work packages in one call.
+
+    Uses a single filtered collection request (split into chunks for long
+    ID lists) instead of one request per work package.
 
-    Examples:
-        PT16H -> 16.0
-        PT1H30M -> 1.5
-        PT30M -> 0.5
+    Args:
+        work_package_ids: IDs of the work packages to retrieve (max 200)
+
+    Returns:
+        JSON string with work package details in the requested order, plus
+        the IDs that were not found or are not visible
     """
-    if not duration or not duration.startswith("PT"):
-        return None
+    try:
+        if not work_package_ids:
+            return dumps({
+                "success": False,
+                "error": "At least one work package ID is required"
+            })
+
+        if any(not isinstance(wp_id, int) or wp_id <= 0 for wp_id in work_package_ids):
+            return dumps({
+                "success": False,
+                "error": "Work package IDs must be positive integers"
+            })
+
+        ids = list(dict.fromkeys(work_package_ids))
+        if len(ids) > MAX_BATCH_SIZE:
+            return dumps({
+                "success": False,
+                "error": f"At most {MAX_BATCH_SIZE} work packages can be requested at once"
+            })
+
+        work_packages = normalize_work_packages(await openproject_client.get_work_packages_by_ids(ids))
+        by_id = {wp.id: wp for wp in work_packages}
+        missing_ids = [wp_id for wp_id in ids if wp_id not in by_id]
+
+        result = {
+            "success": True,
+            "message": f"Found {len(ids) - len(missing_ids)} of {len(ids)} work packages",
+            "work_packages": [_format_work_package_details(by_id[wp_id]) for wp_id in ids if wp_id in by_id],
+            "missing_ids": missing_ids
+        }
 
-    hours = 0.0
-    remaining = duration[2:]  # Remove "PT" prefix
+        log_tool_execution(logger, "get_work_packages_by_ids", True, requested=len(ids), missing=len(missing_ids))
+        return dumps(result, indent=2)
 
-    # Extract hours
-    if "H" in remaining:
-        h_idx = remaining.index("H")
-        hours += float(remaining[:h_idx])
-        remaining = remaining[h_idx + 1:]
+    except OpenProjectAPIError as e:
+        log_error(logger, e, {"tool": "get_work_packages_by_ids"})
+        return dumps({
+            "success": False,
+            "error": f"OpenProject API error: {e.message}",
+            "details": e.response_data
+        }, indent=2)
+    except Exception as e:
+        log_error(logger, e, {"tool": "get_work_packages_by_ids"})
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
 
-    # Extract minutes and convert to hours
-    if "M" in remaining:
-        m_idx = remaining.index("M")
-        minutes = float(remaining[:m_idx])
-        hours += minutes / 60.0
 
-    return hours
+def _format_work_package_details(wp: WorkPackageRecord) -> Dict[str, Any]:
+    """Extract the detailed work package fields from a work package record."""
+    return {
+        "id": wp.id,
+        "subject": wp.subject,
+        "description": wp.description,
+        "status": wp.status,
+        "type": wp.type,
+        "priority": wp.priority,
+        "assignee": wp.assignee,
+        "responsible": wp.responsible,
+        "project_id": wp.project_id,
+        "project_name": wp.project,
+        "start_date": wp.start_date,
+        "due_date": wp.due_date,
+        "estimated_hours": wp.estimated_hours,
+        "done_ratio": wp.done_ratio or 0,
+        "created_at": wp.created_at,
+        "updated_at": wp.updated_at
+    }
 
 
 @app.tool()
-async def get_work_packages(project_id: int) -> str:
+async def get_work_packages(
+    project_id: int,
+    status: Optional[Union[str, int]] = None,
+    assignee: Optional[Union[str, int]] = None,
+    type_id: Optional[int] = None,
+    start_date_from: Optional[str] = None,
+    start_date_to: Optional[str] = None,
+    due_date_from: Optional[str] = None,
+    due_date_to: Optional[str] = None,
+    updated_since: Optional[str] = None,
+    fields: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    fetch_all: bool = False
+) -> str:
     """Get work packages for a specific project.
     
+    All filters are applied server-side by OpenProject, so only matching
+    work packages are transferred. Only one page is fetched (the first
+    100 work packages unless limit or cursor say otherwise); set fetch_all
+    to get every match in one response.
+    
     Args:
         project_id: ID of the project to get work packages from
+        status: Status name or ID, "open"/"closed" for any open/closed status, or "all" (optional;
+            only open work packages are returned by default, also when other filters are given)
+        assignee: Assignee user ID, or "me" for the API user (optional)
+        type_id: Work package type ID (optional)
+        start_date_from: Earliest start date in YYYY-MM-DD format (optional)
+        start_date_to: Latest start date in YYYY-MM-DD format (optional)
+        due_date_from: Earliest due date in YYYY-MM-DD format (optional)
+        due_date_to: Latest due date in YYYY-MM-DD format (optional)
+        updated_since: Only work packages updated since this date or ISO 8601 timestamp (optional)
+        fields: Only return these fields, e.g. ["subject", "status", "due_date"] (optional)
+        limit: Maximum number of work packages to return, default 100; the response carries a next_cursor (optional)
+        cursor: next_cursor from a previous call with the same filters, to fetch the following page (optional)
+        fetch_all: Return every matching work package instead of one page (optional, default false)
     
     Returns:
         JSON string with list of work packages
     """
     try:
         if project_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Project ID must be a positive integer"
             })
         
-        work_packages = await openproject_client.get_work_packages(project_id)
+        for field_name, value in (
+            ("start_date_from", start_date_from),
+            ("start_date_to", start_date_to),
+            ("due_date_from", due_date_from),
+            ("due_date_to", due_date_to),
+        ):
+            if value and not _is_valid_date_format(value):
+                return dumps({
+                    "success": False,
+                    "error": f"{field_name} must be in YYYY-MM-DD format"
+                })
+        
+        if updated_since and not _is_valid_timestamp(updated_since):
+            return dumps({
+                "success": False,
+                "error": "updated_since must be a YYYY-MM-DD date or an ISO 8601 timestamp"
+            })
+        
+        try:
+            # Reject unknown field names before anything is sent
+            build_select(fields or [])
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        # Resolve status to an ID, or to an open/closed/all scope
+        status_ids = None
+        status_scope = None
+        all_statuses = False
+        if status is not None and status != "":
+            if isinstance(status, str) and status.strip().lower() == "all":
+                all_statuses = True
+            elif isinstance(status, str) and status.strip().lower() in STATUS_SCOPE_OPERATORS:
+                status_scope = status.strip().lower()
+            else:
+                resolved_status = await _resolve_status(status)
+                if not resolved_status:
+                    statuses = await openproject_client.get_work_package_statuses()
+                    available_names = [s.get("name") for s in statuses]
+                    return dumps({
+                        "success": False,
+                        "error": f"Invalid status '{status}'. Available statuses: {', '.join(available_names)}"
+                    })
+                status_ids = [resolved_status["id"]]
+        
+        assignee_ids = None
+        if assignee is not None and assignee != "":
+            if isinstance(assignee, str) and assignee.strip().lower() != "me":
+                return dumps({
+                    "success": False,
+                    "error": "Assignee must be a user ID or 'me'"
+                })
+            assignee_ids = [assignee.strip().lower() if isinstance(assignee, str) else assignee]
+        
+        # OpenProject applies its default "open statuses only" filter only when
+        # no filters are sent, so keep it explicit next to any other filter
+        other_criteria = (assignee_ids, type_id, start_date_from, start_date_to, due_date_from, due_date_to, updated_since)
+        if not status_ids and not status_scope and not all_statuses and any(other_criteria):
+            status_scope = "open"
+        
+        filters = build_work_package_filters(
+            status_ids=status_ids,
+            status_scope=status_scope,
+            assignee_ids=assignee_ids,
+            type_ids=[type_id] if type_id else None,
+            start_date_from=start_date_from,
+            start_date_to=start_date_to,
+            due_date_from=due_date_from,
+            due_date_to=due_date_to,
+            updated_since=updated_since
+        )
+        # An explicit empty filter list replaces the default "open only" filter
+        if not filters and not all_statuses:
+            filters = None
+        
+        if fetch_all and (limit is not None or cursor):
+            return dumps({
+                "success": False,
+                "error": "fetch_all cannot be combined with limit or cursor"
+            })
+        if not fetch_all and limit is None and not cursor:
+            limit = DEFAULT_PAGE_LIMIT
+        
+        fingerprint = query_fingerprint("work_packages", project_id, filters, fields)
+        try:
+            page = resolve_page(limit, cursor, fingerprint)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        if page is None:
+            work_packages = normalize_work_packages(await openproject_client.get_work_packages(
+                project_id,
+                use_pagination=True,
+                filters=filters,
+                select=fields or None
+            ))
+        else:
+            elements, total = await openproject_client.get_work_packages_page(
+                project_id,
+                *page,
+                filters=filters,
+                select=fields or None
+            )
+            work_packages = normalize_work_packages(elements)
         
         wp_list = []
         for wp in work_packages:
+            if fields:
+                # Record attributes are named after the tool-level fields
+                wp_data = {"id": wp.id}
+                for field in fields:
+                    wp_data[field] = getattr(wp, field)
+                wp_data["url"] = f"{settings.openproject_url}/work_packages/{wp.id}"
+                wp_list.append(wp_data)
+                continue
             wp_list.append({
-                "id": wp.get("id"),
-                "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", ""),
+                "id": wp.id,
+                "subject": wp.subject,
+                "description": wp.description,
                 "project_id": project_id,
-                "start_date": wp.get("startDate"),
-                "due_date": wp.get("dueDate"),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                "start_date": wp.start_date,
+                "due_date": wp.due_date,
+                "status": wp.status or "Unknown",
+                "assignee": wp.assignee or "Unassigned",
+                "url": f"{settings.openproject_url}/work_packages/{wp.id}"
             })
         
-        return json.dumps({
+        if page is None:
+            return dumps({
+                "success": True,
+                "message": f"Found {len(wp_list)} work packages in project {project_id}",
+                "work_packages": wp_list
+            }, indent=2)
+        
+        return dumps({
             "success": True,
-            "message": f"Found {len(wp_list)} work packages in project {project_id}",
-            "work_packages": wp_list
+            "message": f"Found {total} work packages in project {project_id}, returning {len(wp_list)}",
+            "work_packages": wp_list,
+            "total": total,
+            "next_cursor": next_cursor(page[0], page[1], len(wp_list), total, fingerprint)
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -679,62 +1418,24 @@ async def update_work_package(
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Work package ID must be a positive integer"
             })
         
-        # Build update payload with only provided fields
-        updates = {}
-        
-        if subject:
-            updates["subject"] = subject.strip()
-        
-        if description is not None:
-            updates["description"] = {"raw": description.strip()}
-        
-        if start_date:
-            if not _is_valid_date_format(start_date):
-                return json.dumps({
-                    "success": False,
-                    "error": "Start date must be in YYYY-MM-DD format"
-                })
-            updates["startDate"] = start_date
-        
-        if due_date:
-            if not _is_valid_date_format(due_date):
-                return json.dumps({
-                    "success": False,
-                    "error": "Due date must be in YYYY-MM-DD format"
-                })
-            updates["dueDate"] = due_date
-        
-        if assignee_id:
-            updates["_links"] = updates.get("_links", {})
-            updates["_links"]["assignee"] = {"href": f"/api/v3/users/{assignee_id}"}
-        
-        if estimated_hours:
-            updates["estimatedTime"] = f"PT{estimated_hours}H"
-
-        # Handle status update
-        if status is not None and status != "":
-            resolved_status = await _resolve_status(status)
-            if resolved_status:
-                updates["_links"] = updates.get("_links", {})
-                updates["_links"]["status"] = {"href": f"/api/v3/statuses/{resolved_status['id']}"}
-            else:
-                # Invalid status - return error with available statuses
-                statuses = await openproject_client.get_work_package_statuses()
-                available_names = [s.get("name") for s in statuses]
-                return json.dumps({
-                    "success": False,
-                    "error": f"Invalid status '{status}'. Available statuses: {', '.join(available_names)}"
-                })
-
-        if not updates:
-            return json.dumps({
+        updates, error = await _build_work_package_updates(
+            subject=subject,
+            description=description,
+            start_date=start_date,
+            due_date=due_date,
+            assignee_id=assignee_id,
+            estimated_hours=estimated_hours,
+            status=status
+        )
+        if error:
+            return dumps({
                 "success": False,
-                "error": "No updates provided. Specify at least one field to update."
+                "error": error
             })
         
         result = await openproject_client.update_work_package(work_package_id, updates)
@@ -753,7 +1454,7 @@ async def update_work_package(
             except (ValueError, IndexError):
                 pass
 
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Work package {work_package_id} updated successfully",
             "work_package": {
@@ -769,24 +1470,134 @@ async def update_work_package(
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
+            "success": False,
+            "error": f"OpenProject API error: {e.message}",
+            "details": e.response_data
+        }, indent=2)
+    except Exception as e:
+        return dumps({
+            "success": False,
+            "error": f"Unexpected error: {str(e)}"
+        }, indent=2)
+
+
+# Fields accepted per item by bulk_update_work_packages
+BULK_UPDATE_FIELDS = {"subject", "description", "start_date", "due_date", "assignee_id", "estimated_hours", "status"}
+
+
+@app.tool()
+async def bulk_update_work_packages(updates: List[Dict[str, Any]]) -> str:
+    """Update many work packages in one call, e.g. sprint-end status transitions.
+    
+    Current lockVersions are fetched for all targets in one request and the
+    updates are applied concurrently. Updates rejected with 409 Conflict are
+    retried with a fresh lockVersion.
+    
+    Args:
+        updates: List of updates (max 200), each with "work_package_id" and any
+            update_work_package fields (subject, description, start_date,
+            due_date, assignee_id, estimated_hours, status)
+    
+    Returns:
+        JSON string with per-item update results
+    """
+    try:
+        if not updates:
+            return dumps({
+                "success": False,
+                "error": "At least one update is required"
+            })
+        
+        if len(updates) > MAX_BATCH_SIZE:
+            return dumps({
+                "success": False,
+                "error": f"A batch can contain at most {MAX_BATCH_SIZE} updates"
+            })
+        
+        # Validate every item before anything is changed
+        payloads = {}
+        errors = []
+        for index, item in enumerate(updates):
+            wp_id = item.get("work_package_id")
+            if not isinstance(wp_id, int) or wp_id <= 0:
+                errors.append({"index": index, "error": "work_package_id must be a positive integer"})
+                continue
+            if wp_id in payloads:
+                errors.append({"index": index, "error": f"Work package {wp_id} appears more than once"})
+                continue
+            unknown = set(item) - BULK_UPDATE_FIELDS - {"work_package_id"}
+            if unknown:
+                errors.append({"index": index, "error": f"Unknown fields: {', '.join(sorted(unknown))}"})
+                continue
+            payload, error = await _build_work_package_updates(**{k: v for k, v in item.items() if k != "work_package_id"})
+            if error:
+                errors.append({"index": index, "error": error})
+                continue
+            payloads[wp_id] = payload
+        
+        if errors:
+            return dumps({
+                "success": False,
+                "error": "Validation error",
+                "details": errors
+            }, indent=2)
+        
+        results = await openproject_client.bulk_update_work_packages(payloads)
+        
+        formatted = []
+        for result in results:
+            entry = {
+                "work_package_id": result["work_package_id"],
+                "success": result["success"],
+                "attempts": result["attempts"]
+            }
+            if result["success"]:
+                wp = normalize_work_package(result["work_package"])
+                entry["work_package"] = {
+                    "subject": wp.subject,
+                    "status": wp.status or "Unknown",
+                    "lock_version": wp.lock_version,
+                    "url": f"{settings.openproject_url}/work_packages/{wp.id}"
+                }
+            else:
+                entry["error"] = result.get("error")
+            formatted.append(entry)
+        
+        updated = sum(1 for r in formatted if r["success"])
+        return dumps({
+            "success": updated == len(formatted),
+            "message": f"Updated {updated} of {len(formatted)} work packages",
+            "updated": updated,
+            "failed": len(formatted) - updated,
+            "results": formatted
+        }, indent=2)
+        
+    except OpenProjectAPIError as e:
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
 
 
 @app.tool()
-async def get_users(email_filter: Optional[str] = None) -> str:
+async def get_users(
+    email_filter: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
     """Get list of users, optionally filtered by email.
     
     Args:
         email_filter: Optional email address to search for specific user
+        limit: Maximum number of users to return; the response then carries a next_cursor (optional)
+        cursor: next_cursor from a previous call with the same email_filter, to fetch the following page (optional)
     
     Returns:
         JSON string with list of users
@@ -797,7 +1608,19 @@ async def get_users(email_filter: Optional[str] = None) -> str:
             # OpenProject API filter format for email search
             filters = {"filters": f'[{{"email": {{"operator": "=", "values": ["{email_filter}"]}}}}]'}
         
-        users = await openproject_client.get_users(filters)
+        fingerprint = query_fingerprint("users", filters)
+        try:
+            page = resolve_page(limit, cursor, fingerprint)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        if page is None:
+            users = await openproject_client.get_users(filters)
+        else:
+            users, total = await openproject_client.get_users_page(*page, filters=filters)
         
         user_list = []
         for user in users:
@@ -815,20 +1638,30 @@ async def get_users(email_filter: Optional[str] = None) -> str:
                 "updated_at": user.get("updatedAt", "")
             })
         
-        return json.dumps({
+        matching = f" matching email '{email_filter}'" if email_filter else ""
+        if page is None:
+            return dumps({
+                "success": True,
+                "message": f"Found {len(user_list)} users{matching}",
+                "users": user_list
+            }, indent=2)
+        
+        return dumps({
             "success": True,
-            "message": f"Found {len(user_list)} users" + (f" matching email '{email_filter}'" if email_filter else ""),
-            "users": user_list
+            "message": f"Found {total} users{matching}, returning {len(user_list)}",
+            "users": user_list,
+            "total": total,
+            "next_cursor": next_cursor(page[0], page[1], len(user_list), total, fingerprint)
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -847,13 +1680,13 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
     """
     try:
         if work_package_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Work package ID must be a positive integer"
             })
         
         if not assignee_email or "@" not in assignee_email:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Valid email address is required"
             })
@@ -861,7 +1694,7 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
         # Find user by email
         user = await openproject_client.get_user_by_email(assignee_email)
         if not user:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": f"User with email '{assignee_email}' not found"
             })
@@ -877,7 +1710,7 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
         
         result = await openproject_client.update_work_package(work_package_id, updates)
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Work package {work_package_id} assigned to {user.get('name', assignee_email)}",
             "work_package": {
@@ -893,36 +1726,54 @@ async def assign_work_package_by_email(work_package_id: int, assignee_email: str
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
 
 
 @app.tool()
-async def get_project_members(project_id: int) -> str:
+async def get_project_members(
+    project_id: int,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
     """Get list of project members with roles.
     
     Args:
         project_id: ID of the project to get members from
+        limit: Maximum number of members to return; the response then carries a next_cursor (optional)
+        cursor: next_cursor from a previous call for the same project, to fetch the following page (optional)
     
     Returns:
         JSON string with list of project members
     """
     try:
         if project_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Project ID must be a positive integer"
             })
         
-        memberships = await openproject_client.get_project_memberships(project_id)
+        fingerprint = query_fingerprint("members", project_id)
+        try:
+            page = resolve_page(limit, cursor, fingerprint)
+        except ValueError as e:
+            return dumps({
+                "success": False,
+                "error": str(e)
+            })
+        
+        if page is None:
+            memberships = await openproject_client.get_project_memberships(project_id)
+        else:
+            memberships, total = await openproject_client.get_project_memberships_page(project_id, *page)
         
         member_list = []
         for membership in memberships:
@@ -952,21 +1803,31 @@ async def get_project_members(project_id: int) -> str:
             }
             member_list.append(member_data)
         
-        return json.dumps({
+        if page is None:
+            return dumps({
+                "success": True,
+                "message": f"Found {len(member_list)} members in project {project_id}",
+                "project_id": project_id,
+                "members": member_list
+            }, indent=2)
+        
+        return dumps({
             "success": True,
-            "message": f"Found {len(member_list)} members in project {project_id}",
+            "message": f"Found {total} members in project {project_id}, returning {len(member_list)}",
             "project_id": project_id,
-            "members": member_list
+            "members": member_list,
+            "total": total,
+            "next_cursor": next_cursor(page[0], page[1], len(member_list), total, fingerprint)
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -993,20 +1854,20 @@ async def get_work_package_types() -> str:
                 "is_milestone": wp_type.get("isMilestone", False)
             })
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Found {len(type_list)} work package types",
             "types": type_list
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -1034,20 +1895,20 @@ async def get_work_package_statuses() -> str:
                 "is_readonly": status.get("isReadonly", False)
             })
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Found {len(status_list)} work package statuses",
             "statuses": status_list
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -1074,20 +1935,20 @@ async def get_priorities() -> str:
                 "is_active": priority.get("isActive", True)
             })
         
-        return json.dumps({
+        return dumps({
             "success": True,
             "message": f"Found {len(priority_list)} priorities",
             "priorities": priority_list
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
@@ -1105,34 +1966,22 @@ async def get_project_summary(project_id: int) -> str:
     """
     try:
         if project_id <= 0:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": "Project ID must be a positive integer"
             })
         
-        # Get project details and work packages in parallel
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Get project details and aggregate its work packages in parallel
+        project, result = await _get_project_with(project_id, _summarize_work_packages(project_id))
         
         if not project:
-            return json.dumps({
+            return dumps({
                 "success": False,
                 "error": f"Project with ID {project_id} not found"
             })
         
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        # Analyze work packages
-        total_wp = len(work_packages)
-        with_dates = sum(1 for wp in work_packages if wp.get("startDate") or wp.get("dueDate"))
-        assigned = sum(1 for wp in work_packages if wp.get("_links", {}).get("assignee"))
-        
-        status_counts = {}
-        for wp in work_packages:
-            status = wp.get("_links", {}).get("status", {}).get("title", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
-        return json.dumps({
+        summary, _ = result
+        return dumps({
             "success": True,
             "project": {
                 "id": project.get("id"),
@@ -1141,29 +1990,79 @@ async def get_project_summary(project_id: int) -> str:
                 "status": project.get("status"),
                 "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
             },
-            "summary": {
-                "total_work_packages": total_wp,
-                "work_packages_with_dates": with_dates,
-                "assigned_work_packages": assigned,
-                "unassigned_work_packages": total_wp - assigned,
-                "status_breakdown": status_counts,
-                "gantt_ready": with_dates > 0
-            }
+            "summary": summary
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
     except Exception as e:
-        return json.dumps({
+        return dumps({
             "success": False,
             "error": f"Unexpected error: {str(e)}"
         }, indent=2)
 
 
+async def _build_work_package_updates(
+    subject: Optional[str] = None,
+    description: Optional[str] = None,
+    start_date: Optional[str] = None,
+    due_date: Optional[str] = None,
+    assignee_id: Optional[int] = None,
+    estimated_hours: Optional[float] = None,
+    status: Optional[Union[str, int]] = None
+) -> Tuple[Dict[str, Any], Optional[str]]:
+    """Build a work package PATCH payload from tool arguments.
+    
+    Returns:
+        Tuple of (payload with only the provided fields, error message or None)
+    """
+    updates = {}
+    
+    if subject:
+        updates["subject"] = subject.strip()
+    
+    if description is not None:
+        updates["description"] = {"raw": description.strip()}
+    
+    if start_date:
+        if not _is_valid_date_format(start_date):
+            return {}, "Start date must be in YYYY-MM-DD format"
+        updates["startDate"] = start_date
+    
+    if due_date:
+        if not _is_valid_date_format(due_date):
+            return {}, "Due date must be in YYYY-MM-DD format"
+        updates["dueDate"] = due_date
+    
+    if assignee_id:
+        updates["_links"] = updates.get("_links", {})
+        updates["_links"]["assignee"] = {"href": f"/api/v3/users/{assignee_id}"}
+    
+    if estimated_hours:
+        updates["estimatedTime"] = f"PT{estimated_hours}H"
+
+    # Handle status update
+    if status is not None and status != "":
+        resolved_status = await _resolve_status(status)
+        if resolved_status:
+            updates["_links"] = updates.get("_links", {})
+            updates["_links"]["status"] = {"href": f"/api/v3/statuses/{resolved_status['id']}"}
+        else:
+            # Invalid status - report the available statuses
+            statuses = await openproject_client.get_work_package_statuses()
+            available_names = [s.get("name") for s in statuses]
+            return {}, f"Invalid status '{status}'. Available statuses: {', '.join(available_names)}"
+
+    if not updates:
+        return {}, "No updates provided. Specify at least one field to update."
+    
+    return updates, None
+
+
 def _is_valid_date_format(date_string: str) -> bool:
     """Validate date string is in YYYY-MM-DD format."""
     try:
@@ -1174,6 +2073,16 @@ def _is_valid_date_format(date_string: str) -> bool:
         return False
 
 
+def _is_valid_timestamp(timestamp: str) -> bool:
+    """Validate string is a YYYY-MM-DD date or an ISO 8601 timestamp."""
+    try:
+        from datetime import datetime
+        datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return True
+    except ValueError:
+        return False
+
+
 # Add resource handlers
 @app.resource("openproject://projects")
 async def projects_resource() -> str:
@@ -1192,14 +2101,14 @@ async def projects_resource() -> str:
                 "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
             })
         
-        return json.dumps({
+        return dumps({
             "projects": formatted_projects,
             "total": len(formatted_projects),
             "retrieved_at": "now"
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
@@ -1209,18 +2118,17 @@ async def projects_resource() -> str:
 async def project_resource(project_id: int) -> str:
     """Get details for a specific project."""
     try:
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Count from the mirror (every open work package), not the first API page
+        project, work_packages = await _get_project_with(
+            project_id, openproject_client.get_mirrored_work_packages(project_id)
+        )
         
         if not project:
-            return json.dumps({
+            return dumps({
                 "error": f"Project with ID {project_id} not found"
             }, indent=2)
         
-        # Get work packages for this project
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        return json.dumps({
+        return dumps({
             "project": {
                 "id": project.get("id"),
                 "name": project.get("name"),
@@ -1234,7 +2142,7 @@ async def project_resource(project_id: int) -> str:
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
@@ -1244,25 +2152,25 @@ async def project_resource(project_id: int) -> str:
 async def work_packages_resource(project_id: int) -> str:
     """Get work packages for a specific project."""
     try:
-        work_packages = await openproject_client.get_work_packages(project_id)
+        work_packages = normalize_work_packages(await openproject_client.get_work_packages(project_id))
         
         formatted_wps = []
         for wp in work_packages:
             formatted_wps.append({
-                "id": wp.get("id"),
-                "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", ""),
+                "id": wp.id,
+                "subject": wp.subject,
+                "description": wp.description,
                 "project_id": project_id,
-                "start_date": wp.get("startDate"),
-                "due_date": wp.get("dueDate"),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "url": f"{settings.openproject_url}/work_packages/{wp.get('id')}"
+                "start_date": wp.start_date,
+                "due_date": wp.due_date,
+                "status": wp.status or "Unknown",
+                "type": wp.type or "Unknown",
+                "priority": wp.priority or "Unknown",
+                "assignee": wp.assignee or "Unassigned",
+                "url": f"{settings.openproject_url}/work_packages/{wp.id}"
             })
         
-        return json.dumps({
+        return dumps({
             "work_packages": formatted_wps,
             "project_id": project_id,
             "total": len(formatted_wps),
@@ -1270,7 +2178,7 @@ async def work_packages_resource(project_id: int) -> str:
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
@@ -1280,29 +2188,29 @@ async def work_packages_resource(project_id: int) -> str:
 async def work_package_resource(work_package_id: int) -> str:
     """Get details for a specific work package."""
     try:
-        work_package = await openproject_client.get_work_package_by_id(work_package_id)
+        work_package = normalize_work_package(await openproject_client.get_work_package_by_id(work_package_id))
         
-        return json.dumps({
+        return dumps({
             "work_package": {
-                "id": work_package.get("id"),
-                "subject": work_package.get("subject"),
-                "description": work_package.get("description", {}).get("raw", ""),
-                "project": work_package.get("_links", {}).get("project", {}).get("title", "Unknown"),
-                "start_date": work_package.get("startDate"),
-                "due_date": work_package.get("dueDate"),
-                "status": work_package.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": work_package.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": work_package.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": work_package.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "estimated_time": work_package.get("estimatedTime"),
-                "done_ratio": work_package.get("doneRatio", 0),
-                "url": f"{settings.openproject_url}/work_packages/{work_package.get('id')}"
+                "id": work_package.id,
+                "subject": work_package.subject,
+                "description": work_package.description,
+                "project": work_package.project or "Unknown",
+                "start_date": work_package.start_date,
+                "due_date": work_package.due_date,
+                "status": work_package.status or "Unknown",
+                "type": work_package.type or "Unknown",
+                "priority": work_package.priority or "Unknown",
+                "assignee": work_package.assignee or "Unassigned",
+                "estimated_time": work_package.estimated_time,
+                "done_ratio": work_package.done_ratio or 0,
+                "url": f"{settings.openproject_url}/work_packages/{work_package.id}"
             },
             "retrieved_at": "now"
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
@@ -1337,7 +2245,7 @@ async def work_package_relations_resource(work_package_id: int) -> str:
             }
             formatted_relations.append(relation_data)
         
-        return json.dumps({
+        return dumps({
             "work_package_id": work_package_id,
             "relations": formatted_relations,
             "total": len(formatted_relations),
@@ -1345,7 +2253,7 @@ async def work_package_relations_resource(work_package_id: int) -> str:
         }, indent=2)
         
     except OpenProjectAPIError as e:
-        return json.dumps({
+        return dumps({
             "error": f"OpenProject API error: {e.message}",
             "details": e.response_data
         }, indent=2)
@@ -1363,9 +2271,8 @@ async def project_status_report(project_id: int) -> list:
         List of message objects for LLM consumption
     """
     try:
-        # Get project details and work packages
-        projects = await openproject_client.get_projects()
-        project = next((p for p in projects if p.get("id") == project_id), None)
+        # Get project details and aggregate its work packages in parallel
+        project, result = await _get_project_with(project_id, _summarize_work_packages(project_id, sample_size=10))
         
         if not project:
             return [
@@ -1375,18 +2282,7 @@ async def project_status_report(project_id: int) -> list:
                 }
             ]
         
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        # Analyze project status
-        total_wp = len(work_packages)
-        with_dates = sum(1 for wp in work_packages if wp.get("startDate") or wp.get("dueDate"))
-        assigned = sum(1 for wp in work_packages if wp.get("_links", {}).get("assignee"))
-        
-        status_counts = {}
-        for wp in work_packages:
-            status = wp.get("_links", {}).get("status", {}).get("title", "Unknown")
-            status_counts[status] = status_counts.get(status, 0) + 1
-        
+        summary, sample = result
         project_data = {
             "project": {
                 "name": project.get("name"),
@@ -1394,23 +2290,16 @@ async def project_status_report(project_id: int) -> list:
                 "status": project.get("status"),
                 "url": f"{settings.openproject_url}/projects/{project.get('identifier', project.get('id'))}"
             },
-            "summary": {
-                "total_work_packages": total_wp,
-                "work_packages_with_dates": with_dates,
-                "assigned_work_packages": assigned,
-                "unassigned_work_packages": total_wp - assigned,
-                "status_breakdown": status_counts,
-                "gantt_ready": with_dates > 0
-            },
+            "summary": summary,
             "work_packages": [
                 {
-                    "subject": wp.get("subject"),
-                    "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                    "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                    "start_date": wp.get("startDate"),
-                    "due_date": wp.get("dueDate")
+                    "subject": wp.subject,
+                    "status": wp.status or "Unknown",
+                    "assignee": wp.assignee or "Unassigned",
+                    "start_date": wp.start_date,
+                    "due_date": wp.due_date
                 }
-                for wp in work_packages[:10]  # Limit to first 10 for readability
+                for wp in sample  # Limit to first 10 for readability
             ]
         }
         
@@ -1419,7 +2308,7 @@ async def project_status_report(project_id: int) -> list:
                 "role": "user",
                 "content": f"""Please analyze this project status data and provide a comprehensive report:
 
-{json.dumps(project_data, indent=2)}
+{dumps(project_data, indent=2)}
 
 Focus on:
 1. Overall project health and progress
@@ -1452,28 +2341,39 @@ async def work_package_summary(project_id: int, status_filter: str = "all") -> l
         List of message objects for LLM consumption
     """
     try:
-        work_packages = await openproject_client.get_work_packages(project_id)
-        
-        # Filter by status if specified
+        # Resolve the status filter to status IDs; "all" keeps the default of open work packages
+        status_ids = None
+        include_closed = False
         if status_filter != "all":
-            work_packages = [
-                wp for wp in work_packages 
-                if wp.get("_links", {}).get("status", {}).get("title", "").lower() == status_filter.lower()
-            ]
+            if status_filter.lower() in STATUS_SCOPE_OPERATORS:
+                if status_filter.lower() == "closed":
+                    status_ids = await openproject_client.get_closed_status_ids()
+                    include_closed = True
+            else:
+                resolved_status = await _resolve_status(status_filter.replace("_", " "))
+                status_ids = [resolved_status["id"]] if resolved_status else []
+                include_closed = True
+        
+        if status_ids == []:
+            rows = []  # Unknown status: nothing can match
+        else:
+            rows = await openproject_client.query_work_packages(
+                [project_id], status_ids=status_ids, include_closed=include_closed
+            )
         
         wp_data = []
-        for wp in work_packages:
+        for row in rows:
             wp_data.append({
-                "id": wp.get("id"),
-                "subject": wp.get("subject"),
-                "description": wp.get("description", {}).get("raw", "")[:200] + "..." if len(wp.get("description", {}).get("raw", "")) > 200 else wp.get("description", {}).get("raw", ""),
-                "status": wp.get("_links", {}).get("status", {}).get("title", "Unknown"),
-                "type": wp.get("_links", {}).get("type", {}).get("title", "Unknown"),
-                "priority": wp.get("_links", {}).get("priority", {}).get("title", "Unknown"),
-                "assignee": wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned"),
-                "start_date": wp.get("startDate"),
-                "due_date": wp.get("dueDate"),
-                "done_ratio": wp.get("doneRatio", 0)
+                "id": row.id,
+                "subject": row.subject,
+                "description": row.description[:200] + "..." if len(row.description) > 200 else row.description,
+                "status": row.status or "Unknown",
+                "type": row.type or "Unknown",
+                "priority": row.priority or "Unknown",
+                "assignee": row.assignee or "Unassigned",
+                "start_date": row.start_date,
+                "due_date": row.due_date,
+                "done_ratio": row.done_ratio or 0
             })
         
         return [
@@ -1481,7 +2381,7 @@ async def work_package_summary(project_id: int, status_filter: str = "all") -> l
                 "role": "user",
                 "content": f"""Please provide a summary of these work packages (filtered by status: {status_filter}):
 
-{json.dumps(wp_data, indent=2)}
+{dumps(wp_data, indent=2)}
 
 Please organize your summary by:
 1. High-priority items requiring attention
@@ -1561,44 +2461,80 @@ async def team_workload_analysis(project_ids: list[int] = None) -> list:
     try:
         # Get all projects if none specified
         if project_ids is None:
-            projects = await openproject_client.get_projects()
-            project_ids = [p.get("id") for p in projects[:5]]  # Limit to first 5 for performance
+            project_ids = []
+            async for project in openproject_client.iter_projects():
+                project_ids.append(project.get("id"))
+                if len(project_ids) == 5:  # Limit to first 5 for performance
+                    break
+        
+        from datetime import date, timedelta
+        
+        closed_ids = set(await openproject_client.get_closed_status_ids())
+        yesterday = (date.today() - timedelta(days=1)).isoformat()
+        
+        async def workload_rows():
+            """Yield (row, project ID, completed, overdue) for every work package in every project.
+            
+            A work package in several projects' collections (subprojects are
+            included in their parent's) is yielded once per project.
+            """
+            if not settings.mirror_enabled:
+                # Without mirrors, stream each project page by page in bounded memory
+                for project_id in project_ids:
+                    try:
+                        async for row in openproject_client.iter_project_work_packages(project_id, include_closed=True):
+                            closed = row.status_id in closed_ids
+                            yield row, project_id, closed, not closed and bool(row.due_date) and row.due_date <= yesterday
+                    except Exception:
+                        continue  # Skip projects that can't be accessed
+                return
+            
+            # Refresh the projects' rows in the local store, as many at a time as it keeps
+            store = openproject_client.work_package_store
+            async for batch in openproject_client.refresh_work_package_store_batches(
+                project_ids, skip_inaccessible=True  # Skip projects that can't be accessed
+            ):
+                # Completed and overdue work come straight from the status and due date indexes
+                completed_ids = {row.id for row in store.query(project_ids=batch, status_ids=closed_ids)}
+                overdue_ids = {
+                    row.id for row in store.query(project_ids=batch, exclude_status_ids=closed_ids, due_before=yesterday)
+                }
+                for project_id in batch:
+                    for row in store.query(project_ids=[project_id]):
+                        yield row, project_id, row.id in completed_ids, row.id in overdue_ids
         
         workload_data = {}
         total_work_packages = 0
-        
-        for project_id in project_ids:
-            try:
-                work_packages = await openproject_client.get_work_packages(project_id)
-                total_work_packages += len(work_packages)
-                
-                for wp in work_packages:
-                    assignee = wp.get("_links", {}).get("assignee", {}).get("title", "Unassigned")
-                    if assignee not in workload_data:
-                        workload_data[assignee] = {
-                            "total_tasks": 0,
-                            "in_progress": 0,
-                            "completed": 0,
-                            "overdue": 0,
-                            "projects": set()
-                        }
-                    
-                    workload_data[assignee]["total_tasks"] += 1
-                    workload_data[assignee]["projects"].add(project_id)
-                    
-                    status = wp.get("_links", {}).get("status", {}).get("title", "").lower()
-                    if "progress" in status or "active" in status:
-                        workload_data[assignee]["in_progress"] += 1
-                    elif "closed" in status or "done" in status:
-                        workload_data[assignee]["completed"] += 1
-                    
-                    # Check for overdue items (simplified check)
-                    due_date = wp.get("dueDate")
-                    if due_date and due_date < "2024-12-20":  # Simplified date check
-                        workload_data[assignee]["overdue"] += 1
-                        
-            except Exception:
-                continue  # Skip projects that can't be accessed
+        counted_ids = set()
+        
+        async for row, project_id, completed, overdue in workload_rows():
+            assignee = row.assignee or "Unassigned"
+            if row.id in counted_ids:
+                # Already counted under another project
+                workload_data[assignee]["projects"].add(project_id)
+                continue
+            counted_ids.add(row.id)
+            total_work_packages += 1
+            if assignee not in workload_data:
+                workload_data[assignee] = {
+                    "total_tasks": 0,
+                    "in_progress": 0,
+                    "completed": 0,
+                    "overdue": 0,
+                    "projects": set()
+                }
+            
+            workload_data[assignee]["total_tasks"] += 1
+            workload_data[assignee]["projects"].add(project_id)
+            
+            status = (row.status or "").lower()
+            if completed or "done" in status:
+                workload_data[assignee]["completed"] += 1
+            elif "progress" in status or "active" in status:
+                workload_data[assignee]["in_progress"] += 1
+            
+            if overdue:
+                workload_data[assignee]["overdue"] += 1
         
         # Convert sets to lists for JSON serialization
         for assignee_data in workload_data.values():
@@ -1612,7 +2548,7 @@ async def team_workload_analysis(project_ids: list[int] = None) -> list:
 Total work packages analyzed: {total_work_packages}
 
 Team workload breakdown:
-{json.dumps(workload_data, indent=2)}
+{dumps(workload_data, indent=2)}
 
 Please provide analysis on:
 1. **Workload Distribution:**
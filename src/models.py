@@ -106,6 +106,22 @@ class WorkPackageCreateRequest(BaseModel):
         return v
 
 
+class WorkPackageBatchItem(WorkPackageCreateRequest):
+    """Request model for one work package in a batch creation.
+    
+    Items can reference a parent created in the same batch by its ref.
+    """
+    ref: Optional[str] = Field(default=None, min_length=1, description="Batch-local reference for use as parent_ref")
+    parent_ref: Optional[str] = Field(default=None, min_length=1, description="ref of the parent item in the same batch")
+
+    @validator('parent_ref')
+    def validate_single_parent(cls, v, values):
+        """Validate parent_id and parent_ref are not both set."""
+        if v is not None and values.get('parent_id') is not None:
+            raise ValueError("Use either parent_id or parent_ref, not both")
+        return v
+
+
 class WorkPackageRelationCreateRequest(BaseModel):
     """Request model for creating work package relations."""
     from_work_package_id: int = Field(..., gt=0, description="Source work package ID")
@@ -1,15 +1,39 @@
 """OpenProject API client for MCP server."""
+import asyncio
 import json
 import base64
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import math
+from collections import OrderedDict, deque
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from urllib.parse import urlencode
 import httpx
 from config import settings
-from models import Project, WorkPackage, ProjectCreateRequest, WorkPackageCreateRequest
+from models import Project, WorkPackage, ProjectCreateRequest, WorkPackageCreateRequest, WorkPackageRelationCreateRequest
+from utils.cache import (
+    MISSING, Cache, CacheBackend, MemoryCacheBackend, SingleFlight, SQLiteCacheBackend, TieredCacheBackend, namespace_of
+)
+from utils.filters import (
+    build_collection_params, build_id_filter, build_involved_filter, build_select, build_work_package_filters
+)
+from utils.mirror import ProjectMirror
+from utils.records import WorkPackageRecord, normalize_work_packages
+from utils.serialization import EncodedDict, dumps_bytes, loads
+from utils.store import WorkPackageStore
+from utils.graph import find_cycle, normalize_relation, precedence_edge, topological_levels
+from utils.circuit_breaker import CircuitBreaker
+from utils.rate_limit import RateLimiter, TokenBucket
+from utils.retry import IDEMPOTENT_METHODS, RetryPolicy, cap_timeout
 from utils.logging import get_logger, log_api_request, log_api_response, log_error
 
 logger = get_logger(__name__)
 
+# HTTP/2 support in httpx needs the optional h2 package (pip install httpx[http2])
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class OpenProjectAPIError(Exception):
     """Exception raised for OpenProject API errors."""
@@ -56,6 +80,36 @@ class OpenProjectAPIError(Exception):
         super().__init__(self.message)
 
 
+class CircuitOpenError(OpenProjectAPIError):
+    """Exception raised when a request is rejected because the circuit breaker is open."""
+    def __init__(self, retry_after: float):
+        self.retry_after = retry_after
+        super().__init__(
+            f"OpenProject API is unavailable (circuit breaker open); retry in {retry_after:.0f}s",
+            status_code=503
+        )
+
+
+class RequestDeadlineExceeded(OpenProjectAPIError):
+    """Exception raised when local throttling used up a request's deadline before it was sent.
+    
+    The backend was never contacted, so this does not count against the
+    circuit breaker.
+    """
+    def __init__(self):
+        super().__init__("Request deadline exceeded before the request was sent")
+
+
+class ResponseBody(EncodedDict):
+    """A parsed GET response body with the validators it was served with."""
+    
+    __slots__ = ("validators",)
+    
+    def __init__(self, data: dict, encoded: bytes, validators: Dict[str, Optional[str]]):
+        super().__init__(data, encoded)
+        self.validators = validators
+
+
 class OpenProjectClient:
     """Client for interacting with OpenProject API."""
     
@@ -64,16 +118,111 @@ class OpenProjectClient:
         self.api_key = settings.openproject_api_key
         self.api_base = f"{self.base_url}/api/v3"
         
-        # Initialize cache
-        self._cache = {}
-        self._cache_timeout = timedelta(minutes=5)
+        # Optional on-disk tier so restarts start with a warm cache (responses,
+        # their validators and mirror snapshots)
+        self._persistent_cache: Optional[SQLiteCacheBackend] = None
+        if settings.persistent_cache_path:
+            self._persistent_cache = SQLiteCacheBackend(
+                settings.persistent_cache_path, "responses",
+                settings.persistent_cache_max_entries, settings.persistent_cache_max_bytes
+            )
+        
+        # Initialize cache with per-namespace TTLs (see _cache_key for namespaces).
+        # GET responses with an ETag or Last-Modified header stay in it past
+        # their TTL, for conditional requests, until revalidation_cache_ttl.
+        reference_ttl = settings.cache_ttl_reference
+        work_package_ttl = settings.cache_ttl_work_packages
+        self._cache = Cache(
+            self._tiered(MemoryCacheBackend(settings.cache_max_entries, settings.cache_max_bytes), self._persistent_cache),
+            default_ttl=settings.cache_timeout_minutes * 60,
+            ttls={
+                "work_package_types": reference_ttl,
+                "work_package_statuses": reference_ttl,
+                "priorities": reference_ttl,
+                "projects": settings.cache_ttl_projects,
+                "work_packages": work_package_ttl,
+                "projects/work_packages": work_package_ttl,
+                "work_packages/relations": work_package_ttl,
+                "relations": work_package_ttl
+            }
+        )
+        self._conditional_requests = 0
+        self._not_modified_responses = 0
+        
+        # Per-project work package mirrors (LRU-bounded by project count)
+        self._mirrors: "OrderedDict[int, ProjectMirror]" = OrderedDict()
+        
+        # Indexed rows of every mirrored project, kept in step with the mirrors
+        self.work_package_store = WorkPackageStore()
+        
+        # Webhook events received on another thread, applied before the next read
+        self._pending_events: "deque[Tuple[str, Dict[str, Any]]]" = deque()
+        self._webhook_events = 0
+        
+        # Last lockVersion seen per work package ID (LRU-bounded)
+        self._lock_versions: "OrderedDict[int, int]" = OrderedDict()
+        self._optimistic_updates = 0
+        self._lock_conflicts = 0
+        
+        # Coalesces concurrent identical GETs and cache misses
+        self._single_flight = SingleFlight()
+        
+        # Retry transient failures. PATCH is never retried (lockVersion makes a
+        # repeated update fail with 409); POST only when explicitly enabled.
+        retry_methods = IDEMPOTENT_METHODS
+        if settings.retry_post:
+            retry_methods = retry_methods | {"POST"}
+        self.retry_policy = RetryPolicy(
+            max_retries=settings.max_retries,
+            backoff_base=settings.retry_backoff_base,
+            backoff_max=settings.retry_backoff_max,
+            deadline=settings.retry_deadline,
+            retry_methods=retry_methods
+        )
+        self._retries = 0
+        
+        # Fail fast while OpenProject is down instead of waiting for timeouts
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=settings.circuit_breaker_failure_threshold,
+            recovery_timeout=settings.circuit_breaker_recovery_timeout
+        )
+        
+        # Client-side rate limiting: a global bucket plus read/write buckets
+        self.rate_limiter = RateLimiter(
+            global_bucket=TokenBucket(settings.rate_limit, settings.rate_limit_burst) if settings.rate_limit else None,
+            read_bucket=TokenBucket(settings.rate_limit_read, settings.rate_limit_read * 2) if settings.rate_limit_read else None,
+            write_bucket=TokenBucket(settings.rate_limit_write, settings.rate_limit_write * 2) if settings.rate_limit_write else None
+        )
         
         # Encode API key for Basic authentication
         auth_string = base64.b64encode(f'apikey:{self.api_key}'.encode()).decode()
         
-        # HTTP client configuration
+        # HTTP client configuration: one shared connection pool for all calls
+        self.http2 = settings.http2 and HTTP2_AVAILABLE
+        if settings.http2 and not HTTP2_AVAILABLE:
+            logger.warning("OPENPROJECT_HTTP2 is enabled but the h2 package is not installed; using HTTP/1.1")
+        
+        self.limits = httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry
+        )
+        self._in_flight_requests = 0
+        self._peak_in_flight_requests = 0
+        self._total_requests = 0
+        # Event loop of the latest request; the connection pool is bound to it, so
+        # code on other threads must schedule calls there (run_coroutine_threadsafe)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        
         self.client = httpx.AsyncClient(
-            timeout=30.0,
+            http2=self.http2,
+            limits=self.limits,
+            timeout=httpx.Timeout(
+                connect=settings.http_connect_timeout,
+                read=settings.http_read_timeout,
+                write=settings.http_write_timeout,
+                pool=settings.http_pool_timeout
+            ),
             headers={
                 "Authorization": f"Basic {auth_string}",
                 "Content-Type": "application/json",
@@ -81,24 +230,100 @@ class OpenProjectClient:
             }
         )
     
-    async def _make_request(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
-        """Make HTTP request to OpenProject API."""
+    @staticmethod
+    def _tiered(memory: MemoryCacheBackend, persistent: Optional[SQLiteCacheBackend]) -> CacheBackend:
+        """Put a memory backend in front of the persistent backend, if one is configured."""
+        if persistent is None:
+            return memory
+        return TieredCacheBackend(memory, persistent)
+    
+    async def _make_request(self, method: str, url: str, revalidate: bool = True, **kwargs) -> Dict[str, Any]:
+        """Make HTTP request to OpenProject API.
+        
+        Concurrent identical GET requests share a single HTTP request; each
+        caller that joined gets its own copy of the parsed result. With
+        revalidate=False a GET is not sent conditionally.
+        """
+        if method == "GET" and set(kwargs) <= {"params"}:
+            key = ("GET", self._cache_key(url, kwargs.get("params")), revalidate)
+            result = await self._single_flight.do(
+                key, lambda: self._send_request(method, url, revalidate=revalidate, **kwargs), copy=self._copy_body
+            )
+        else:
+            result = await self._send_request(method, url, revalidate=revalidate, **kwargs)
+        
+        self._record_lock_versions(url, result)
+        return result
+    
+    @staticmethod
+    def _copy_body(body: Any) -> Any:
+        """Return an independent copy of a decoded response body."""
+        encoded = getattr(body, "encoded", None)
+        copied = loads(encoded if encoded is not None else dumps_bytes(body))
+        if isinstance(body, ResponseBody):
+            # Every caller that joined stores the response, validators included
+            return ResponseBody(copied, encoded, body.validators)
+        return copied
+
+    def _record_lock_versions(self, url: str, body: Any) -> None:
+        """Remember lockVersions from a work package or work package collection response."""
+        if not settings.lock_version_cache_size or not isinstance(body, dict):
+            return
+        if namespace_of(self._cache_key(url, None)) not in ("work_packages", "projects/work_packages"):
+            return
+        
+        elements = body.get("_embedded", {}).get("elements") if "_embedded" in body else [body]
+        for wp in elements or []:
+            if isinstance(wp, dict) and "id" in wp and wp.get("lockVersion") is not None:
+                self._remember_lock_version(wp["id"], wp["lockVersion"])
+    
+    def _remember_lock_version(self, work_package_id: int, lock_version: int) -> None:
+        # lockVersion only ever increases; ignore responses that arrive out of order
+        current = self._lock_versions.pop(work_package_id, None)
+        self._lock_versions[work_package_id] = max(lock_version, current) if current is not None else lock_version
+        while len(self._lock_versions) > settings.lock_version_cache_size:
+            self._lock_versions.popitem(last=False)
+    
+    async def _send_request(self, method: str, url: str, revalidate: bool = True, **kwargs) -> Dict[str, Any]:
+        """Send a single HTTP request to OpenProject API and parse the response.
+        
+        A GET whose cached response (see _get) carries an ETag or
+        Last-Modified validator is sent as a conditional request, unless
+        revalidate is False, and a 304 Not Modified is answered with the
+        cached body. GET bodies with validators are returned as ResponseBody,
+        so _get can store the validators with the body.
+        """
         full_url = f"{self.api_base}{url}"
         
+        conditional = method == "GET" and revalidate and settings.conditional_requests
+        stored = MISSING
+        if conditional:
+            # Read the backend directly: _get has already counted this lookup
+            stored = self._cache.backend.get(self._cache_key(url, kwargs.get("params")))
+            headers = self._conditional_headers(stored) if stored is not MISSING else {}
+            if headers:
+                kwargs["headers"] = {**kwargs.get("headers", {}), **headers}
+                self._conditional_requests += 1
+            else:
+                stored = MISSING
+        
         # Log the request
         log_api_request(logger, method, full_url)
         
         try:
-            response = await self.client.request(method, full_url, **kwargs)
+            response = await self._guarded_request(method, full_url, **kwargs)
             
-            # Log the response
-            log_api_response(logger, method, full_url, response.status_code)
+            if response.status_code == 304 and stored is not MISSING:
+                self._not_modified_responses += 1
+                body = stored["body"]
+                validators = {"etag": stored.get("etag"), "last_modified": stored.get("last_modified")}
+                return ResponseBody(body, dumps_bytes(body), validators)
             
             # Check for HTTP errors
             if response.status_code >= 400:
                 error_data = {}
                 try:
-                    error_data = response.json()
+                    error_data = loads(response.content)
                 except:
                     pass
                 
@@ -110,10 +335,17 @@ class OpenProjectClient:
                 log_error(logger, error, {"url": full_url, "method": method, "status_code": response.status_code})
                 raise error
             
-            # Parse JSON response
-            if response.content:
-                return response.json()
-            return {}
+            # Parse JSON response, keeping the raw bytes for the cache
+            body = loads(response.content) if response.content else {}
+            if isinstance(body, dict) and response.content:
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+                if conditional and (etag or last_modified):
+                    body = ResponseBody(body, response.content, {"etag": etag, "last_modified": last_modified})
+                else:
+                    body = EncodedDict(body, response.content)
+            
+            return body
             
         except httpx.RequestError as e:
             error = OpenProjectAPIError(f"Request failed: {str(e)}")
@@ -124,13 +356,282 @@ class OpenProjectClient:
             log_error(logger, error, {"url": full_url, "method": method})
             raise error
     
+    async def _guarded_request(self, method: str, full_url: str, **kwargs) -> httpx.Response:
+        """Send a request through the circuit breaker.
+        
+        Transport errors and 5xx responses (after retries) count as failures;
+        any other response proves the backend is reachable.
+        
+        Raises:
+            CircuitOpenError: If the breaker is open
+        """
+        permit = self.circuit_breaker.allow_request()
+        if permit is None:
+            error = CircuitOpenError(self.circuit_breaker.retry_after())
+            logger.warning("Request rejected by circuit breaker", method=method, url=full_url)
+            raise error
+        
+        try:
+            response = await self._request_with_retry(method, full_url, **kwargs)
+        except httpx.RequestError:
+            self.circuit_breaker.record_failure(permit)
+            raise
+        except BaseException:
+            self.circuit_breaker.release(permit)
+            raise
+        
+        if response.status_code >= 500:
+            self.circuit_breaker.record_failure(permit)
+        else:
+            self.circuit_breaker.record_success(permit)
+        return response
+    
+    async def _request_with_retry(self, method: str, full_url: str, **kwargs) -> httpx.Response:
+        """Send a request, retrying transient failures according to the retry policy.
+        
+        Returns the last response received, which may still carry an error
+        status once retries are exhausted. Transport errors are re-raised
+        when they can no longer be retried. Every attempt is bounded by the
+        time left in the policy's deadline, and none starts after it.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.retry_policy.deadline
+        attempt = 0
+        response = None
+        error = None
+        
+        while True:
+            try:
+                response = await self._send_once(method, full_url, deadline, **kwargs)
+            except RequestDeadlineExceeded:
+                # A retry throttled past the deadline: report what the last attempt got
+                if error is not None:
+                    raise error
+                if response is not None:
+                    return response
+                raise
+            except httpx.RequestError as e:
+                error = e
+                delay = self.retry_policy.next_delay(method, attempt, deadline - loop.time())
+                if delay is None:
+                    raise
+                logger.warning("Retrying request after transport error", method=method, url=full_url,
+                               attempt=attempt + 1, delay=round(delay, 3), error=str(e))
+            else:
+                error = None
+                # Log the response
+                log_api_response(logger, method, full_url, response.status_code)
+                
+                if response.status_code < 400:
+                    return response
+                delay = self.retry_policy.next_delay(
+                    method, attempt, deadline - loop.time(),
+                    status_code=response.status_code,
+                    retry_after=response.headers.get("Retry-After")
+                )
+                if delay is None:
+                    return response
+                logger.warning("Retrying request after error status", method=method, url=full_url,
+                               attempt=attempt + 1, delay=round(delay, 3), status_code=response.status_code)
+            
+            attempt += 1
+            self._retries += 1
+            await asyncio.sleep(delay)
+            if deadline - loop.time() <= 0:
+                # The backoff overran the deadline; no time is left for another attempt
+                if error is not None:
+                    raise error
+                return response
+    
+    def _attempt_timeout(self, remaining: float) -> httpx.Timeout:
+        """Return the client's timeouts, each capped at the time left in the deadline."""
+        configured = self.client.timeout
+        return httpx.Timeout(
+            connect=cap_timeout(configured.connect, remaining),
+            read=cap_timeout(configured.read, remaining),
+            write=cap_timeout(configured.write, remaining),
+            pool=cap_timeout(configured.pool, remaining)
+        )
+    
+    async def _send_once(self, method: str, full_url: str, deadline: float, **kwargs) -> httpx.Response:
+        """Send a single HTTP request, tracking connection pool utilisation.
+        
+        Every attempt, including retries, waits for the rate limiter first.
+        The request's timeouts are then capped at the time left before the
+        deadline (a loop.time() value).
+        
+        Raises:
+            RequestDeadlineExceeded: If the deadline passed while waiting for the rate limiter
+        """
+        await self.rate_limiter.acquire(method)
+        
+        self.loop = asyncio.get_running_loop()
+        remaining = deadline - self.loop.time()
+        if remaining <= 0:
+            raise RequestDeadlineExceeded()
+        kwargs["timeout"] = self._attempt_timeout(remaining)
+        
+        self._in_flight_requests += 1
+        self._peak_in_flight_requests = max(self._peak_in_flight_requests, self._in_flight_requests)
+        self._total_requests += 1
+        try:
+            return await self.client.request(method, full_url, **kwargs)
+        finally:
+            self._in_flight_requests -= 1
+    
+    @staticmethod
+    def _conditional_headers(stored: Dict[str, Any]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers from stored validators."""
+        headers = {}
+        if stored.get("etag"):
+            headers["If-None-Match"] = stored["etag"]
+        if stored.get("last_modified"):
+            headers["If-Modified-Since"] = stored["last_modified"]
+        return headers
+    
+    def enqueue_webhook_event(self, action: str, payload: Dict[str, Any]) -> None:
+        """Queue a verified webhook event; safe to call from any thread.
+        
+        Events are applied on the client's own event loop before the next
+        cached read or mirror sync, so caches are never touched concurrently.
+        """
+        self._pending_events.append((action, payload))
+    
+    def _apply_pending_events(self) -> None:
+        """Apply every queued webhook event."""
+        while self._pending_events:
+            action, payload = self._pending_events.popleft()
+            try:
+                self.apply_webhook_event(action, payload)
+            except Exception as e:
+                log_error(logger, e, {"webhook_action": action})
+    
+    def apply_webhook_event(self, action: str, payload: Dict[str, Any]) -> bool:
+        """Update caches, mirrors and the work package store from a webhook event.
+        
+        Work package events replace the cached work package with the payload,
+        patch the mirror and store of its project (dropping it from any other
+        mirrored project it moved out of) and invalidate cached listings.
+        Project events invalidate cached projects.
+        
+        Args:
+            action: Event action, e.g. "work_package:updated"
+            payload: Parsed webhook body
+        
+        Returns:
+            Whether the event affected any cached data
+        """
+        resource, _, verb = action.partition(":")
+        self._webhook_events += 1
+        
+        if resource == "work_package":
+            wp = payload.get("work_package") or {}
+            wp_id = wp.get("id")
+            if wp_id is None:
+                return False
+            
+            self._invalidate_work_packages()
+            self._invalidate_relations()
+            project_href = wp.get("_links", {}).get("project", {}).get("href") or ""
+            project_id = int(project_href.split("/")[-1]) if project_href.split("/")[-1].isdigit() else None
+            
+            for mirrored_id, mirror in self._mirrors.items():
+                if verb != "deleted" and mirrored_id == project_id:
+                    mirror.upsert(wp, advance_watermark=False)
+                    self.work_package_store.upsert(mirror.get(wp_id), mirrored_id)
+                elif mirror.remove(wp_id):
+                    self.work_package_store.remove_from_project(wp_id, mirrored_id)
+            
+            if verb != "deleted":
+                self._cache.set_response(self._cache_key(f"/work_packages/{wp_id}"), wp)
+                if wp.get("lockVersion") is not None:
+                    self._remember_lock_version(wp_id, wp["lockVersion"])
+            else:
+                self._lock_versions.pop(wp_id, None)
+            logger.debug("Applied work package webhook", action=action, work_package_id=wp_id, project_id=project_id)
+            return True
+        
+        if resource == "project":
+            self._cache.invalidate_namespace("projects")
+            logger.debug("Applied project webhook", action=action)
+            return True
+        
+        return False
+    
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        use_cache: bool = True,
+        store: bool = True
+    ) -> Dict[str, Any]:
+        """GET a resource through the response cache.
+        
+        Each response is stored once, with its validators, and serves both
+        fresh hits and conditional requests once stale. With use_cache=False
+        the cache is bypassed for the read but refreshed with the response.
+        With store=False the response is neither stored nor revalidated.
+        """
+        self._apply_pending_events()
+        cache_key = self._cache_key(url, params)
+        if use_cache:
+            entry = self._cache.get_response(cache_key)
+            if entry is not MISSING and entry["fresh"]:
+                return entry["body"]
+        
+        kwargs: Dict[str, Any] = {"params": params} if params else {}
+        if not store:
+            kwargs["revalidate"] = False
+        response = await self._make_request("GET", url, **kwargs)
+        
+        if store:
+            # A fresh response still carries the bytes it was decoded from
+            self._cache.set_response(
+                cache_key, response, getattr(response, "validators", None),
+                encoded=getattr(response, "encoded", None), revalidate_for=settings.revalidation_cache_ttl
+            )
+        return response
+    
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict] = None) -> str:
+        """Build the cache key for a GET request.
+        
+        The namespace is the URL path with numeric IDs removed (e.g.
+        ``projects/work_packages`` for ``/projects/5/work_packages``), so each
+        kind of resource has its own TTL and can be invalidated as a group.
+        """
+        path = url.split("?", 1)[0]
+        segments = [segment for segment in path.strip("/").split("/") if segment and not segment.isdigit()]
+        namespace = "/".join(segments) or "root"
+        key = f"{namespace}:{url}"
+        if params:
+            key += "?" + urlencode(sorted(params.items()))
+        return key
+    
     async def get_projects(self, use_pagination: bool = False) -> List[Dict[str, Any]]:
         """Get list of projects."""
         if use_pagination:
             return await self.get_paginated_results("/projects")
-        response = await self._make_request("GET", "/projects")
+        response = await self._get("/projects")
         return response.get("_embedded", {}).get("elements", [])
     
+    def iter_projects(self) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every visible project page by page."""
+        return self.iter_paginated("/projects")
+    
+    async def get_project_by_id(self, project_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single project, or None if it does not exist or is not visible."""
+        try:
+            return await self._get(f"/projects/{project_id}")
+        except OpenProjectAPIError as e:
+            if e.status_code == 404:
+                return None
+            raise
+    
+    async def get_projects_page(self, offset: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one window of projects and the total count."""
+        return await self.get_page("/projects", None, offset, limit)
+    
     async def create_project(self, project_data: ProjectCreateRequest) -> Dict[str, Any]:
         """Create a new project."""
         payload = {
@@ -144,16 +645,55 @@ class OpenProjectClient:
         if project_data.status and project_data.status != "active":
             payload["status"] = project_data.status
         
-        return await self._make_request("POST", "/projects", json=payload)
+        result = await self._make_request("POST", "/projects", json=payload)
+        self._cache.invalidate_namespace("projects")
+        return result
     
-    async def get_work_packages(self, project_id: int, use_pagination: bool = False) -> List[Dict[str, Any]]:
-        """Get work packages for a project."""
+    async def get_work_packages(
+        self,
+        project_id: int,
+        use_pagination: bool = False,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        select: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get work packages for a project.
+        
+        Args:
+            project_id: Project to list work packages from
+            use_pagination: Fetch every page instead of only the first one
+            filters: OpenProject filter objects (see utils.filters.build_work_package_filters);
+                None keeps the API's default "open only" filter, [] returns every status
+            select: Tool-level field names to project server-side
+        """
         url = f"/projects/{project_id}/work_packages"
+        params = build_collection_params(filters, select)
         if use_pagination:
-            return await self.get_paginated_results(url)
-        response = await self._make_request("GET", url)
+            return await self.get_paginated_results(url, params or None)
+        response = await self._get(url, params or None)
         return response.get("_embedded", {}).get("elements", [])
     
+    def iter_work_packages(
+        self,
+        project_id: int,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        select: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream work packages of a project page by page."""
+        params = build_collection_params(filters, select)
+        return self.iter_paginated(f"/projects/{project_id}/work_packages", params or None)
+    
+    async def get_work_packages_page(
+        self,
+        project_id: int,
+        offset: int,
+        limit: int,
+        filters: Optional[List[Dict[str, Any]]] = None,
+        select: Optional[List[str]] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one window of a project's work packages and the total match count."""
+        params = build_collection_params(filters, select)
+        return await self.get_page(f"/projects/{project_id}/work_packages", params or None, offset, limit)
+    
     async def create_work_package(self, work_package_data: WorkPackageCreateRequest) -> Dict[str, Any]:
         """Create a new work package."""
         payload = {
@@ -197,22 +737,238 @@ class OpenProjectClient:
         if work_package_data.estimated_hours:
             payload["estimatedTime"] = f"PT{work_package_data.estimated_hours}H"
         
-        return await self._make_request("POST", "/work_packages", json=payload)
+        result = await self._make_request("POST", "/work_packages", json=payload)
+        self._invalidate_work_packages()
+        return result
+    
+    async def create_work_packages_batch(
+        self,
+        items: List[WorkPackageCreateRequest],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Create many work packages with bounded concurrency.
+        
+        Items given as WorkPackageBatchItem may set parent_ref to the ref of
+        another item; that parent is created first and its new ID is used as
+        parent_id. Items whose parent failed are skipped.
+        
+        Args:
+            items: Work packages to create
+            max_concurrency: Maximum concurrent POSTs (defaults to max_concurrent_requests)
+        
+        Returns:
+            One result per item, in input order, with "success" and either
+            "work_package" or "error"
+        
+        Raises:
+            ValueError: If refs are duplicated, unknown or form a cycle
+        """
+        order = self._batch_creation_order(items)
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_requests)
+        tasks: Dict[int, "asyncio.Task[Dict[str, Any]]"] = {}
+        index_by_ref = {item.ref: i for i, item in enumerate(items) if getattr(item, "ref", None)}
+        
+        async def create(index: int) -> Dict[str, Any]:
+            item = items[index]
+            result = {"index": index, "ref": getattr(item, "ref", None), "success": False}
+            
+            parent_ref = getattr(item, "parent_ref", None)
+            try:
+                if parent_ref:
+                    parent_result = await tasks[index_by_ref[parent_ref]]
+                    if not parent_result["success"]:
+                        result["error"] = f"Skipped: parent '{parent_ref}' was not created"
+                        return result
+                    item = item.model_copy(update={"parent_id": parent_result["work_package"]["id"]})
+                
+                async with semaphore:
+                    result["work_package"] = await self.create_work_package(item)
+                result["success"] = True
+            except OpenProjectAPIError as e:
+                result["error"] = e.message
+                result["details"] = e.response_data
+            except Exception as e:
+                # Anything else (e.g. a response without an ID) fails this item only
+                log_error(logger, e, {"batch_index": index})
+                result["error"] = f"Unexpected error: {str(e)}"
+            return result
+        
+        # Parents are scheduled before their children, so every awaited parent task exists
+        for index in order:
+            tasks[index] = asyncio.create_task(create(index))
+        
+        results = await asyncio.gather(*tasks.values())
+        return sorted(results, key=lambda r: r["index"])
+    
+    @staticmethod
+    def _batch_creation_order(items: List[WorkPackageCreateRequest]) -> List[int]:
+        """Return item indexes ordered so every parent_ref precedes its children.
+        
+        Raises:
+            ValueError: If refs are duplicated, unknown or form a cycle
+        """
+        index_by_ref: Dict[str, int] = {}
+        for i, item in enumerate(items):
+            ref = getattr(item, "ref", None)
+            if ref:
+                if ref in index_by_ref:
+                    raise ValueError(f"Duplicate ref '{ref}' in batch")
+                index_by_ref[ref] = i
+        
+        depth: Dict[int, int] = {}
+        for i in range(len(items)):
+            # Walk up the parent chain until an item with a known depth or a root
+            chain = []
+            current = i
+            while current not in depth:
+                if current in chain:
+                    raise ValueError(f"Circular parent_ref chain involving item {current}")
+                chain.append(current)
+                parent_ref = getattr(items[current], "parent_ref", None)
+                if not parent_ref:
+                    depth[current] = 0
+                    chain.pop()
+                    break
+                if parent_ref not in index_by_ref:
+                    raise ValueError(f"Item {current} references unknown parent_ref '{parent_ref}'")
+                current = index_by_ref[parent_ref]
+            for node in reversed(chain):
+                parent = index_by_ref[items[node].parent_ref]
+                depth[node] = depth[parent] + 1
+        
+        return sorted(range(len(items)), key=lambda i: depth[i])
     
     async def update_work_package(self, work_package_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing work package.
         
-        Automatically fetches the current lockVersion if not provided in updates
-        to prevent optimistic locking conflicts (409 Conflict).
+        If updates carry no lockVersion, the last lockVersion seen for this
+        work package in any earlier response is used optimistically; on a 409
+        Conflict the current lockVersion is fetched and the update retried once.
+        Without a remembered lockVersion it is fetched before the update.
         """
+        url = f"/work_packages/{work_package_id}"
+        
         if "lockVersion" not in updates:
-            logger.debug(f"lockVersion not provided for WP {work_package_id}, fetching latest...")
-            wp = await self.get_work_package_by_id(work_package_id)
+            known = self._lock_versions.get(work_package_id)
+            if known is not None:
+                updates["lockVersion"] = known
+                self._optimistic_updates += 1
+                try:
+                    result = await self._make_request("PATCH", url, json=updates)
+                    self._invalidate_work_packages()
+                    return result
+                except OpenProjectAPIError as e:
+                    if e.status_code != 409:
+                        raise
+                    self._lock_conflicts += 1
+                    logger.debug(f"Stale lockVersion {known} for WP {work_package_id}, refetching...")
+            else:
+                logger.debug(f"lockVersion not provided for WP {work_package_id}, fetching latest...")
+            
+            wp = await self.get_work_package_by_id(work_package_id, use_cache=False)
             updates["lockVersion"] = wp.get("lockVersion")
             logger.debug(f"Fetched lockVersion {updates['lockVersion']} for WP {work_package_id}")
 
-        url = f"/work_packages/{work_package_id}"
-        return await self._make_request("PATCH", url, json=updates)
+        result = await self._make_request("PATCH", url, json=updates)
+        self._invalidate_work_packages()
+        return result
+    
+    async def get_work_packages_by_ids(
+        self,
+        work_package_ids: List[int],
+        select: Optional[List[str]] = None,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get many work packages with one filtered collection request per chunk of IDs.
+        
+        IDs that do not exist (or are not visible) are simply absent from the result.
+        
+        Args:
+            work_package_ids: Work package IDs to fetch
+            select: Optional field names to project (see utils.filters.WORK_PACKAGE_FIELDS)
+            use_cache: Whether responses may be served from the cache
+        """
+        ids = list(dict.fromkeys(work_package_ids))
+        if not ids:
+            return []
+        
+        # Keep filter URLs short by querying in chunks
+        chunk_size = 100
+        chunks = [ids[i:i + chunk_size] for i in range(0, len(ids), chunk_size)]
+        pages = await asyncio.gather(*(
+            self.get_paginated_results(
+                "/work_packages",
+                build_collection_params(filters=build_id_filter(chunk), select=select),
+                use_cache=use_cache
+            )
+            for chunk in chunks
+        ))
+        return [wp for page in pages for wp in page]
+    
+    async def bulk_update_work_packages(
+        self,
+        updates: Dict[int, Dict[str, Any]],
+        max_concurrency: Optional[int] = None,
+        max_conflict_retries: int = 2
+    ) -> List[Dict[str, Any]]:
+        """Update many work packages concurrently.
+        
+        The lockVersions of all targets are fetched with a single filtered
+        collection request instead of one GET per work package. Updates that
+        fail with 409 Conflict (changed by someone else in the meantime) get
+        their lockVersion re-fetched and are retried; other items are not
+        touched again.
+        
+        Args:
+            updates: Payload per work package ID (without lockVersion)
+            max_concurrency: Maximum concurrent PATCHes (defaults to max_concurrent_requests)
+            max_conflict_retries: How often a conflicting update is retried
+        
+        Returns:
+            One result per work package, in input order, with "success",
+            "attempts" and either "work_package" or "error"
+        """
+        results = {wp_id: {"work_package_id": wp_id, "success": False, "attempts": 0} for wp_id in updates}
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_requests)
+        
+        async def patch(wp_id: int, lock_version: int) -> bool:
+            """Apply one update, returning whether it hit a conflict."""
+            result = results[wp_id]
+            result["attempts"] += 1
+            async with semaphore:
+                try:
+                    result["work_package"] = await self._make_request(
+                        "PATCH", f"/work_packages/{wp_id}", json={**updates[wp_id], "lockVersion": lock_version}
+                    )
+                    result["success"] = True
+                    result.pop("error", None)
+                    return False
+                except OpenProjectAPIError as e:
+                    result["error"] = e.message
+                    result["status_code"] = e.status_code
+                    return e.status_code == 409
+        
+        pending = list(updates)
+        try:
+            for attempt in range(max_conflict_retries + 1):
+                current = await self.get_work_packages_by_ids(pending, select=["id", "lock_version"], use_cache=False)
+                lock_versions = {wp.get("id"): wp.get("lockVersion") for wp in current}
+                
+                for wp_id in pending:
+                    if wp_id not in lock_versions:
+                        results[wp_id]["error"] = f"Work package {wp_id} not found"
+                        results[wp_id]["status_code"] = 404
+                
+                targets = [wp_id for wp_id in pending if wp_id in lock_versions]
+                conflicts = await asyncio.gather(*(patch(wp_id, lock_versions[wp_id]) for wp_id in targets))
+                pending = [wp_id for wp_id, conflict in zip(targets, conflicts) if conflict]
+                if not pending:
+                    break
+                logger.info("Retrying conflicting work package updates", count=len(pending), attempt=attempt + 1)
+        finally:
+            self._invalidate_work_packages()
+        
+        return list(results.values())
     
     async def create_work_package_relation(
         self, 
@@ -250,23 +1006,221 @@ class OpenProjectClient:
         if lag != 0:
             payload["lag"] = lag
         
-        return await self._make_request("POST", url, json=payload)
+        result = await self._make_request("POST", url, json=payload)
+        self._invalidate_relations()
+        return result
+    
+    async def create_work_package_relations_bulk(
+        self,
+        relations: List[WorkPackageRelationCreateRequest],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Create many relations, skipping ones that already exist.
+        
+        Existing relations of all involved work packages are fetched once.
+        Before anything is created, the scheduling relations (follows/precedes,
+        blocks/blocked) of the batch plus the existing ones are checked for
+        cycles. New relations are then created concurrently, in waves ordered
+        by the successor's depth in the dependency graph so predecessors are
+        linked before the work that follows them.
+        
+        Returns:
+            One result per input relation, in input order, with "status" of
+            "created", "exists", "duplicate" (repeated within the batch) or
+            "failed"
+        
+        Raises:
+            ValueError: If the relations would create a dependency cycle
+        """
+        work_package_ids = sorted({
+            wp_id for r in relations for wp_id in (r.from_work_package_id, r.to_work_package_id)
+        })
+        existing = {}
+        for relation in await self.get_relations_involving(work_package_ids):
+            key = self.relation_key(relation)
+            if key:
+                existing[key] = relation
+        
+        results: List[Dict[str, Any]] = []
+        pending: Dict[tuple, int] = {}
+        for index, r in enumerate(relations):
+            key = normalize_relation(r.from_work_package_id, r.to_work_package_id, r.relation_type)
+            result = {"index": index, "from_id": r.from_work_package_id, "to_id": r.to_work_package_id,
+                      "relation_type": r.relation_type}
+            if key in existing:
+                result["status"] = "exists"
+                result["relation"] = existing[key]
+            elif key in pending:
+                result["status"] = "duplicate"
+            else:
+                pending[key] = index
+            results.append(result)
+        
+        edges = [
+            edge for edge in (precedence_edge(*key) for key in list(existing) + list(pending))
+            if edge is not None
+        ]
+        cycle = find_cycle(edges)
+        if cycle:
+            raise ValueError(f"Relations would create a dependency cycle: {' -> '.join(map(str, cycle))}")
+        levels = topological_levels(edges)
+        
+        waves: Dict[int, List[int]] = {}
+        for key, index in pending.items():
+            edge = precedence_edge(*key)
+            waves.setdefault(levels[edge[1]] if edge else 0, []).append(index)
+        
+        semaphore = asyncio.Semaphore(max_concurrency or settings.max_concurrent_requests)
+        
+        async def create(index: int):
+            r = relations[index]
+            async with semaphore:
+                try:
+                    results[index]["relation"] = await self.create_work_package_relation(
+                        r.from_work_package_id, r.to_work_package_id, r.relation_type, r.description, r.lag
+                    )
+                    results[index]["status"] = "created"
+                except OpenProjectAPIError as e:
+                    results[index]["status"] = "failed"
+                    results[index]["error"] = e.message
+                except Exception as e:
+                    # Anything else fails this relation only, not the whole wave
+                    log_error(logger, e, {"relation_index": index})
+                    results[index]["status"] = "failed"
+                    results[index]["error"] = f"Unexpected error: {str(e)}"
+        
+        for level in sorted(waves):
+            await asyncio.gather(*(create(index) for index in waves[level]))
+        
+        return results
+    
+    @staticmethod
+    def relation_key(relation: Dict[str, Any]) -> Optional[tuple]:
+        """Return (from_id, to_id, type) of a relation resource in canonical direction."""
+        links = relation.get("_links", {})
+        from_href = links.get("from", {}).get("href")
+        to_href = links.get("to", {}).get("href")
+        if not (from_href and to_href and relation.get("type")):
+            return None
+        return normalize_relation(int(from_href.split("/")[-1]), int(to_href.split("/")[-1]), relation["type"])
+    
+    async def get_dependency_graph(
+        self,
+        work_package_ids: List[int],
+        max_depth: int = 3,
+        max_nodes: int = 500,
+        relation_types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """Walk relations breadth-first from the given work packages.
+        
+        Each BFS level fetches the relation lists of its work packages
+        concurrently (bounded by max_concurrent_requests); relation lists are
+        served from the client cache when already known.
+        
+        Args:
+            work_package_ids: Start nodes
+            max_depth: Number of relation hops to follow
+            max_nodes: Stop adding nodes beyond this many
+            relation_types: Canonical relation types to follow (all if None)
+        
+        Returns:
+            Dict with "depths" (work package ID -> hop distance), "relations"
+            (relation ID -> (from_id, to_id, type) in canonical direction,
+            between known nodes only) and "truncated"
+        """
+        depths = {wp_id: 0 for wp_id in dict.fromkeys(work_package_ids)}
+        edges: Dict[Any, tuple] = {}
+        truncated = False
+        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        
+        async def fetch(wp_id: int) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.get_work_package_relations(wp_id)
+        
+        frontier = list(depths)
+        for depth in range(1, max_depth + 1):
+            if not frontier:
+                break
+            next_frontier = []
+            for relations in await asyncio.gather(*(fetch(wp_id) for wp_id in frontier)):
+                for relation in relations:
+                    key = self.relation_key(relation)
+                    if not key or (relation_types and key[2] not in relation_types):
+                        continue
+                    edges[relation.get("id", key)] = key
+                    for node in key[:2]:
+                        if node in depths:
+                            continue
+                        if len(depths) >= max_nodes:
+                            truncated = True
+                            continue
+                        depths[node] = depth
+                        next_frontier.append(node)
+            frontier = next_frontier
+        
+        return {
+            "depths": depths,
+            "relations": {rid: key for rid, key in edges.items() if key[0] in depths and key[1] in depths},
+            "truncated": truncated
+        }
+    
+    async def get_all_project_work_packages(
+        self,
+        project_id: int,
+        select: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Get every work package of a project, including closed ones."""
+        # An explicit empty filter list replaces the default "open only" filter
+        params = {"filters": "[]"}
+        if select:
+            params["select"] = build_select(select)
+        return await self.get_paginated_results(f"/projects/{project_id}/work_packages", params)
+    
+    async def get_project_relations(self, project_id: int) -> List[Dict[str, Any]]:
+        """Get every relation touching a work package of a project.
+        
+        Uses a handful of paginated calls: the project's work package IDs
+        (all statuses) followed by chunked /relations "involved" queries.
+        """
+        work_packages = await self.get_all_project_work_packages(project_id, select=["id"])
+        return await self.get_relations_involving([wp["id"] for wp in work_packages if "id" in wp])
+    
+    async def get_relations_involving(self, work_package_ids: List[int]) -> List[Dict[str, Any]]:
+        """Get all relations that have any of the given work packages at either end."""
+        if not work_package_ids:
+            return []
+        
+        # Keep filter URLs short by querying in chunks
+        chunk_size = 100
+        chunks = [work_package_ids[i:i + chunk_size] for i in range(0, len(work_package_ids), chunk_size)]
+        pages = await asyncio.gather(*(
+            self.get_paginated_results("/relations", build_collection_params(filters=build_involved_filter(chunk)))
+            for chunk in chunks
+        ))
+        
+        relations = {}
+        for page in pages:
+            for relation in page:
+                relations[relation.get("id")] = relation
+        return list(relations.values())
     
     async def get_work_package_relations(self, work_package_id: int) -> List[Dict[str, Any]]:
         """Get all relations for a specific work package."""
         url = f"/work_packages/{work_package_id}/relations"
-        response = await self._make_request("GET", url)
+        response = await self._get(url)
         return response.get("_embedded", {}).get("elements", [])
     
     async def delete_work_package_relation(self, relation_id: int) -> Dict[str, Any]:
         """Delete a work package relation by its ID."""
         url = f"/relations/{relation_id}"
-        return await self._make_request("DELETE", url)
+        result = await self._make_request("DELETE", url)
+        self._invalidate_relations()
+        return result
     
-    async def get_work_package_by_id(self, work_package_id: int) -> Dict[str, Any]:
+    async def get_work_package_by_id(self, work_package_id: int, use_cache: bool = True) -> Dict[str, Any]:
         """Get a specific work package by ID."""
         url = f"/work_packages/{work_package_id}"
-        return await self._make_request("GET", url)
+        return await self._get(url, use_cache=use_cache)
     
     async def test_connection(self) -> Dict[str, Any]:
         """Test connection to OpenProject API."""
@@ -290,12 +1244,21 @@ class OpenProjectClient:
         if filters:
             params = "&".join([f"{k}={v}" for k, v in filters.items()])
             url += f"?{params}"
-        response = await self._make_request("GET", url)
+        response = await self._get(url)
         return response.get("_embedded", {}).get("elements", [])
 
+    async def get_users_page(
+        self,
+        offset: int,
+        limit: int,
+        filters: Optional[Dict] = None
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one window of users and the total count, with optional filtering."""
+        return await self.get_page("/users", filters, offset, limit)
+
     async def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
         """Get specific user by ID."""
-        return await self._make_request("GET", f"/users/{user_id}")
+        return await self._get(f"/users/{user_id}")
 
     async def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Get user by email address."""
@@ -352,63 +1315,457 @@ class OpenProjectClient:
     async def get_project_memberships(self, project_id: int) -> List[Dict[str, Any]]:
         """Get list of project members."""
         url = f"/projects/{project_id}/memberships"
-        response = await self._make_request("GET", url)
+        response = await self._get(url)
         return response.get("_embedded", {}).get("elements", [])
 
+    async def get_project_memberships_page(
+        self,
+        project_id: int,
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Get one window of a project's members and the total count."""
+        return await self.get_page(f"/projects/{project_id}/memberships", None, offset, limit)
+
     async def get_cached_or_fetch(self, cache_key: str, fetch_func):
-        """Get cached result or fetch fresh data."""
-        now = datetime.now()
+        """Get cached result or fetch fresh data.
         
-        if cache_key in self._cache:
-            cached_data, timestamp = self._cache[cache_key]
-            if now - timestamp < self._cache_timeout:
-                logger.debug(f"Cache hit for key: {cache_key}")
-                return cached_data
+        The TTL is taken from the key's namespace (the part before the first colon).
+        """
+        cached_data = self._cache.get(cache_key)
+        if cached_data is not MISSING:
+            logger.debug(f"Cache hit for key: {cache_key}")
+            return cached_data
+        
+        async def fetch_and_store():
+            logger.debug(f"Cache miss for key: {cache_key}, fetching fresh data")
+            fresh_data = await fetch_func()
+            self._cache.set(cache_key, fresh_data)
+            return fresh_data
         
-        logger.debug(f"Cache miss for key: {cache_key}, fetching fresh data")
-        fresh_data = await fetch_func()
-        self._cache[cache_key] = (fresh_data, now)
-        return fresh_data
+        # Concurrent misses for the same key share one fetch
+        return await self._single_flight.do(("cache", cache_key), fetch_and_store, copy=self._copy_body)
+
+    def invalidate_cache(self, namespace: Optional[str] = None):
+        """Invalidate one cache namespace, or everything when namespace is None."""
+        if namespace is None:
+            self._clear_all_cache()
+        else:
+            self._cache.invalidate_namespace(namespace)
+
+    async def get_mirrored_work_packages(self, project_id: int, include_closed: bool = False) -> List[WorkPackageRecord]:
+        """Get all work packages of a project from the local mirror.
+        
+        The first call loads the project completely; later calls fetch only
+        work packages updated since the mirror's watermark and merge them in.
+        A full reload runs every mirror_full_sync_interval seconds to pick up
+        deletions and moves. Concurrent syncs of one project share a request.
+        
+        Args:
+            project_id: Project ID
+            include_closed: Also return work packages in closed statuses
+                (by default only open ones, like the API's default filter)
+        """
+        if settings.mirror_enabled:
+            mirror = await self._single_flight.do(("mirror", project_id), lambda: self._sync_mirror(project_id))
+            work_packages = mirror.work_packages()
+        else:
+            work_packages = normalize_work_packages(await self.get_all_project_work_packages(project_id))
+        
+        if include_closed:
+            return work_packages
+        
+        closed = set(await self.get_closed_status_ids())
+        return [wp for wp in work_packages if wp.status_id not in closed]
+    
+    async def iter_project_work_packages(
+        self,
+        project_id: int,
+        include_closed: bool = False
+    ) -> AsyncIterator[WorkPackageRecord]:
+        """Yield every work package of a project as a record, for one-pass aggregation.
+        
+        With mirroring enabled the rows come from the synced mirror, which
+        holds them anyway. Otherwise the collection is streamed through
+        iter_work_packages, so at most two pages are in memory however large the
+        project is.
+        
+        Args:
+            project_id: Project ID
+            include_closed: Also yield work packages in closed statuses
+                (by default only open ones, like the API's default filter)
+        """
+        if settings.mirror_enabled:
+            for wp in await self.get_mirrored_work_packages(project_id, include_closed):
+                yield wp
+            return
+        
+        # An explicit empty filter list replaces the default "open only" filter
+        async for wp in self.iter_work_packages(project_id, [] if include_closed else None):
+            yield WorkPackageRecord.from_hal(wp)
+    
+    async def get_closed_status_ids(self) -> List[int]:
+        """Get the IDs of statuses that close a work package."""
+        return [s.get("id") for s in await self.get_work_package_statuses() if s.get("isClosed")]
+    
+    async def refresh_work_package_store(self, project_id: int) -> None:
+        """Bring a project's rows in the work package store up to date.
+        
+        With mirroring enabled this is a mirror sync (usually one small delta
+        request); otherwise the project is fetched in full and its rows replaced.
+        """
+        if settings.mirror_enabled:
+            await self._single_flight.do(("mirror", project_id), lambda: self._sync_mirror(project_id))
+        else:
+            work_packages = await self.get_all_project_work_packages(project_id)
+            self.work_package_store.replace_project(project_id, work_packages)
+    
+    async def refresh_work_package_store_batches(
+        self,
+        project_ids: List[int],
+        skip_inaccessible: bool = False
+    ) -> AsyncIterator[List[int]]:
+        """Refresh projects in the work package store, in batches that fit its budget.
+        
+        With mirroring enabled the store keeps at most mirror_max_projects
+        projects, so refreshing more at once would evict the first ones before
+        they are read. Each batch is refreshed concurrently and its project IDs
+        are yielded once its rows are in the store; read them before asking for
+        the next batch, which may evict them.
+        
+        Args:
+            project_ids: Projects to refresh
+            skip_inaccessible: Leave out projects whose refresh fails instead of raising
+        """
+        batch_size = settings.mirror_max_projects if settings.mirror_enabled else max(len(project_ids), 1)
+        for start in range(0, len(project_ids), batch_size):
+            batch = project_ids[start:start + batch_size]
+            results = await asyncio.gather(
+                *(self.refresh_work_package_store(project_id) for project_id in batch),
+                return_exceptions=skip_inaccessible
+            )
+            yield [
+                project_id for project_id, result in zip(batch, results)
+                if not isinstance(result, Exception)
+            ]
+    
+    async def query_work_packages(
+        self,
+        project_ids: List[int],
+        status_ids: Optional[List[int]] = None,
+        assignee_ids: Optional[List[Optional[int]]] = None,
+        type_ids: Optional[List[int]] = None,
+        include_closed: bool = False,
+        due_after: Optional[str] = None,
+        due_before: Optional[str] = None
+    ) -> List[WorkPackageRecord]:
+        """Query work packages of several projects through the indexed local store.
+        
+        The projects are refreshed concurrently (in batches when there are
+        more than the store keeps), and each batch is answered from the
+        store's indexes without further requests.
+        
+        Args:
+            project_ids: Projects to search
+            status_ids: Match any of these status IDs
+            assignee_ids: Match any of these user IDs (None matches unassigned)
+            type_ids: Match any of these type IDs
+            include_closed: Also return work packages in closed statuses
+            due_after: Only work packages due on or after this ISO date
+            due_before: Only work packages due on or before this ISO date
+        
+        Returns:
+            Matching rows ordered by work package ID
+        """
+        exclude_status_ids = None if include_closed else await self.get_closed_status_ids()
+        rows = {}
+        async for batch in self.refresh_work_package_store_batches(project_ids):
+            for row in self.work_package_store.query(
+                project_ids=batch,
+                status_ids=status_ids,
+                assignee_ids=assignee_ids,
+                type_ids=type_ids,
+                exclude_status_ids=exclude_status_ids,
+                due_after=due_after,
+                due_before=due_before
+            ):
+                rows[row.id] = row
+        return [rows[wp_id] for wp_id in sorted(rows)]
+    
+    async def _sync_mirror(self, project_id: int) -> ProjectMirror:
+        """Bring one project's mirror up to date with a full load or a delta."""
+        self._apply_pending_events()
+        endpoint = f"/projects/{project_id}/work_packages"
+        snapshot_key = f"mirror:{project_id}"
+        mirror = self._mirrors.get(project_id)
+        if mirror is None and self._persistent_cache is not None:
+            # Resume from the snapshot saved before a restart
+            snapshot = self._persistent_cache.get(snapshot_key)
+            if snapshot is not MISSING:
+                mirror = ProjectMirror.from_snapshot(snapshot)
+                self.work_package_store.replace_project(project_id, mirror.work_packages())
+                logger.debug("Project mirror restored", project_id=project_id, work_packages=len(mirror))
+        
+        if mirror is None or mirror.watermark is None or mirror.needs_full_sync(settings.mirror_full_sync_interval):
+            # An explicit empty filter list replaces the default "open only" filter
+            work_packages = await self.get_paginated_results(endpoint, {"filters": "[]"}, use_cache=False)
+            mirror = mirror or ProjectMirror(project_id)
+            mirror.load(work_packages)
+            self.work_package_store.replace_project(project_id, mirror.work_packages())
+            changed = True
+            logger.debug("Project mirror loaded", project_id=project_id, work_packages=len(mirror))
+        else:
+            params = build_collection_params(filters=build_work_package_filters(updated_since=mirror.watermark))
+            work_packages = await self.get_paginated_results(endpoint, params, use_cache=False)
+            applied = mirror.merge(work_packages)
+            for wp in work_packages:
+                # Index the mirror's record, which is never older than the delta's copy
+                current = mirror.get(wp.get("id"))
+                if current is not None:
+                    self.work_package_store.upsert(current, project_id)
+            changed = applied > 0
+            logger.debug("Project mirror synced", project_id=project_id, changed=applied, watermark=mirror.watermark)
+        
+        if changed and self._persistent_cache is not None:
+            # The snapshot expires when the next full load is due
+            self._persistent_cache.set_until(
+                snapshot_key, mirror.snapshot(), mirror.full_sync_at + settings.mirror_full_sync_interval
+            )
+        
+        self._mirrors[project_id] = mirror
+        self._mirrors.move_to_end(project_id)
+        while len(self._mirrors) > settings.mirror_max_projects:
+            evicted_id, _ = self._mirrors.popitem(last=False)
+            self.work_package_store.remove_project(evicted_id)
+        return mirror
+    
+    def get_mirror_stats(self) -> List[Dict[str, Any]]:
+        """Get size, watermark and sync counters of every project mirror."""
+        return [mirror.stats() for mirror in self._mirrors.values()]
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss/eviction counters and current size."""
+        return {
+            **self._cache.stats(),
+            "coalesced_requests": self._single_flight.coalesced,
+            "conditional_requests": self._conditional_requests,
+            "not_modified_responses": self._not_modified_responses,
+            "lock_versions_tracked": len(self._lock_versions),
+            "optimistic_updates": self._optimistic_updates,
+            "lock_conflicts": self._lock_conflicts,
+            "webhook_events": self._webhook_events
+        }
+
+    def get_connection_stats(self) -> Dict[str, Any]:
+        """Get connection pool configuration and utilisation."""
+        stats = {
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "in_flight_requests": self._in_flight_requests,
+            "peak_in_flight_requests": self._peak_in_flight_requests,
+            "total_requests": self._total_requests,
+            "retries": self._retries
+        }
+        
+        # httpx does not expose pool state publicly; read it from httpcore when available
+        pool = getattr(getattr(self.client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        if connections is not None:
+            try:
+                stats["open_connections"] = len(connections)
+                stats["idle_connections"] = sum(1 for c in connections if c.is_idle())
+            except Exception:
+                pass
+        
+        if stats["max_connections"]:
+            stats["utilisation"] = round(stats["in_flight_requests"] / stats["max_connections"], 3)
+        
+        return stats
+
+    def get_circuit_breaker_state(self) -> Dict[str, Any]:
+        """Get the circuit breaker state and counters."""
+        return self.circuit_breaker.stats()
+
+    def get_rate_limit_stats(self) -> Dict[str, Any]:
+        """Get client-side rate limiter queue depth and wait time metrics."""
+        return self.rate_limiter.stats()
+
+    def _invalidate_work_packages(self):
+        """Drop cached work packages and work package listings after a write."""
+        self._cache.invalidate_namespace("work_packages")
+        self._cache.invalidate_namespace("projects/work_packages")
+
+    def _invalidate_relations(self):
+        """Drop cached relation listings after a write."""
+        self._cache.invalidate_namespace("work_packages/relations")
+        self._cache.invalidate_namespace("relations")
 
     def _clear_cache_key(self, cache_key: str):
         """Clear specific cache key."""
-        if cache_key in self._cache:
-            del self._cache[cache_key]
-            logger.debug(f"Cleared cache key: {cache_key}")
+        self._cache.invalidate(cache_key)
 
     def _clear_all_cache(self):
         """Clear all cached data."""
         self._cache.clear()
         logger.debug("Cleared all cache data")
 
-    async def get_paginated_results(self, endpoint: str, params: Optional[Dict] = None) -> List[Dict]:
-        """Handle paginated responses from OpenProject API."""
-        all_results = []
-        page_size = 100  # OpenProject default
-        offset = 0
+    async def get_paginated_results(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        max_results: Optional[int] = None,
+        use_cache: bool = True
+    ) -> List[Dict]:
+        """Handle paginated responses from OpenProject API.
         
-        while True:
-            paginated_params = {"pageSize": page_size, "offset": offset}
-            if params:
-                paginated_params.update(params)
-                
-            response = await self._make_request("GET", endpoint, params=paginated_params)
+        The first page is fetched on its own to learn the collection ``total``;
+        the remaining pages are then requested concurrently (bounded by
+        ``settings.max_concurrent_requests``) and reassembled in offset order.
+        
+        Note that OpenProject's ``offset`` parameter is a 1-based page number,
+        not a row offset.
+        
+        Args:
+            endpoint: Collection endpoint relative to the API base
+            params: Additional query parameters (e.g. filters)
+            max_results: Hard cap on the number of rows collected
+                (defaults to ``settings.max_paginated_results``)
+            use_cache: Whether pages may be served from the cache
+        """
+        limit = max_results or settings.max_paginated_results
+        page_size = min(settings.pagination_size, limit)
+        
+        response = await self._fetch_page(endpoint, params, 1, page_size, use_cache)
+        all_results = response.get("_embedded", {}).get("elements", [])
+        
+        # The server may clamp pageSize, so trust the value it reports back
+        page_size = response.get("pageSize") or page_size
+        total = min(response.get("total", 0), limit)
+        
+        if not all_results or len(all_results) >= total:
+            return all_results[:limit]
+        
+        semaphore = asyncio.Semaphore(settings.max_concurrent_requests)
+        
+        async def fetch(offset: int) -> List[Dict]:
+            async with semaphore:
+                page = await self._fetch_page(endpoint, params, offset, page_size, use_cache)
+            return page.get("_embedded", {}).get("elements", [])
+        
+        page_count = math.ceil(total / page_size)
+        pages = await asyncio.gather(*(fetch(offset) for offset in range(2, page_count + 1)))
+        
+        for elements in pages:
+            all_results.extend(elements)
+        
+        return all_results[:limit]
+
+    async def get_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        offset: int,
+        limit: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Fetch rows [offset, offset + limit) of a collection and its total.
+        
+        OpenProject pages by page number, so the window is mapped onto pages
+        of ``limit`` rows. Following a returned cursor keeps the offset
+        aligned and costs a single request; an unaligned offset, or a server
+        that clamps pageSize, also fetches the page(s) after it.
+        
+        Args:
+            endpoint: Collection endpoint relative to the API base
+            params: Additional query parameters (e.g. filters)
+            offset: Zero-based index of the first row
+            limit: Maximum number of rows returned
+        
+        Returns:
+            Tuple of the rows and the collection total
+        """
+        page_size = limit
+        response = await self._fetch_page(endpoint, params, offset // page_size + 1, page_size)
+        
+        reported = response.get("pageSize") or page_size
+        if reported < page_size:
+            # The server clamped pageSize, so page numbers refer to smaller pages
+            page_size = reported
+            response = await self._fetch_page(endpoint, params, offset // page_size + 1, page_size)
+        
+        total = response.get("total", 0)
+        page_number = offset // page_size + 1
+        rows = response.get("_embedded", {}).get("elements", [])[offset % page_size:]
+        
+        while len(rows) < limit and page_number * page_size < total:
+            page_number += 1
+            response = await self._fetch_page(endpoint, params, page_number, page_size)
             elements = response.get("_embedded", {}).get("elements", [])
-            
             if not elements:
                 break
+            rows.extend(elements)
+        
+        return rows[:limit], total
+
+    async def iter_paginated(self, endpoint: str, params: Optional[Dict] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield elements of a paginated collection one page at a time.
+        
+        Unlike ``get_paginated_results`` this never materialises the whole
+        collection: only the page being consumed and the next page (prefetched
+        while the caller works through the current one) are held in memory.
+        Pages bypass the response cache and are never revalidated, so a stream
+        never fills the cache with pages that are unlikely to be read again.
+        
+        Args:
+            endpoint: Collection endpoint relative to the API base
+            params: Additional query parameters (e.g. filters)
+        """
+        page_size = settings.pagination_size
+        offset = 1
+        next_page = asyncio.ensure_future(self._fetch_page(endpoint, params, offset, page_size, use_cache=False, store=False))
+        
+        try:
+            while next_page is not None:
+                response = await next_page
+                next_page = None
                 
-            all_results.extend(elements)
-            
-            # Check if we have more pages
-            total = response.get("total", 0)
-            if offset + page_size >= total:
-                break
+                elements = response.get("_embedded", {}).get("elements", [])
+                if not elements:
+                    break
                 
-            offset += page_size
-        
-        return all_results
+                page_size = response.get("pageSize") or page_size
+                if offset * page_size < response.get("total", 0):
+                    offset += 1
+                    next_page = asyncio.ensure_future(self._fetch_page(endpoint, params, offset, page_size, use_cache=False, store=False))
+                
+                for element in elements:
+                    yield element
+        finally:
+            # Consumer stopped early (or failed): drop the prefetched page
+            if next_page is not None:
+                if not next_page.done():
+                    next_page.cancel()
+                elif not next_page.cancelled():
+                    next_page.exception()
+
+    async def _fetch_page(
+        self,
+        endpoint: str,
+        params: Optional[Dict],
+        offset: int,
+        page_size: int,
+        use_cache: bool = True,
+        store: bool = True
+    ) -> Dict[str, Any]:
+        """Fetch a single page of a collection endpoint."""
+        paginated_params = {"pageSize": page_size, "offset": offset}
+        if params:
+            paginated_params.update(params)
+        return await self._get(endpoint, paginated_params, use_cache=use_cache, store=store)
 
     async def close(self):
-        """Close the HTTP client."""
+        """Close the HTTP client and the persistent cache."""
         await self.client.aclose()
+        if self._persistent_cache is not None:
+            self._persistent_cache.close()
@@ -0,0 +1,580 @@
+"""Bounded caching layer for OpenProject API data."""
+import asyncio
+import os
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+import structlog
+
+from .serialization import dumps_bytes, encoded_form, loads
+
+logger = structlog.get_logger()
+
+# Sentinel returned by backends for absent or expired keys
+MISSING = object()
+
+
+def namespace_of(key: str) -> str:
+    """Return the namespace of a "<namespace>:<rest>" cache key."""
+    return key.split(":", 1)[0]
+
+
+class CacheBackend:
+    """Interface for cache storage backends.
+
+    Backends store JSON-serializable values with an absolute expiry
+    timestamp and are responsible for their own capacity limits. Every get
+    returns a fresh copy, so callers may modify what they receive.
+    """
+
+    def get(self, key: str) -> Any:
+        """Return the value for key, or MISSING if absent or expired."""
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, ttl: float, encoded: Optional[bytes] = None) -> None:
+        """Store value under key for ttl seconds.
+
+        encoded is the value's JSON encoding when the caller already has it
+        (e.g. a response body), which saves serializing the value again.
+        """
+        raise NotImplementedError
+
+    def delete(self, key: str) -> bool:
+        """Remove key, returning whether it was present."""
+        raise NotImplementedError
+
+    def delete_prefix(self, prefix: str) -> int:
+        """Remove all keys starting with prefix, returning how many were removed."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        raise NotImplementedError
+
+    def stats(self) -> Dict[str, Any]:
+        """Return backend counters."""
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-memory LRU backend bounded by entry count and encoded bytes.
+
+    Values are kept JSON-encoded, which is more compact than the decoded
+    objects, makes entry sizes exact and lets every get decode a private copy
+    that cannot corrupt the entry for later readers. For a page of 100 work
+    packages (about 175 KB encoded) the decoded objects take about 3.4 times
+    the memory, and decoding on a hit (about 0.5 ms with orjson) is several
+    times cheaper than deep-copying a stored object would be.
+    """
+
+    def __init__(self, max_entries: int = 1000, max_bytes: int = 32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # key -> (encoded value, expires_at); ordered from least to most recently used
+        self._entries: "OrderedDict[str, Tuple[bytes, float]]" = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+
+        encoded, expires_at = entry
+        if time.time() >= expires_at:
+            self._remove(key)
+            self.expirations += 1
+            return MISSING
+
+        self._entries.move_to_end(key)
+        return loads(encoded)
+
+    def set(self, key: str, value: Any, ttl: float, encoded: Optional[bytes] = None) -> None:
+        try:
+            encoded = encoded_form(value, encoded)
+        except (TypeError, ValueError):
+            logger.debug("Value not cacheable", key=key)
+            return
+        if len(encoded) > self.max_bytes:
+            logger.debug("Value too large to cache", key=key, size=len(encoded))
+            self.delete(key)
+            return
+
+        self.delete(key)
+        self._entries[key] = (encoded, time.time() + ttl)
+        self._bytes += len(encoded)
+
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
+
+    def _remove(self, key: str) -> None:
+        encoded, _ = self._entries.pop(key)
+        self._bytes -= len(encoded)
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Persistent backend storing JSON-encoded values in a SQLite file.
+
+    The database is opened on first use, so startup does not touch the disk,
+    and entries are read back on demand. The schema version is kept in
+    PRAGMA user_version; a file written by another version is wiped and
+    recreated. Size is bounded by entry count and encoded bytes, evicting the
+    least recently used rows. SQLite errors are logged and the backend is
+    disabled, so a broken cache file never breaks API calls.
+    """
+
+    # 2: project mirror snapshots hold WorkPackageRecord dicts instead of HAL
+    # 3: GET responses are stored as set_response entries, validators included
+    SCHEMA_VERSION = 3
+
+    def __init__(
+        self,
+        path: str,
+        table: str = "cache",
+        max_entries: int = 50000,
+        max_bytes: int = 256 * 1024 * 1024
+    ):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+        self._entries = 0
+        self._bytes = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.errors = 0
+
+    def get(self, key: str) -> Any:
+        entry = self.get_with_expiry(key)
+        return MISSING if entry is MISSING else entry[0]
+
+    def get_with_expiry(self, key: str) -> Any:
+        """Return (value, expires_at) for key, or MISSING if absent or expired."""
+        conn = self._connection()
+        if conn is None:
+            return MISSING
+        try:
+            row = conn.execute(f"SELECT value, expires_at FROM {self.table} WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return MISSING
+            now = time.time()
+            if now >= row[1]:
+                self._delete_rows(conn, "key = ?", (key,))
+                self.expirations += 1
+                return MISSING
+            conn.execute(f"UPDATE {self.table} SET accessed_at = ? WHERE key = ?", (now, key))
+            return loads(row[0]), row[1]
+        except (sqlite3.Error, ValueError) as e:
+            self._error("read", e)
+            return MISSING
+
+    def set(self, key: str, value: Any, ttl: float, encoded: Optional[bytes] = None) -> None:
+        self.set_until(key, value, time.time() + ttl, encoded)
+
+    def set_until(self, key: str, value: Any, expires_at: float, encoded: Optional[bytes] = None) -> None:
+        """Store value under key until the absolute expires_at timestamp."""
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            encoded = encoded_form(value, encoded)
+        except (TypeError, ValueError):
+            return
+        if len(encoded) > self.max_bytes:
+            self.delete(key)
+            return
+        try:
+            self._delete_rows(conn, "key = ?", (key,))
+            conn.execute(
+                f"INSERT INTO {self.table} (key, value, expires_at, accessed_at, size) VALUES (?, ?, ?, ?, ?)",
+                (key, encoded.decode(), expires_at, time.time(), len(encoded))
+            )
+            self._entries += 1
+            self._bytes += len(encoded)
+            self._evict(conn)
+        except sqlite3.Error as e:
+            self._error("write", e)
+
+    def delete(self, key: str) -> bool:
+        conn = self._connection()
+        if conn is None:
+            return False
+        try:
+            return self._delete_rows(conn, "key = ?", (key,)) > 0
+        except sqlite3.Error as e:
+            self._error("delete", e)
+            return False
+
+    def delete_prefix(self, prefix: str) -> int:
+        conn = self._connection()
+        if conn is None:
+            return 0
+        try:
+            # substr comparison avoids LIKE wildcards in keys
+            return self._delete_rows(conn, "substr(key, 1, ?) = ?", (len(prefix), prefix))
+        except sqlite3.Error as e:
+            self._error("delete", e)
+            return 0
+
+    def clear(self) -> None:
+        conn = self._connection()
+        if conn is None:
+            return
+        try:
+            conn.execute(f"DELETE FROM {self.table}")
+            self._entries = 0
+            self._bytes = 0
+        except sqlite3.Error as e:
+            self._error("clear", e)
+
+    def close(self) -> None:
+        """Close the database connection; the next call reopens it."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "path": self.path,
+            "open": self._conn is not None,
+            "disabled": self._disabled,
+            "entries": self._entries,
+            "bytes": self._bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "errors": self.errors
+        }
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is not None or self._disabled:
+            return self._conn
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != self.SCHEMA_VERSION:
+                # Unknown layout: drop every table rather than migrate cached data
+                tables = [row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")]
+                for table in tables:
+                    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+                conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+                if version:
+                    logger.info("Persistent cache schema changed; cache reset",
+                                path=self.path, old_version=version, version=self.SCHEMA_VERSION)
+
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table} ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {self.table}_accessed_at ON {self.table} (accessed_at)")
+            expired = conn.execute(f"DELETE FROM {self.table} WHERE expires_at <= ?", (time.time(),)).rowcount
+            self.expirations += max(expired, 0)
+            self._entries, self._bytes = conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()
+            self._conn = conn
+            logger.debug("Persistent cache opened", path=self.path, table=self.table, entries=self._entries)
+            self._evict(conn)
+        except (sqlite3.Error, OSError) as e:
+            self._error("open", e)
+        return self._conn
+
+    def _delete_rows(self, conn: sqlite3.Connection, where: str, args: Tuple) -> int:
+        count, size = conn.execute(
+            f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table} WHERE {where}", args
+        ).fetchone()
+        if count:
+            conn.execute(f"DELETE FROM {self.table} WHERE {where}", args)
+            self._entries -= count
+            self._bytes -= size
+        return count
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        while self._entries > self.max_entries or self._bytes > self.max_bytes:
+            # Evict in batches of roughly 10% to keep eviction amortized
+            batch = max(1, self._entries - self.max_entries, self.max_entries // 10)
+            removed = self._delete_rows(
+                conn,
+                f"key IN (SELECT key FROM {self.table} ORDER BY accessed_at LIMIT ?)",
+                (batch,)
+            )
+            if not removed:
+                break
+            self.evictions += removed
+
+    def _error(self, operation: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning("Persistent cache disabled after error", path=self.path, operation=operation, error=str(error))
+        self._disabled = True
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except sqlite3.Error:
+                pass
+            self._conn = None
+
+
+class TieredCacheBackend(CacheBackend):
+    """Memory backend in front of a persistent SQLite backend.
+
+    Reads hit memory first and fall back to disk, promoting disk hits into
+    memory for the rest of their lifetime. Writes go to both tiers, except
+    entries with a TTL below persist_min_ttl, which are too short-lived to be
+    useful after a restart and stay in memory only.
+    """
+
+    def __init__(self, memory: MemoryCacheBackend, persistent: SQLiteCacheBackend, persist_min_ttl: float = 60):
+        self.memory = memory
+        self.persistent = persistent
+        self.persist_min_ttl = persist_min_ttl
+        self.persistent_hits = 0
+
+    def get(self, key: str) -> Any:
+        value = self.memory.get(key)
+        if value is not MISSING:
+            return value
+
+        entry = self.persistent.get_with_expiry(key)
+        if entry is MISSING:
+            return MISSING
+        value, expires_at = entry
+        self.persistent_hits += 1
+        self.memory.set(key, value, expires_at - time.time())
+        return value
+
+    def set(self, key: str, value: Any, ttl: float, encoded: Optional[bytes] = None) -> None:
+        # Encode once for both tiers
+        try:
+            encoded = encoded_form(value, encoded)
+        except (TypeError, ValueError):
+            return
+        self.memory.set(key, value, ttl, encoded)
+        if ttl >= self.persist_min_ttl:
+            self.persistent.set(key, value, ttl, encoded)
+
+    def delete(self, key: str) -> bool:
+        in_memory = self.memory.delete(key)
+        on_disk = self.persistent.delete(key)
+        return in_memory or on_disk
+
+    def delete_prefix(self, prefix: str) -> int:
+        return max(self.memory.delete_prefix(prefix), self.persistent.delete_prefix(prefix))
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.persistent.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.memory.stats(),
+            "persistent_hits": self.persistent_hits,
+            "persistent": self.persistent.stats()
+        }
+
+
+class Cache:
+    """Cache facade applying per-namespace TTLs on top of a storage backend.
+
+    Keys have the form "<namespace>:<rest>"; a key without a colon is its
+    own namespace. Namespaces without an explicit TTL use default_ttl.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: float = 300,
+        ttls: Optional[Dict[str, float]] = None
+    ):
+        self.backend = backend or MemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def ttl_for(self, key: str) -> float:
+        """Return the TTL in seconds that applies to key."""
+        return self.ttls.get(namespace_of(key), self.default_ttl)
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for key, or MISSING."""
+        value = self.backend.get(key)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any, encoded: Optional[bytes] = None) -> None:
+        """Store value under key using its namespace TTL.
+
+        Pass encoded when the value's JSON encoding is at hand to skip
+        serializing it again.
+        """
+        ttl = self.ttl_for(key)
+        if ttl > 0:
+            self.backend.set(key, value, ttl, encoded)
+
+    def get_response(self, key: str) -> Any:
+        """Return the entry stored by set_response for key, or MISSING.
+
+        The entry holds the "body", any "etag"/"last_modified" validators and
+        "fresh", which tells whether it is still within its namespace TTL.
+        Only fresh entries count as hits.
+        """
+        entry = self.backend.get(key)
+        fresh = entry is not MISSING and time.time() < entry["fresh_until"]
+        if fresh:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if entry is not MISSING:
+            entry["fresh"] = fresh
+        return entry
+
+    def set_response(
+        self,
+        key: str,
+        body: Any,
+        validators: Optional[Dict[str, Optional[str]]] = None,
+        encoded: Optional[bytes] = None,
+        revalidate_for: float = 0
+    ) -> None:
+        """Store a response body, fresh for its namespace TTL.
+
+        With validators (ETag / Last-Modified) the entry is kept for up to
+        revalidate_for seconds after it goes stale, so the body stored once
+        serves both fresh hits and 304 Not Modified answers. encoded is the
+        body's JSON encoding, if at hand.
+        """
+        fresh_for = self.ttl_for(key)
+        validators = {name: value for name, value in (validators or {}).items() if value}
+        ttl = max(fresh_for, revalidate_for) if validators else fresh_for
+        if ttl <= 0:
+            return
+        head = {**validators, "fresh_until": time.time() + fresh_for}
+        if encoded is not None:
+            # Splice the raw body into the entry instead of encoding it again
+            encoded = dumps_bytes(head)[:-1] + b',"body":' + encoded + b"}"
+        self.backend.set(key, {**head, "body": body}, ttl, encoded)
+
+    def invalidate(self, key: str) -> None:
+        """Drop a single key."""
+        if self.backend.delete(key):
+            self.invalidations += 1
+            logger.debug("Cache key invalidated", key=key)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """Drop every key starting with prefix."""
+        removed = self.backend.delete_prefix(prefix)
+        if removed:
+            self.invalidations += removed
+            logger.debug("Cache prefix invalidated", prefix=prefix, removed=removed)
+
+    def invalidate_namespace(self, namespace: str) -> None:
+        """Drop every key in a namespace, including the bare namespace key."""
+        self.invalidate(namespace)
+        self.invalidate_prefix(f"{namespace}:")
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/invalidation counters merged with backend stats."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            **self.backend.stats()
+        }
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one in-flight call.
+
+    The first caller for a key starts the call; callers arriving while it is
+    still running await the same result (or exception) instead of starting
+    their own. The key is released as soon as the call completes.
+
+    Callers that joined share the first caller's result object unless a copy
+    function is given, in which case each of them receives its own copy.
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.coalesced = 0
+
+    async def do(
+        self,
+        key: Hashable,
+        func: Callable[[], Awaitable[Any]],
+        copy: Optional[Callable[[Any], Any]] = None
+    ) -> Any:
+        """Run func for key, or join the call already in flight for key."""
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._release(key, done))
+            # Shield so one cancelled caller does not cancel the call for the others
+            return await asyncio.shield(future)
+
+        self.coalesced += 1
+        logger.debug("Joined in-flight call", key=key)
+        result = await asyncio.shield(future)
+        return copy(result) if copy is not None else result
+
+    def in_flight(self) -> int:
+        """Return the number of calls currently in flight."""
+        return len(self._in_flight)
+
+    def _release(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        # Mark the exception retrieved in case every caller was cancelled
+        if not future.cancelled():
+            future.exception()
@@ -0,0 +1,131 @@
+"""Circuit breaker guarding calls to the OpenProject backend."""
+import time
+from typing import Any, Dict, NamedTuple, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class Permit(NamedTuple):
+    """An admitted call.
+
+    probe is set when the call was let through while half-open, and period
+    counts the breaker's state changes at admission.
+    """
+
+    probe: bool
+    period: int
+
+
+class CircuitBreaker:
+    """Fail fast while the backend is down.
+
+    The breaker starts closed. After failure_threshold consecutive failures
+    it opens and rejects calls for recovery_timeout seconds. It then turns
+    half-open and lets up to half_open_max_calls probe calls through: a
+    successful probe closes it again, a failed probe reopens it.
+    """
+
+    def __init__(self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at: Optional[float] = None
+        self._half_open_calls = 0
+        self._period = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        """Return the current state, moving from open to half-open once the timeout has passed."""
+        state = self._current_state()
+        if state != self._state:
+            self._transition(state)
+        return state
+
+    def allow_request(self) -> Optional[Permit]:
+        """Return a permit if a call may proceed, or None if it is rejected.
+
+        When half-open the permit reserves a probe slot. Every permit must be
+        passed back to record_success, record_failure or release, which free
+        the slot only for probes, so calls admitted while closed cannot make
+        room for extra probes.
+        """
+        state = self.state
+        if state == CLOSED:
+            return Permit(probe=False, period=self._period)
+        if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            return Permit(probe=True, period=self._period)
+        self.rejected += 1
+        return None
+
+    def record_success(self, permit: Permit) -> None:
+        """Record a successful call."""
+        self._release_probe(permit)
+        self._consecutive_failures = 0
+        if self._state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self, permit: Permit) -> None:
+        """Record a failed call, opening the breaker when the threshold is reached."""
+        self._release_probe(permit)
+        self._consecutive_failures += 1
+        if self._state == HALF_OPEN or (
+            self._state == CLOSED and self._consecutive_failures >= self.failure_threshold
+        ):
+            self._opened_at = time.monotonic()
+            self.times_opened += 1
+            self._transition(OPEN)
+
+    def release(self, permit: Permit) -> None:
+        """Release an allowed call that finished without a verdict (e.g. cancelled)."""
+        self._release_probe(permit)
+
+    def retry_after(self) -> float:
+        """Return seconds until an open breaker lets a probe through."""
+        if self._current_state() != OPEN:
+            return 0.0
+        return max(0.0, self.recovery_timeout - (time.monotonic() - self._opened_at))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the breaker state and counters.
+
+        Nothing is changed, so the snapshot may be taken from another thread
+        than the one the breaker's calls run on.
+        """
+        return {
+            "state": self._current_state(),
+            "consecutive_failures": self._consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "recovery_timeout": self.recovery_timeout,
+            "retry_after_seconds": round(self.retry_after(), 3),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected
+        }
+
+    def _current_state(self) -> str:
+        # The state as of now, without applying a pending open -> half-open move
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            return HALF_OPEN
+        return self._state
+
+    def _release_probe(self, permit: Permit) -> None:
+        # Slots are reset on every transition, so only probes of the current period hold one
+        if permit.probe and permit.period == self._period and self._half_open_calls > 0:
+            self._half_open_calls -= 1
+
+    def _transition(self, state: str) -> None:
+        logger.warning("Circuit breaker state changed", previous=self._state, state=state,
+                       consecutive_failures=self._consecutive_failures)
+        self._state = state
+        self._half_open_calls = 0
+        self._period += 1
@@ -0,0 +1,155 @@
+"""OpenProject API v3 filter and field selection helpers."""
+import json
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+
+# Maps the field names exposed by MCP tools to OpenProject work package properties
+WORK_PACKAGE_FIELDS = {
+    "id": "id",
+    "subject": "subject",
+    "description": "description",
+    "project_id": "project",
+    "start_date": "startDate",
+    "due_date": "dueDate",
+    "status": "status",
+    "type": "type",
+    "priority": "priority",
+    "assignee": "assignee",
+    "responsible": "responsible",
+    "estimated_hours": "estimatedTime",
+    "done_ratio": "percentageDone",
+    "lock_version": "lockVersion",
+    "created_at": "createdAt",
+    "updated_at": "updatedAt",
+}
+
+# Status scopes understood by OpenProject's status filter
+STATUS_SCOPE_OPERATORS = {
+    "open": "o",
+    "closed": "c",
+}
+
+
+def _filter(name: str, operator: str, values: Sequence[Any]) -> Dict[str, Any]:
+    """Build a single OpenProject filter entry."""
+    return {name: {"operator": operator, "values": [str(v) for v in values]}}
+
+
+def _range_filter(name: str, start: Optional[str], end: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Build an inclusive between filter; either bound may be left open."""
+    if not start and not end:
+        return None
+    return _filter(name, "<>d", [start or "", end or ""])
+
+
+def build_work_package_filters(
+    status_ids: Optional[Sequence[int]] = None,
+    status_scope: Optional[str] = None,
+    assignee_ids: Optional[Sequence[Union[int, str]]] = None,
+    type_ids: Optional[Sequence[int]] = None,
+    start_date_from: Optional[str] = None,
+    start_date_to: Optional[str] = None,
+    due_date_from: Optional[str] = None,
+    due_date_to: Optional[str] = None,
+    updated_since: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Translate work package search criteria into OpenProject filter JSON.
+
+    Args:
+        status_ids: Match any of these status IDs
+        status_scope: "open" or "closed" (ignored when status_ids is given)
+        assignee_ids: Match any of these user IDs ("me" for the API user)
+        type_ids: Match any of these type IDs
+        start_date_from: Earliest start date (YYYY-MM-DD)
+        start_date_to: Latest start date (YYYY-MM-DD)
+        due_date_from: Earliest due date (YYYY-MM-DD)
+        due_date_to: Latest due date (YYYY-MM-DD)
+        updated_since: Only work packages updated at or after this ISO 8601 timestamp
+
+    Returns:
+        List of filter objects suitable for the ``filters`` query parameter
+
+    Raises:
+        ValueError: If status_scope is not a known scope
+    """
+    filters = []
+
+    if status_ids:
+        filters.append(_filter("status", "=", status_ids))
+    elif status_scope:
+        operator = STATUS_SCOPE_OPERATORS.get(status_scope.lower())
+        if not operator:
+            raise ValueError(f"Invalid status scope. Must be one of: {', '.join(STATUS_SCOPE_OPERATORS)}")
+        filters.append(_filter("status", operator, []))
+
+    if assignee_ids:
+        filters.append(_filter("assignee", "=", assignee_ids))
+
+    if type_ids:
+        filters.append(_filter("type", "=", type_ids))
+
+    for name, start, end in (
+        ("startDate", start_date_from, start_date_to),
+        ("dueDate", due_date_from, due_date_to),
+        ("updatedAt", updated_since, None),
+    ):
+        range_filter = _range_filter(name, start, end)
+        if range_filter:
+            filters.append(range_filter)
+
+    return filters
+
+
+def build_select(fields: Sequence[str]) -> str:
+    """Build an OpenProject ``select`` projection for a collection request.
+
+    Args:
+        fields: Tool-level field names (keys of WORK_PACKAGE_FIELDS)
+
+    Returns:
+        Comma separated select expression, always including totals and IDs
+
+    Raises:
+        ValueError: If a field name is unknown
+    """
+    unknown = [f for f in fields if f not in WORK_PACKAGE_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(unknown)}. "
+            f"Available fields: {', '.join(WORK_PACKAGE_FIELDS)}"
+        )
+
+    properties = ["id"] + [WORK_PACKAGE_FIELDS[f] for f in fields if f != "id"]
+    return ",".join(["total", "count"] + [f"elements/{p}" for p in dict.fromkeys(properties)])
+
+
+def build_id_filter(work_package_ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """Build a /work_packages filter matching the given IDs."""
+    return [_filter("id", "=", work_package_ids)]
+
+
+def build_involved_filter(work_package_ids: Sequence[int]) -> List[Dict[str, Any]]:
+    """Build a /relations filter matching relations with either end in work_package_ids."""
+    return [_filter("involved", "=", work_package_ids)]
+
+
+def build_collection_params(
+    filters: Optional[List[Dict[str, Any]]] = None,
+    select: Optional[Sequence[str]] = None
+) -> Dict[str, str]:
+    """Build query parameters for a filtered, projected collection request.
+
+    Args:
+        filters: Filter objects from build_work_package_filters; an empty list
+            is sent as-is and replaces OpenProject's default "open only" filter
+        select: Tool-level field names to project
+
+    Returns:
+        Dict of query parameters (empty when nothing is requested)
+    """
+    params = {}
+    if filters is not None:
+        params["filters"] = json.dumps(filters, separators=(",", ":"))
+    if select:
+        params["select"] = build_select(select)
+    return params
@@ -0,0 +1,106 @@
+"""Dependency graph helpers for work package relations."""
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# Relation types stored in one canonical direction; the reverse type swaps from/to
+REVERSE_RELATION_TYPES = {
+    "precedes": "follows",
+    "blocked": "blocks",
+    "duplicated": "duplicates",
+    "partof": "includes",
+    "required": "requires",
+}
+
+# Relation types in canonical direction
+RELATION_TYPES = {"relates", "duplicates", "blocks", "follows", "includes", "requires"}
+
+# Canonical relation types that constrain scheduling, by which end comes first:
+# "A follows B" means B comes first, "A blocks B" means A comes first
+SUCCESSOR_FIRST_TYPES = {"follows"}
+PREDECESSOR_FIRST_TYPES = {"blocks"}
+
+Edge = Tuple[Hashable, Hashable]
+
+
+def normalize_relation(from_id: int, to_id: int, relation_type: str) -> Tuple[int, int, str]:
+    """Return a relation in canonical direction, e.g. "A precedes B" as "B follows A".
+
+    Symmetric types ("relates") are ordered by ID so both directions compare equal.
+    """
+    relation_type = relation_type.lower()
+    if relation_type in REVERSE_RELATION_TYPES:
+        return to_id, from_id, REVERSE_RELATION_TYPES[relation_type]
+    if relation_type == "relates" and from_id > to_id:
+        return to_id, from_id, relation_type
+    return from_id, to_id, relation_type
+
+
+def precedence_edge(from_id: int, to_id: int, relation_type: str) -> Optional[Tuple[int, int]]:
+    """Return (predecessor, successor) for a scheduling relation, or None for other types."""
+    from_id, to_id, relation_type = normalize_relation(from_id, to_id, relation_type)
+    if relation_type in SUCCESSOR_FIRST_TYPES:
+        return to_id, from_id
+    if relation_type in PREDECESSOR_FIRST_TYPES:
+        return from_id, to_id
+    return None
+
+
+def find_cycle(edges: Iterable[Edge]) -> Optional[List[Hashable]]:
+    """Return one cycle as a node path (first node repeated at the end), or None.
+
+    Uses an iterative depth-first search so long chains do not hit the
+    recursion limit.
+    """
+    adjacency: Dict[Hashable, List[Hashable]] = defaultdict(list)
+    for source, target in edges:
+        adjacency[source].append(target)
+
+    visiting, done = 1, 2
+    color: Dict[Hashable, int] = {}
+    for root in list(adjacency):
+        if root in color:
+            continue
+        color[root] = visiting
+        path = [root]
+        stack = [iter(adjacency[root])]
+        while stack:
+            target = next(stack[-1], None)
+            if target is None:
+                color[path.pop()] = done
+                stack.pop()
+                continue
+            state = color.get(target)
+            if state == visiting:
+                return path[path.index(target):] + [target]
+            if state is None:
+                color[target] = visiting
+                path.append(target)
+                stack.append(iter(adjacency.get(target, ())))
+    return None
+
+
+def topological_levels(edges: Sequence[Edge]) -> Dict[Hashable, int]:
+    """Return each node's depth in a DAG (0 for nodes without predecessors).
+
+    Raises:
+        ValueError: If the edges contain a cycle
+    """
+    successors: Dict[Hashable, List[Hashable]] = defaultdict(list)
+    indegree: Dict[Hashable, int] = defaultdict(int)
+    for source, target in edges:
+        successors[source].append(target)
+        indegree[target] += 1
+        indegree.setdefault(source, 0)
+
+    levels = {node: 0 for node, degree in indegree.items() if degree == 0}
+    queue = list(levels)
+    for node in queue:
+        for target in successors[node]:
+            levels[target] = max(levels.get(target, 0), levels[node] + 1)
+            indegree[target] -= 1
+            if indegree[target] == 0:
+                queue.append(target)
+
+    if any(indegree.values()):
+        raise ValueError("Dependency graph contains a cycle")
+    return levels
@@ -0,0 +1,131 @@
+"""Local mirror of a project's work packages kept current with updatedAt deltas."""
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from .records import WorkPackageRecord, normalize_work_package
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an OpenProject ISO 8601 timestamp (with or without fractional seconds)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class ProjectMirror:
+    """All work packages of one project (every status), keyed by ID.
+
+    Work packages are kept as compact WorkPackageRecords; the HAL dicts they
+    arrive as are dropped once normalized. The watermark is the newest updatedAt seen. After a full load, only
+    work packages updated at or after the watermark need to be fetched and
+    merged. Deletions and moves to another project never show up in such a
+    delta, so callers should run a full load periodically.
+    """
+
+    def __init__(self, project_id: int):
+        self.project_id = project_id
+        self._work_packages: Dict[int, WorkPackageRecord] = {}
+        self._watermark: Optional[datetime] = None
+        self.watermark: Optional[str] = None
+        self.full_sync_at: Optional[float] = None
+        self.full_syncs = 0
+        self.delta_syncs = 0
+        self.delta_rows = 0
+
+    def needs_full_sync(self, max_age: float) -> bool:
+        """Return whether the mirror was never loaded or its last full load is older than max_age seconds."""
+        return self.full_sync_at is None or time.time() - self.full_sync_at >= max_age
+
+    def load(self, work_packages: Iterable[Union[Dict[str, Any], WorkPackageRecord]]) -> None:
+        """Replace the mirror contents with a full load."""
+        self._work_packages = {}
+        self._watermark = None
+        self.watermark = None
+        for wp in work_packages:
+            self.upsert(wp)
+        self.full_sync_at = time.time()
+        self.full_syncs += 1
+
+    def merge(self, work_packages: Iterable[Union[Dict[str, Any], WorkPackageRecord]]) -> int:
+        """Merge a delta, returning the number of work packages applied."""
+        applied = 0
+        for wp in work_packages:
+            if self.upsert(wp):
+                applied += 1
+        self.delta_syncs += 1
+        self.delta_rows += applied
+        return applied
+
+    def upsert(self, wp: Union[Dict[str, Any], WorkPackageRecord], advance_watermark: bool = True) -> bool:
+        """Insert or replace a work package unless the stored copy is newer or identical.
+
+        Pass advance_watermark=False for work packages that did not come from
+        a sync (e.g. webhook payloads), so the next delta still covers changes
+        that happened before them.
+        """
+        record = normalize_work_package(wp)
+        if record.id is None:
+            return False
+
+        updated_at = parse_timestamp(record.updated_at)
+        current = self._work_packages.get(record.id)
+        if current == record:
+            # Deltas start at the watermark, so its work package always comes back
+            return False
+        if current is not None and updated_at is not None:
+            current_updated_at = parse_timestamp(current.updated_at)
+            if current_updated_at is not None and current_updated_at > updated_at:
+                return False
+
+        self._work_packages[record.id] = record
+        if advance_watermark and updated_at is not None and (self._watermark is None or updated_at > self._watermark):
+            self._watermark = updated_at
+            self.watermark = record.updated_at
+        return True
+
+    def remove(self, wp_id: int) -> bool:
+        """Drop a work package (e.g. after it was deleted), returning whether it was present."""
+        return self._work_packages.pop(wp_id, None) is not None
+
+    def get(self, wp_id: int) -> Optional[WorkPackageRecord]:
+        """Return the mirrored copy of a work package, or None."""
+        return self._work_packages.get(wp_id)
+
+    def work_packages(self) -> List[WorkPackageRecord]:
+        """Return the mirrored work packages ordered by ID."""
+        return [self._work_packages[wp_id] for wp_id in sorted(self._work_packages)]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of the mirror for persistent storage."""
+        return {
+            "project_id": self.project_id,
+            "full_sync_at": self.full_sync_at,
+            "work_packages": [record.to_dict() for record in self.work_packages()]
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Dict[str, Any]) -> "ProjectMirror":
+        """Rebuild a mirror from snapshot(), keeping the original full load time."""
+        mirror = cls(snapshot["project_id"])
+        for data in snapshot.get("work_packages", []):
+            mirror.upsert(WorkPackageRecord.from_dict(data))
+        mirror.full_sync_at = snapshot.get("full_sync_at")
+        return mirror
+
+    def __len__(self) -> int:
+        return len(self._work_packages)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size, watermark and sync counters."""
+        return {
+            "project_id": self.project_id,
+            "work_packages": len(self._work_packages),
+            "watermark": self.watermark,
+            "full_syncs": self.full_syncs,
+            "delta_syncs": self.delta_syncs,
+            "delta_rows": self.delta_rows
+        }
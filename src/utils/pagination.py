@@ -0,0 +1,69 @@
+"""Opaque cursors for paginated tool responses."""
+import base64
+import binascii
+import hashlib
+from typing import Any, Optional, Tuple
+
+from .serialization import dumps_bytes, loads
+
+# OpenProject's default upper bound for pageSize
+MAX_PAGE_LIMIT = 1000
+
+# Page size of listings that are bounded unless every row is asked for
+DEFAULT_PAGE_LIMIT = 100
+
+
+def query_fingerprint(*parts: Any) -> str:
+    """Return a short stable hash of the arguments that define a listing."""
+    return hashlib.sha256(dumps_bytes(parts)).hexdigest()[:16]
+
+
+def encode_cursor(offset: int, limit: int, fingerprint: str) -> str:
+    """Encode a row offset, page size and query fingerprint as an opaque cursor."""
+    payload = dumps_bytes({"o": offset, "l": limit, "q": fingerprint})
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, fingerprint: str) -> Tuple[int, int]:
+    """Decode a cursor into (offset, limit).
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different query
+    """
+    try:
+        payload = loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        offset, limit, cursor_fingerprint = payload["o"], payload["l"], payload["q"]
+    except (binascii.Error, ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(offset, int) or not isinstance(limit, int) or offset < 0 or limit <= 0:
+        raise ValueError("Invalid cursor")
+    if cursor_fingerprint != fingerprint:
+        raise ValueError("Cursor does not match these arguments; start again without a cursor")
+    return offset, limit
+
+
+def resolve_page(limit: Optional[int], cursor: Optional[str], fingerprint: str) -> Optional[Tuple[int, int]]:
+    """Turn limit/cursor tool arguments into (offset, limit).
+
+    Returns None when neither is given, i.e. the caller wants every row. An
+    explicit limit overrides the one stored in the cursor.
+
+    Raises:
+        ValueError: If limit is out of range or the cursor is invalid
+    """
+    if limit is not None and not 1 <= limit <= MAX_PAGE_LIMIT:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_LIMIT}")
+    if cursor:
+        offset, cursor_limit = decode_cursor(cursor, fingerprint)
+        return offset, limit or min(cursor_limit, MAX_PAGE_LIMIT)
+    if limit is None:
+        return None
+    return 0, limit
+
+
+def next_cursor(offset: int, limit: int, returned: int, total: int, fingerprint: str) -> Optional[str]:
+    """Return the cursor for the page after [offset, offset + returned), or None at the end."""
+    next_offset = offset + returned
+    if returned == 0 or next_offset >= total:
+        return None
+    return encode_cursor(next_offset, limit, fingerprint)
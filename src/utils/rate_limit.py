@@ -0,0 +1,125 @@
+"""Client-side rate limiting for outbound OpenProject API traffic."""
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# HTTP methods that only read data; everything else counts as a write
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at rate tokens per second.
+
+    Up to capacity tokens can accumulate, allowing short bursts. Waiters are
+    served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity and capacity >= 1 else max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting until one is available."""
+        # Holding the lock while sleeping keeps waiters in FIFO order
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def available(self) -> float:
+        """Return the number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class RateLimiter:
+    """Combine a global bucket with per-class (read/write) buckets.
+
+    A request takes a token from its class bucket first and then from the
+    global bucket. Either bucket may be omitted to leave that limit off.
+    """
+
+    def __init__(
+        self,
+        global_bucket: Optional[TokenBucket] = None,
+        read_bucket: Optional[TokenBucket] = None,
+        write_bucket: Optional[TokenBucket] = None
+    ):
+        self.global_bucket = global_bucket
+        self.buckets = {"read": read_bucket, "write": write_bucket}
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.acquired = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    @staticmethod
+    def classify(method: str) -> str:
+        """Return the endpoint class ("read" or "write") of an HTTP method."""
+        return "read" if method.upper() in READ_METHODS else "write"
+
+    @property
+    def enabled(self) -> bool:
+        """Return whether any limit is configured."""
+        return self.global_bucket is not None or any(self.buckets.values())
+
+    async def acquire(self, method: str) -> float:
+        """Wait until a request with this method may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        if not self.enabled:
+            return 0.0
+
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        start = time.monotonic()
+        try:
+            bucket = self.buckets.get(self.classify(method))
+            if bucket is not None:
+                await bucket.acquire()
+            if self.global_bucket is not None:
+                await self.global_bucket.acquire()
+        finally:
+            self.waiting -= 1
+
+        waited = time.monotonic() - start
+        self.acquired += 1
+        if waited >= 0.001:
+            self.delayed += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+            logger.debug("Request delayed by rate limiter", method=method, waited=round(waited, 3))
+        return waited
+
+    def stats(self) -> Dict[str, Any]:
+        """Return queue depth and wait time metrics."""
+        return {
+            "enabled": self.enabled,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "acquired": self.acquired,
+            "delayed": self.delayed,
+            "total_wait_seconds": round(self.total_wait, 3),
+            "max_wait_seconds": round(self.max_wait, 3),
+            "avg_wait_seconds": round(self.total_wait / self.delayed, 3) if self.delayed else 0.0
+        }
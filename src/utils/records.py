@@ -0,0 +1,135 @@
+"""Compact work package records normalized from HAL+JSON."""
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+
+def link_id(links: Dict[str, Any], name: str) -> Optional[int]:
+    """Return the numeric ID at the end of a HAL link's href, or None."""
+    href = (links.get(name) or {}).get("href")
+    if not href:
+        return None
+    tail = href.rstrip("/").rsplit("/", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+def link_title(links: Dict[str, Any], name: str) -> Optional[str]:
+    """Return the title of a HAL link, or None."""
+    return (links.get(name) or {}).get("title")
+
+
+def parse_iso_duration(duration: Optional[str]) -> Optional[float]:
+    """Parse ISO 8601 duration string to hours.
+
+    Examples:
+        PT16H -> 16.0
+        PT1H30M -> 1.5
+        PT30M -> 0.5
+    """
+    if not duration or not duration.startswith("PT"):
+        return None
+
+    hours = 0.0
+    remaining = duration[2:]  # Remove "PT" prefix
+
+    # Extract hours
+    if "H" in remaining:
+        h_idx = remaining.index("H")
+        hours += float(remaining[:h_idx])
+        remaining = remaining[h_idx + 1:]
+
+    # Extract minutes and convert to hours
+    if "M" in remaining:
+        m_idx = remaining.index("M")
+        minutes = float(remaining[:m_idx])
+        hours += minutes / 60.0
+
+    return hours
+
+
+class WorkPackageRecord:
+    """Work package reduced to the fields the tools use.
+
+    Link IDs and titles are extracted once instead of walking the _links
+    tree on every access, and __slots__ keeps each record far smaller than
+    the HAL dict it came from. Attribute names match the tool-level field
+    names of utils.filters.WORK_PACKAGE_FIELDS, plus the link IDs.
+    """
+
+    __slots__ = (
+        "id", "subject", "description", "project_id", "project", "status_id", "status",
+        "type_id", "type", "priority_id", "priority", "assignee_id", "assignee", "responsible",
+        "parent_id", "start_date", "due_date", "estimated_time", "done_ratio", "lock_version",
+        "created_at", "updated_at"
+    )
+
+    def __init__(self, **fields: Any):
+        for name in self.__slots__:
+            setattr(self, name, fields.get(name))
+
+    @classmethod
+    def from_hal(cls, wp: Dict[str, Any]) -> "WorkPackageRecord":
+        """Build a record from a HAL+JSON work package."""
+        links = wp.get("_links") or {}
+        description = wp.get("description")
+        return cls(
+            id=wp.get("id"),
+            subject=wp.get("subject"),
+            description=(description.get("raw") or "") if isinstance(description, dict) else "",
+            project_id=link_id(links, "project"),
+            project=link_title(links, "project"),
+            status_id=link_id(links, "status"),
+            status=link_title(links, "status"),
+            type_id=link_id(links, "type"),
+            type=link_title(links, "type"),
+            priority_id=link_id(links, "priority"),
+            priority=link_title(links, "priority"),
+            assignee_id=link_id(links, "assignee"),
+            assignee=link_title(links, "assignee"),
+            responsible=link_title(links, "responsible"),
+            parent_id=link_id(links, "parent"),
+            start_date=wp.get("startDate"),
+            due_date=wp.get("dueDate"),
+            estimated_time=wp.get("estimatedTime"),
+            # OpenProject 14 renamed doneRatio to percentageDone
+            done_ratio=wp["percentageDone"] if "percentageDone" in wp else wp.get("doneRatio"),
+            lock_version=wp.get("lockVersion"),
+            created_at=wp.get("createdAt"),
+            updated_at=wp.get("updatedAt")
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkPackageRecord":
+        """Rebuild a record from to_dict() output."""
+        return cls(**data)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the record's fields as a JSON-serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, WorkPackageRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __hash__(self) -> int:
+        # Equal records share an id, and the id never changes once built
+        return hash(self.id)
+
+    @property
+    def estimated_hours(self) -> Optional[float]:
+        """Return the estimated time in hours."""
+        return parse_iso_duration(self.estimated_time)
+
+    def __repr__(self) -> str:
+        return f"WorkPackageRecord(id={self.id!r}, subject={self.subject!r})"
+
+
+def normalize_work_package(wp: Union[Dict[str, Any], WorkPackageRecord]) -> WorkPackageRecord:
+    """Return the compact record for a HAL work package (records pass through)."""
+    if isinstance(wp, WorkPackageRecord):
+        return wp
+    return WorkPackageRecord.from_hal(wp)
+
+
+def normalize_work_packages(work_packages: Iterable[Union[Dict[str, Any], WorkPackageRecord]]) -> List[WorkPackageRecord]:
+    """Normalize a list of HAL work packages into records."""
+    return [normalize_work_package(wp) for wp in work_packages]
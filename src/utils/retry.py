@@ -0,0 +1,118 @@
+"""Retry policy for transient OpenProject API failures."""
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+# Methods that can be repeated without changing the result on the server
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Statuses that indicate a transient server-side condition
+RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Statuses whose Retry-After header is honoured
+RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date.
+
+    Returns the number of seconds to wait, or None if the header is absent
+    or malformed.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def cap_timeout(timeout: Optional[float], remaining: float) -> float:
+    """Return a per-attempt timeout that ends no later than the call's deadline.
+
+    A timeout of None (no limit) becomes the remaining time itself.
+    """
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+class RetryPolicy:
+    """Decide whether and when a failed request is retried.
+
+    Backoff is exponential with full jitter: the n-th retry waits a random
+    time between 0 and min(backoff_max, backoff_base * 2**n). A Retry-After
+    header on 429/503 responses replaces the computed backoff. No retry is
+    scheduled if it would end after the per-call deadline, and each attempt's
+    timeouts are capped at the time left (see cap_timeout), so the deadline
+    bounds the whole call rather than only the waits between attempts.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 10.0,
+        deadline: float = 60.0,
+        retry_methods: Iterable[str] = IDEMPOTENT_METHODS,
+        retry_statuses: Iterable[int] = RETRYABLE_STATUSES
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.retry_methods = frozenset(m.upper() for m in retry_methods)
+        self.retry_statuses = frozenset(retry_statuses)
+
+    def is_retryable_method(self, method: str) -> bool:
+        """Return whether requests with this method may be retried."""
+        return method.upper() in self.retry_methods
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        """Return whether a response status is worth retrying."""
+        return status_code in self.retry_statuses
+
+    def backoff(self, attempt: int) -> float:
+        """Return the jittered backoff before retry number attempt (0-based)."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        remaining: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """Return the delay before the next attempt, or None to stop retrying.
+
+        Args:
+            method: HTTP method of the failed request
+            attempt: Number of retries already made
+            remaining: Seconds left in the call's deadline budget
+            status_code: Response status, or None for a transport error
+            retry_after: Raw Retry-After header of the response, if any
+        """
+        if attempt >= self.max_retries or not self.is_retryable_method(method):
+            return None
+        if status_code is not None and not self.is_retryable_status(status_code):
+            return None
+
+        delay = None
+        if status_code in RETRY_AFTER_STATUSES:
+            delay = parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if delay >= remaining:
+            return None
+        return delay
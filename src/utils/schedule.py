@@ -0,0 +1,105 @@
+"""Critical path scheduling over work package dependencies."""
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+def compute_schedule(
+    durations: Sequence[int],
+    edges: Sequence[Tuple[int, int, int]],
+    earliest_starts: Optional[Sequence[int]] = None
+) -> Dict[str, Any]:
+    """Compute earliest/latest start and finish, slack and the critical path.
+
+    Nodes are integer indexes 0..n-1. Times are day offsets with exclusive
+    finish (a task starting at 0 with duration 3 finishes at 3). The graph
+    is stored as compact successor arrays and every pass is O(V + E).
+
+    Args:
+        durations: Duration of each node in days
+        edges: (predecessor, successor, lag) index triples; the successor
+            starts no earlier than the predecessor's finish plus lag
+        earliest_starts: Optional "start no earlier than" offset per node
+
+    Returns:
+        Dict with arrays "es", "ef", "ls", "lf", "slack", the "critical_path"
+        as a list of node indexes and the overall "project_finish"
+
+    Raises:
+        ValueError: If the edges contain a cycle
+    """
+    n = len(durations)
+    duration = array("l", durations)
+
+    # Successor lists in compressed sparse row form
+    offsets = array("l", [0] * (n + 1))
+    for pred, _, _ in edges:
+        offsets[pred + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("l", [0] * len(edges))
+    lags = array("l", [0] * len(edges))
+    fill = array("l", offsets[:n])
+    indegree = array("l", [0] * n)
+    for pred, succ, lag in edges:
+        targets[fill[pred]] = succ
+        lags[fill[pred]] = lag
+        fill[pred] += 1
+        indegree[succ] += 1
+
+    # Topological order (Kahn)
+    order = array("l", [i for i in range(n) if indegree[i] == 0])
+    head = 0
+    while head < len(order):
+        node = order[head]
+        head += 1
+        for k in range(offsets[node], offsets[node + 1]):
+            succ = targets[k]
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                order.append(succ)
+    if len(order) < n:
+        raise ValueError("Dependency graph contains a cycle")
+
+    # Forward pass; driver[i] is the predecessor that determines es[i]
+    es = array("l", earliest_starts) if earliest_starts is not None else array("l", [0] * n)
+    ef = array("l", [0] * n)
+    driver = array("l", [-1] * n)
+    for node in order:
+        ef[node] = es[node] + duration[node]
+        for k in range(offsets[node], offsets[node + 1]):
+            succ = targets[k]
+            start = ef[node] + lags[k]
+            if start > es[succ] or (start == es[succ] and driver[succ] == -1 and start > 0):
+                es[succ] = start
+                driver[succ] = node
+
+    project_finish = max(ef) if n else 0
+
+    # Backward pass
+    lf = array("l", [project_finish] * n)
+    ls = array("l", [0] * n)
+    for node in reversed(order):
+        for k in range(offsets[node], offsets[node + 1]):
+            lf[node] = min(lf[node], ls[targets[k]] - lags[k])
+        ls[node] = lf[node] - duration[node]
+
+    slack = array("l", (ls[i] - es[i] for i in range(n)))
+
+    # Trace the critical path back from the task finishing last
+    critical_path: List[int] = []
+    if n:
+        node = max(range(n), key=lambda i: (ef[i], -slack[i]))
+        while node != -1:
+            critical_path.append(node)
+            node = driver[node]
+        critical_path.reverse()
+
+    return {
+        "es": es,
+        "ef": ef,
+        "ls": ls,
+        "lf": lf,
+        "slack": slack,
+        "critical_path": critical_path,
+        "project_finish": project_finish
+    }
@@ -0,0 +1,88 @@
+"""JSON encoding and decoding with optional orjson acceleration."""
+import json
+from datetime import date
+from typing import Any, Optional, Union
+
+# orjson is several times faster than the stdlib codec (pip install orjson)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+ORJSON_AVAILABLE = orjson is not None
+
+# When enabled, dumps() ignores indent and emits the most compact encoding
+_compact_output = False
+
+
+def set_compact_output(enabled: bool) -> None:
+    """Switch every dumps() call to compact output (for machine clients)."""
+    global _compact_output
+    _compact_output = enabled
+
+
+def _default(obj: Any) -> Any:
+    """Encode dates as ISO 8601 and reject every other unsupported type."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Decode JSON text.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON bytes.
+
+    Raises:
+        TypeError: If obj contains a value other than JSON types and dates
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class EncodedDict(dict):
+    """A decoded JSON object that keeps the bytes it was decoded from.
+
+    Lets caches size and store a fresh API response without encoding it
+    again. The bytes go stale once the dict is modified, so read them right
+    after decoding.
+    """
+
+    __slots__ = ("encoded",)
+
+    def __init__(self, data: dict, encoded: bytes):
+        super().__init__(data)
+        self.encoded = encoded
+
+
+def encoded_form(obj: Any, encoded: Optional[bytes] = None) -> bytes:
+    """Return encoded if given, else obj's JSON encoding."""
+    return encoded if encoded is not None else dumps_bytes(obj)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """Encode obj as JSON text, like json.dumps(obj, indent=indent).
+
+    orjson only supports two-space indentation, which is what every caller
+    uses. With compact output enabled, indent is ignored and no whitespace
+    is emitted.
+    """
+    pretty = indent is not None and not _compact_output
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=_default, option=option).decode()
+    if pretty:
+        return json.dumps(obj, default=_default, indent=indent, ensure_ascii=False)
+    return json.dumps(obj, default=_default, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,179 @@
+"""Indexed in-process store of normalized work package records."""
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
+
+from .records import WorkPackageRecord, normalize_work_package
+
+
+class WorkPackageStore:
+    """Work package rows with secondary indexes for fast filtering.
+
+    Equality indexes map project, status, assignee and type IDs to sets of
+    work package IDs (unassigned work packages are indexed under None, and a
+    work package shared by several projects' collections under each of them). Due
+    dates are kept in a sorted list for range queries. A query intersects
+    the relevant index sets, smallest first, instead of scanning every row.
+
+    Records are stored as given, so rows passed in from a project mirror are
+    shared with it rather than copied; the store never modifies them.
+    """
+
+    INDEXED_FIELDS = ("project_id", "status_id", "assignee_id", "type_id")
+
+    def __init__(self):
+        self._rows: Dict[int, WorkPackageRecord] = {}
+        # A work package can belong to several projects' collections (a parent
+        # project's collection includes its subprojects' work packages)
+        self._projects: Dict[int, Set[int]] = {}
+        self._indexes: Dict[str, Dict[Any, Set[int]]] = {field: defaultdict(set) for field in self.INDEXED_FIELDS}
+        self._due_dates: List[Tuple[str, int]] = []
+
+    def upsert(self, wp: Union[Dict[str, Any], WorkPackageRecord], project_id: Optional[int] = None) -> WorkPackageRecord:
+        """Insert or replace a work package, updating every index.
+
+        project_id adds the row to that project's group (by default its own
+        project), so rows loaded from a project's collection, which can
+        include subproject work packages, are found under that project. A row
+        keeps the projects it was already grouped under.
+        """
+        row = normalize_work_package(wp)
+        projects = self._unindex(row.id) or set()
+        projects.add(project_id if project_id is not None else row.project_id)
+        self._index(row, projects)
+        return row
+
+    def _index(self, row: WorkPackageRecord, projects: Set[int]) -> None:
+        """Store a row grouped under projects and add it to every index."""
+        self._rows[row.id] = row
+        self._projects[row.id] = projects
+        for field in self.INDEXED_FIELDS:
+            for key in self._index_keys(row, field):
+                self._indexes[field][key].add(row.id)
+        if row.due_date:
+            insort(self._due_dates, (row.due_date, row.id))
+
+    def _unindex(self, wp_id: int) -> Optional[Set[int]]:
+        """Drop a row and its index entries, returning the projects it was grouped under."""
+        row = self._rows.pop(wp_id, None)
+        if row is None:
+            return None
+        for field in self.INDEXED_FIELDS:
+            index = self._indexes[field]
+            for key in self._index_keys(row, field):
+                index[key].discard(wp_id)
+                if not index[key]:
+                    del index[key]
+        if row.due_date:
+            position = bisect_left(self._due_dates, (row.due_date, wp_id))
+            if position < len(self._due_dates) and self._due_dates[position] == (row.due_date, wp_id):
+                del self._due_dates[position]
+        return self._projects.pop(wp_id)
+
+    def _index_keys(self, row: WorkPackageRecord, field: str) -> Iterable[Any]:
+        """Return the values a row is indexed under for field."""
+        if field == "project_id":
+            return self._projects[row.id]
+        return (getattr(row, field),)
+
+    def remove(self, wp_id: int) -> bool:
+        """Drop a work package from every project and index."""
+        return self._unindex(wp_id) is not None
+
+    def remove_from_project(self, wp_id: int, project_id: int) -> bool:
+        """Ungroup a work package from one project, dropping it once no project holds it."""
+        projects = self._projects.get(wp_id)
+        if not projects or project_id not in projects:
+            return False
+        row = self._rows[wp_id]
+        self._unindex(wp_id)
+        projects.discard(project_id)
+        if projects:
+            self._index(row, projects)
+        return True
+
+    def replace_project(
+        self,
+        project_id: int,
+        work_packages: Iterable[Union[Dict[str, Any], WorkPackageRecord]]
+    ) -> None:
+        """Replace every row of a project, dropping work packages no longer present."""
+        self.remove_project(project_id)
+        for wp in work_packages:
+            self.upsert(wp, project_id)
+
+    def remove_project(self, project_id: int) -> int:
+        """Ungroup every row of a project, returning how many were ungrouped.
+
+        Rows still grouped under another project stay in the store.
+        """
+        wp_ids = list(self._indexes["project_id"].get(project_id, ()))
+        for wp_id in wp_ids:
+            self.remove_from_project(wp_id, project_id)
+        return len(wp_ids)
+
+    def get(self, wp_id: int) -> Optional[WorkPackageRecord]:
+        """Return the row for a work package ID, or None."""
+        return self._rows.get(wp_id)
+
+    def projects_of(self, wp_id: int) -> FrozenSet[int]:
+        """Return the projects a work package is grouped under."""
+        return frozenset(self._projects.get(wp_id, ()))
+
+    def query(
+        self,
+        project_ids: Optional[Iterable[int]] = None,
+        status_ids: Optional[Iterable[int]] = None,
+        assignee_ids: Optional[Iterable[Optional[int]]] = None,
+        type_ids: Optional[Iterable[int]] = None,
+        exclude_status_ids: Optional[Iterable[int]] = None,
+        due_after: Optional[str] = None,
+        due_before: Optional[str] = None
+    ) -> List[WorkPackageRecord]:
+        """Return rows matching every given criterion, ordered by ID.
+
+        Each ID criterion matches any of its values; pass None in
+        assignee_ids to match unassigned work packages. Due date bounds are
+        inclusive ISO dates and exclude work packages without a due date.
+        """
+        candidates: List[Set[int]] = []
+        for field, values in (
+            ("project_id", project_ids),
+            ("status_id", status_ids),
+            ("assignee_id", assignee_ids),
+            ("type_id", type_ids),
+        ):
+            if values is not None:
+                index = self._indexes[field]
+                candidates.append(set().union(*(index.get(value, ()) for value in values)))
+        if due_after is not None or due_before is not None:
+            low = bisect_left(self._due_dates, (due_after,)) if due_after else 0
+            high = bisect_right(self._due_dates, (due_before, float("inf"))) if due_before else len(self._due_dates)
+            candidates.append({wp_id for _, wp_id in self._due_dates[low:high]})
+
+        if candidates:
+            candidates.sort(key=len)
+            matches = candidates[0].intersection(*candidates[1:])
+        else:
+            matches = set(self._rows)
+
+        if exclude_status_ids:
+            status_index = self._indexes["status_id"]
+            for status_id in exclude_status_ids:
+                matches -= status_index.get(status_id, set())
+
+        return [self._rows[wp_id] for wp_id in sorted(matches)]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return row and index sizes."""
+        return {
+            "work_packages": len(self._rows),
+            "projects": len(self._indexes["project_id"]),
+            "statuses": len(self._indexes["status_id"]),
+            "assignees": len(self._indexes["assignee_id"]),
+            "types": len(self._indexes["type_id"]),
+            "with_due_date": len(self._due_dates)
+        }
@@ -114,6 +114,60 @@ class TestAPICompliance:
         assert all_projects[-1]["id"] == 150
         assert mock_client._make_request.call_count == 2
 
+    @pytest.mark.asyncio
+    async def test_pagination_concurrent_pages(self, mock_client):
+        """Test remaining pages are fetched concurrently, kept in order and capped."""
+        import asyncio
+
+        in_flight = 0
+        peak_in_flight = 0
+
+        async def fake_request(method, endpoint, params=None):
+            nonlocal in_flight, peak_in_flight
+            offset = params["offset"]
+            in_flight += 1
+            peak_in_flight = max(peak_in_flight, in_flight)
+            # Later pages answer first to prove results are reassembled by offset
+            await asyncio.sleep(0.01 * (10 - offset))
+            in_flight -= 1
+            start = (offset - 1) * 10
+            return {
+                "_embedded": {"elements": [{"id": i} for i in range(start, start + 10)]},
+                "total": 100,
+                "pageSize": 10
+            }
+
+        mock_client._make_request.side_effect = fake_request
+
+        results = await mock_client.get_paginated_results("/work_packages", max_results=75)
+
+        assert [wp["id"] for wp in results] == list(range(75))
+        offsets = [call.kwargs["params"]["offset"] for call in mock_client._make_request.call_args_list]
+        assert sorted(offsets) == list(range(1, 9))
+        assert 1 < peak_in_flight <= 4
+
+    @pytest.mark.asyncio
+    async def test_iter_paginated_streams_pages(self, mock_client):
+        """Test iter_paginated yields elements page by page and stops early on demand."""
+        pages = [
+            {"_embedded": {"elements": [{"id": 1}, {"id": 2}]}, "total": 5, "pageSize": 2},
+            {"_embedded": {"elements": [{"id": 3}, {"id": 4}]}, "total": 5, "pageSize": 2},
+            {"_embedded": {"elements": [{"id": 5}]}, "total": 5, "pageSize": 2},
+        ]
+        mock_client._make_request.side_effect = lambda method, endpoint, params=None, **kwargs: pages[params["offset"] - 1]
+
+        ids = [wp["id"] async for wp in mock_client.iter_work_packages(1)]
+
+        assert ids == [1, 2, 3, 4, 5]
+        assert mock_client._make_request.call_count == 3
+        assert mock_client._make_request.call_args.args == ("GET", "/projects/1/work_packages")
+
+        # Breaking out after the first element never requests beyond the prefetched page
+        mock_client._make_request.reset_mock()
+        async for wp in mock_client.iter_paginated("/projects"):
+            break
+        assert mock_client._make_request.call_count <= 2
+
     @pytest.mark.asyncio
     async def test_user_management(self, mock_client):
         """Test user management endpoints."""
@@ -701,3 +755,900 @@ class TestUpdateWorkPackageStatusResponse:
 
             assert result_data["success"] is True
             assert result_data["work_package"]["is_closed"] is False
+
+
+class TestGetWorkPackagesFilters:
+    """Tests for server-side filtering and field selection in get_work_packages."""
+
+    SAMPLE_STATUSES = [
+        {"id": 1, "name": "New", "isClosed": False, "isDefault": True, "position": 1},
+        {"id": 2, "name": "In Progress", "isClosed": False, "isDefault": False, "position": 2},
+    ]
+
+    @pytest.mark.asyncio
+    async def test_filters_are_sent_to_client(self):
+        """Test status, assignee and date filters are translated for the API."""
+        from src.mcp_server import get_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_package_statuses = AsyncMock(return_value=self.SAMPLE_STATUSES)
+            mock_client.get_work_packages_page = AsyncMock(return_value=([], 0))
+
+            result = await get_work_packages.fn(
+                project_id=5,
+                status="in progress",
+                assignee="me",
+                due_date_to="2026-02-01"
+            )
+            result_data = json.loads(result)
+
+            assert result_data["success"] is True
+            filters = mock_client.get_work_packages_page.call_args.kwargs["filters"]
+            assert {"status": {"operator": "=", "values": ["2"]}} in filters
+            assert {"assignee": {"operator": "=", "values": ["me"]}} in filters
+            assert {"dueDate": {"operator": "<>d", "values": ["", "2026-02-01"]}} in filters
+
+    @pytest.mark.asyncio
+    async def test_open_scope_kept_with_other_filters(self):
+        """Test other filters keep OpenProject's default open-only scope unless status="all"."""
+        from src.mcp_server import get_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_page = AsyncMock(return_value=([], 0))
+
+            await get_work_packages.fn(project_id=5, assignee="me")
+            assert mock_client.get_work_packages_page.call_args.kwargs["filters"] == [
+                {"status": {"operator": "o", "values": []}},
+                {"assignee": {"operator": "=", "values": ["me"]}}
+            ]
+
+            await get_work_packages.fn(project_id=5)
+            assert mock_client.get_work_packages_page.call_args.kwargs["filters"] is None
+
+            await get_work_packages.fn(project_id=5, status="all", assignee="me")
+            assert mock_client.get_work_packages_page.call_args.kwargs["filters"] == [
+                {"assignee": {"operator": "=", "values": ["me"]}}
+            ]
+
+            await get_work_packages.fn(project_id=5, status="all")
+            assert mock_client.get_work_packages_page.call_args.kwargs["filters"] == []
+
+    @pytest.mark.asyncio
+    async def test_field_projection(self):
+        """Test only requested fields are selected and returned."""
+        from src.mcp_server import get_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_page = AsyncMock(return_value=([{
+                "id": 7,
+                "subject": "Ship it",
+                "_links": {"status": {"href": "/api/v3/statuses/1", "title": "New"}}
+            }], 1))
+
+            result = await get_work_packages.fn(project_id=5, status="open", fields=["subject", "status"])
+            result_data = json.loads(result)
+
+            assert mock_client.get_work_packages_page.call_args.kwargs["select"] == ["subject", "status"]
+            assert mock_client.get_work_packages_page.call_args.kwargs["filters"] == [
+                {"status": {"operator": "o", "values": []}}
+            ]
+            wp = result_data["work_packages"][0]
+            assert set(wp) == {"id", "subject", "status", "url"}
+            assert wp["status"] == "New"
+
+    @pytest.mark.asyncio
+    async def test_invalid_filter_values(self):
+        """Test invalid fields and assignees are rejected without an API call."""
+        from src.mcp_server import get_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_page = AsyncMock(return_value=([], 0))
+
+            result_data = json.loads(await get_work_packages.fn(project_id=5, fields=["colour"]))
+            assert result_data["success"] is False
+            assert "Unknown field" in result_data["error"]
+
+            result_data = json.loads(await get_work_packages.fn(project_id=5, assignee="bob"))
+            assert result_data["success"] is False
+
+            result_data = json.loads(await get_work_packages.fn(project_id=5, updated_since="yesterday"))
+            assert result_data["success"] is False
+
+            mock_client.get_work_packages_page.assert_not_called()
+
+
+class TestCreateWorkPackagesBatch:
+    """Tests for batch work package creation."""
+
+    @pytest.mark.asyncio
+    async def test_parents_created_before_children(self):
+        """Test parent_ref resolves to the created parent's ID."""
+        from src.models import WorkPackageBatchItem
+
+        client = OpenProjectClient()
+        created_ids = iter(range(100, 200))
+        posted = []
+
+        async def fake_request(method, url, **kwargs):
+            posted.append(kwargs["json"])
+            return {"id": next(created_ids), "subject": kwargs["json"]["subject"]}
+
+        client._make_request = AsyncMock(side_effect=fake_request)
+        items = [
+            WorkPackageBatchItem(project_id=1, subject="Task A", ref="a", parent_ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Phase", ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Task B", parent_ref="phase"),
+        ]
+
+        results = await client.create_work_packages_batch(items)
+
+        assert [r["index"] for r in results] == [0, 1, 2]
+        assert all(r["success"] for r in results)
+        assert posted[0]["subject"] == "Phase"
+        phase_id = results[1]["work_package"]["id"]
+        children = [p for p in posted if p["subject"] != "Phase"]
+        assert all(p["_links"]["parent"]["href"] == f"/api/v3/work_packages/{phase_id}" for p in children)
+
+    @pytest.mark.asyncio
+    async def test_children_of_failed_parent_are_skipped(self):
+        """Test a failed parent is reported and its children are not created."""
+        from src.models import WorkPackageBatchItem
+
+        client = OpenProjectClient()
+
+        async def fake_request(method, url, **kwargs):
+            if kwargs["json"]["subject"] == "Phase":
+                raise OpenProjectAPIError("Type is not set", status_code=422)
+            return {"id": 1, "subject": kwargs["json"]["subject"]}
+
+        client._make_request = AsyncMock(side_effect=fake_request)
+        items = [
+            WorkPackageBatchItem(project_id=1, subject="Phase", ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Child", parent_ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Independent"),
+        ]
+
+        results = await client.create_work_packages_batch(items)
+
+        assert results[0]["success"] is False
+        assert results[1]["success"] is False
+        assert "Skipped" in results[1]["error"]
+        assert results[2]["success"] is True
+        assert client._make_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_fail_single_items(self):
+        """Test a non-API error or a response without an ID fails only the affected items."""
+        from src.models import WorkPackageBatchItem
+
+        client = OpenProjectClient()
+
+        async def fake_request(method, url, **kwargs):
+            subject = kwargs["json"]["subject"]
+            if subject == "Broken":
+                raise RuntimeError("connection reset")
+            if subject == "Phase":
+                return {"subject": subject}
+            return {"id": 1, "subject": subject}
+
+        client._make_request = AsyncMock(side_effect=fake_request)
+        items = [
+            WorkPackageBatchItem(project_id=1, subject="Broken"),
+            WorkPackageBatchItem(project_id=1, subject="Phase", ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Child", parent_ref="phase"),
+            WorkPackageBatchItem(project_id=1, subject="Independent"),
+        ]
+
+        results = await client.create_work_packages_batch(items)
+
+        assert [r["success"] for r in results] == [False, True, False, True]
+        assert "connection reset" in results[0]["error"]
+        assert "Unexpected error" in results[2]["error"]
+
+    def test_invalid_references_rejected(self):
+        """Test duplicate, unknown and circular refs are rejected before any request."""
+        from src.models import WorkPackageBatchItem
+
+        def item(**kwargs):
+            return WorkPackageBatchItem(project_id=1, subject="x", **kwargs)
+
+        with pytest.raises(ValueError, match="Duplicate"):
+            OpenProjectClient._batch_creation_order([item(ref="a"), item(ref="a")])
+        with pytest.raises(ValueError, match="unknown"):
+            OpenProjectClient._batch_creation_order([item(parent_ref="missing")])
+        with pytest.raises(ValueError, match="Circular"):
+            OpenProjectClient._batch_creation_order([item(ref="a", parent_ref="b"), item(ref="b", parent_ref="a")])
+        with pytest.raises(ValidationError):
+            item(parent_id=5, parent_ref="a")
+
+    @pytest.mark.asyncio
+    async def test_tool_validates_whole_batch_first(self):
+        """Test one invalid item prevents the whole batch from being created."""
+        from src.mcp_server import create_work_packages_batch
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.create_work_packages_batch = AsyncMock(return_value=[])
+
+            result = await create_work_packages_batch.fn(work_packages=[
+                {"project_id": 1, "subject": "Fine"},
+                {"project_id": 1, "subject": "Bad dates", "start_date": "2026-02-10", "due_date": "2026-02-01"},
+            ])
+            result_data = json.loads(result)
+
+            assert result_data["success"] is False
+            assert result_data["details"][0]["index"] == 1
+            mock_client.create_work_packages_batch.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_reports_per_item_results(self):
+        """Test the tool summarises per-item outcomes."""
+        from src.mcp_server import create_work_packages_batch
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.create_work_packages_batch = AsyncMock(return_value=[
+                {"index": 0, "ref": "p", "success": True, "work_package": {"id": 10, "subject": "Phase", "_links": {}}},
+                {"index": 1, "ref": None, "success": True, "work_package": {
+                    "id": 11, "subject": "Task", "_links": {"parent": {"href": "/api/v3/work_packages/10"}}
+                }},
+            ])
+
+            result = await create_work_packages_batch.fn(work_packages=[
+                {"project_id": 1, "subject": "Phase", "ref": "p"},
+                {"project_id": 1, "subject": "Task", "parent_ref": "p"},
+            ])
+            result_data = json.loads(result)
+
+            assert result_data["success"] is True
+            assert result_data["created"] == 2
+            assert result_data["results"][1]["work_package"]["parent_id"] == 10
+
+
+class TestCreateRelationsBulk:
+    """Tests for bulk dependency creation."""
+
+    @staticmethod
+    def _relation(relation_id, from_id, to_id, relation_type):
+        return {
+            "id": relation_id,
+            "type": relation_type,
+            "_links": {
+                "from": {"href": f"/api/v3/work_packages/{from_id}"},
+                "to": {"href": f"/api/v3/work_packages/{to_id}"}
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_existing_and_duplicate_relations_skipped(self):
+        """Test existing relations are fetched once and not recreated."""
+        client = OpenProjectClient()
+        client.get_paginated_results = AsyncMock(return_value=[self._relation(9, 2, 1, "follows")])
+        client.create_work_package_relation = AsyncMock(side_effect=lambda f, t, *a: {"id": f * 10 + t})
+
+        results = await client.create_work_package_relations_bulk([
+            WorkPackageRelationCreateRequest(from_work_package_id=1, to_work_package_id=2, relation_type="precedes"),
+            WorkPackageRelationCreateRequest(from_work_package_id=3, to_work_package_id=2, relation_type="follows"),
+            WorkPackageRelationCreateRequest(from_work_package_id=2, to_work_package_id=3, relation_type="precedes"),
+        ])
+
+        assert [r["status"] for r in results] == ["exists", "created", "duplicate"]
+        assert client.get_paginated_results.call_count == 1
+        params = client.get_paginated_results.call_args.args[1]
+        assert json.loads(params["filters"]) == [{"involved": {"operator": "=", "values": ["1", "2", "3"]}}]
+        client.create_work_package_relation.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_unexpected_errors_fail_single_relations(self):
+        """Test a non-API error fails only its relation, not the rest of the batch."""
+        from src.openproject_client import CircuitOpenError
+
+        client = OpenProjectClient()
+        client.get_paginated_results = AsyncMock(return_value=[])
+
+        async def create(from_id, to_id, *args):
+            if from_id == 1:
+                raise KeyError("id")
+            if from_id == 2:
+                raise CircuitOpenError(30)
+            return {"id": from_id * 10 + to_id}
+
+        client.create_work_package_relation = AsyncMock(side_effect=create)
+
+        results = await client.create_work_package_relations_bulk([
+            WorkPackageRelationCreateRequest(from_work_package_id=1, to_work_package_id=4, relation_type="relates"),
+            WorkPackageRelationCreateRequest(from_work_package_id=2, to_work_package_id=4, relation_type="relates"),
+            WorkPackageRelationCreateRequest(from_work_package_id=3, to_work_package_id=4, relation_type="relates"),
+        ])
+
+        assert [r["status"] for r in results] == ["failed", "failed", "created"]
+        assert "Unexpected error" in results[0]["error"]
+        assert "circuit breaker" in results[1]["error"]
+
+    @pytest.mark.asyncio
+    async def test_cycle_with_existing_relations_rejected(self):
+        """Test a cycle through an existing relation fails before any POST."""
+        client = OpenProjectClient()
+        client.get_paginated_results = AsyncMock(return_value=[self._relation(9, 2, 1, "follows")])
+        client.create_work_package_relation = AsyncMock()
+
+        with pytest.raises(ValueError, match="cycle"):
+            await client.create_work_package_relations_bulk([
+                WorkPackageRelationCreateRequest(from_work_package_id=3, to_work_package_id=2, relation_type="follows"),
+                WorkPackageRelationCreateRequest(from_work_package_id=1, to_work_package_id=3, relation_type="follows"),
+            ])
+
+        client.create_work_package_relation.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_reports_counts(self):
+        """Test the tool validates input and summarises outcomes."""
+        from src.mcp_server import create_work_package_dependencies_batch
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.create_work_package_relations_bulk = AsyncMock(return_value=[
+                {"index": 0, "from_id": 2, "to_id": 1, "relation_type": "follows", "status": "created",
+                 "relation": {"id": 21}},
+                {"index": 1, "from_id": 3, "to_id": 2, "relation_type": "follows", "status": "failed",
+                 "error": "Circular dependency"},
+            ])
+
+            result_data = json.loads(await create_work_package_dependencies_batch.fn(relations=[
+                {"from_work_package_id": 2, "to_work_package_id": 1},
+                {"from_work_package_id": 3, "to_work_package_id": 2},
+            ]))
+
+            assert result_data["success"] is False
+            assert result_data["created"] == 1
+            assert result_data["failed"] == 1
+            assert result_data["results"][0]["relation_id"] == 21
+
+            invalid = json.loads(await create_work_package_dependencies_batch.fn(relations=[
+                {"from_work_package_id": 4, "to_work_package_id": 4}
+            ]))
+            assert invalid["success"] is False
+            assert invalid["details"][0]["index"] == 0
+
+
+class TestBulkUpdateWorkPackages:
+    """Tests for bulk work package updates."""
+
+    @pytest.mark.asyncio
+    async def test_lock_versions_fetched_once_and_conflicts_retried(self):
+        """Test one collection request for lockVersions and retry only on 409."""
+        client = OpenProjectClient()
+        lock_versions = {1: 3, 2: 7}
+        patched = []
+
+        async def fetch(endpoint, params, max_results=None, use_cache=True):
+            ids = json.loads(params["filters"])[0]["id"]["values"]
+            assert use_cache is False
+            assert params["select"] == "total,count,elements/id,elements/lockVersion"
+            return [{"id": int(i), "lockVersion": lock_versions[int(i)]} for i in ids if int(i) in lock_versions]
+
+        async def request(method, url, **kwargs):
+            wp_id = int(url.split("/")[-1])
+            patched.append((wp_id, kwargs["json"]["lockVersion"]))
+            if wp_id == 2 and kwargs["json"]["lockVersion"] == 7:
+                lock_versions[2] = 8  # someone else updated it meanwhile
+                raise OpenProjectAPIError("Conflict", status_code=409)
+            return {"id": wp_id, "lockVersion": kwargs["json"]["lockVersion"] + 1}
+
+        client.get_paginated_results = AsyncMock(side_effect=fetch)
+        client._make_request = AsyncMock(side_effect=request)
+
+        results = await client.bulk_update_work_packages({
+            1: {"subject": "A"}, 2: {"subject": "B"}, 3: {"subject": "C"}
+        })
+
+        assert [r["success"] for r in results] == [True, True, False]
+        assert results[1]["attempts"] == 2
+        assert "not found" in results[2]["error"]
+        assert sorted(patched) == [(1, 3), (2, 7), (2, 8)]
+        assert client.get_paginated_results.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_validates_before_updating(self):
+        """Test an invalid item rejects the whole batch."""
+        from src.mcp_server import bulk_update_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.bulk_update_work_packages = AsyncMock(return_value=[])
+
+            result_data = json.loads(await bulk_update_work_packages.fn(updates=[
+                {"work_package_id": 1, "subject": "Fine"},
+                {"work_package_id": 2, "due_date": "tomorrow"},
+                {"work_package_id": 3, "colour": "red"},
+            ]))
+
+            assert result_data["success"] is False
+            assert [d["index"] for d in result_data["details"]] == [1, 2]
+            mock_client.bulk_update_work_packages.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_tool_resolves_status_and_reports_results(self):
+        """Test status names are resolved and per-item results reported."""
+        from src.mcp_server import bulk_update_work_packages
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_package_statuses = AsyncMock(return_value=[{"id": 12, "name": "Closed"}])
+            mock_client.bulk_update_work_packages = AsyncMock(return_value=[
+                {"work_package_id": 1, "success": True, "attempts": 1,
+                 "work_package": {"id": 1, "subject": "A", "lockVersion": 4,
+                                  "_links": {"status": {"title": "Closed"}}}},
+                {"work_package_id": 2, "success": False, "attempts": 3, "error": "Conflict"},
+            ])
+
+            result_data = json.loads(await bulk_update_work_packages.fn(updates=[
+                {"work_package_id": 1, "status": "closed"},
+                {"work_package_id": 2, "status": "closed"},
+            ]))
+
+            payloads = mock_client.bulk_update_work_packages.call_args.args[0]
+            assert payloads[1] == {"_links": {"status": {"href": "/api/v3/statuses/12"}}}
+            assert result_data["updated"] == 1
+            assert result_data["results"][1]["error"] == "Conflict"
+
+
+class TestGetWorkPackagesByIds:
+    """Tests for the get_work_packages_by_ids multi-get tool."""
+
+    @staticmethod
+    def _work_package(wp_id):
+        return {
+            "id": wp_id,
+            "subject": f"Task {wp_id}",
+            "description": {"raw": ""},
+            "estimatedTime": "PT1H30M",
+            "_links": {
+                "project": {"href": "/api/v3/projects/5", "title": "Website Redesign"},
+                "status": {"href": "/api/v3/statuses/1", "title": "New"}
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_client_chunks_id_filter(self):
+        """Test long ID lists are split into chunked id-filter queries."""
+        client = OpenProjectClient()
+        client.get_paginated_results = AsyncMock(return_value=[])
+
+        await client.get_work_packages_by_ids(list(range(1, 251)))
+
+        assert client.get_paginated_results.call_count == 3
+        chunk_sizes = sorted(
+            len(json.loads(call.args[1]["filters"])[0]["id"]["values"])
+            for call in client.get_paginated_results.call_args_list
+        )
+        assert chunk_sizes == [50, 100, 100]
+
+    @pytest.mark.asyncio
+    async def test_details_in_order_with_missing_ids(self):
+        """Test details match get_work_package and missing IDs are reported."""
+        from src.mcp_server import get_work_packages_by_ids
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_by_ids = AsyncMock(
+                return_value=[self._work_package(3), self._work_package(1)]
+            )
+
+            result_data = json.loads(await get_work_packages_by_ids.fn(work_package_ids=[1, 2, 3, 1]))
+
+            mock_client.get_work_packages_by_ids.assert_awaited_once_with([1, 2, 3])
+            assert result_data["success"] is True
+            assert [wp["id"] for wp in result_data["work_packages"]] == [1, 3]
+            assert result_data["missing_ids"] == [2]
+            wp = result_data["work_packages"][0]
+            assert wp["project_id"] == 5
+            assert wp["estimated_hours"] == 1.5
+            assert wp["status"] == "New"
+
+    @pytest.mark.asyncio
+    async def test_invalid_ids_rejected(self):
+        """Test empty and non-positive ID lists are rejected."""
+        from src.mcp_server import get_work_packages_by_ids
+
+        assert json.loads(await get_work_packages_by_ids.fn(work_package_ids=[]))["success"] is False
+        assert json.loads(await get_work_packages_by_ids.fn(work_package_ids=[1, 0]))["success"] is False
+
+
+class TestDependencyGraph:
+    """Tests for dependency graph traversal."""
+
+    @staticmethod
+    def _relation(relation_id, from_id, to_id, relation_type):
+        return {
+            "id": relation_id,
+            "type": relation_type,
+            "_links": {
+                "from": {"href": f"/api/v3/work_packages/{from_id}"},
+                "to": {"href": f"/api/v3/work_packages/{to_id}"}
+            }
+        }
+
+    @pytest.mark.asyncio
+    async def test_bfs_respects_depth_and_fetches_each_node_once(self):
+        """Test BFS walks level by level up to max_depth."""
+        client = OpenProjectClient()
+        graph = {
+            1: [self._relation(10, 2, 1, "follows")],
+            2: [self._relation(10, 2, 1, "follows"), self._relation(11, 2, 3, "precedes")],
+            3: [self._relation(11, 2, 3, "precedes"), self._relation(12, 4, 3, "follows")],
+        }
+        client.get_work_package_relations = AsyncMock(side_effect=lambda wp_id: graph.get(wp_id, []))
+
+        result = await client.get_dependency_graph([1], max_depth=2)
+
+        assert result["depths"] == {1: 0, 2: 1, 3: 2}
+        assert result["relations"] == {10: (2, 1, "follows"), 11: (3, 2, "follows")}
+        assert sorted(c.args[0] for c in client.get_work_package_relations.call_args_list) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_project_graph_uses_collection_queries(self):
+        """Test project mode loads IDs of all statuses, then relations in bulk."""
+        client = OpenProjectClient()
+        client.get_paginated_results = AsyncMock(side_effect=[
+            [{"id": 1}, {"id": 2}],
+            [self._relation(10, 2, 1, "follows")],
+        ])
+
+        relations = await client.get_project_relations(5)
+
+        first_call = client.get_paginated_results.call_args_list[0]
+        assert first_call.args[0] == "/projects/5/work_packages"
+        assert first_call.args[1]["filters"] == "[]"
+        assert [r["id"] for r in relations] == [10]
+
+    @pytest.mark.asyncio
+    async def test_tool_builds_adjacency_with_metadata(self):
+        """Test the tool returns nodes, canonical edges and adjacency."""
+        from src.mcp_server import get_dependency_graph
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_project_relations = AsyncMock(return_value=[
+                self._relation(10, 1, 2, "precedes"),
+                self._relation(11, 2, 3, "relates"),
+            ])
+            mock_client.get_work_packages_by_ids = AsyncMock(return_value=[
+                {"id": 1, "subject": "Design", "_links": {"status": {"title": "New"}}},
+                {"id": 2, "subject": "Build", "_links": {"status": {"title": "New"}}},
+            ])
+
+            result_data = json.loads(await get_dependency_graph.fn(project_id=5, relation_types=["precedes"]))
+
+            assert result_data["success"] is True
+            assert result_data["edges"] == [{"relation_id": 10, "from_id": 2, "to_id": 1, "type": "follows"}]
+            assert result_data["adjacency"] == {"2": [1]}
+            assert {n["id"]: n["subject"] for n in result_data["nodes"]} == {2: "Build", 1: "Design"}
+
+            invalid = json.loads(await get_dependency_graph.fn(work_package_ids=[1], project_id=5))
+            assert invalid["success"] is False
+
+
+class TestComputeCriticalPath:
+    """Tests for the compute_critical_path tool."""
+
+    @pytest.mark.asyncio
+    async def test_critical_path_and_conflicts(self):
+        """Test schedule dates, the critical path, parent exclusion and date conflicts."""
+        from src.mcp_server import compute_critical_path
+
+        work_packages = [
+            {"id": 1, "subject": "Design", "startDate": "2026-03-02", "dueDate": "2026-03-04", "_links": {
+                "parent": {"href": "/api/v3/work_packages/9"}}},
+            {"id": 2, "subject": "Build", "startDate": "2026-03-04", "dueDate": "2026-03-08", "_links": {}},
+            {"id": 3, "subject": "Docs", "startDate": "2026-03-05", "dueDate": "2026-03-05", "_links": {}},
+            {"id": 9, "subject": "Phase", "startDate": "2026-03-02", "dueDate": "2026-03-20", "_links": {}},
+        ]
+        relations = [
+            {"id": 10, "type": "follows", "lag": 0, "_links": {
+                "from": {"href": "/api/v3/work_packages/2"}, "to": {"href": "/api/v3/work_packages/1"}}},
+            {"id": 11, "type": "precedes", "lag": 0, "_links": {
+                "from": {"href": "/api/v3/work_packages/1"}, "to": {"href": "/api/v3/work_packages/3"}}},
+        ]
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_all_project_work_packages = AsyncMock(return_value=work_packages)
+            mock_client.get_relations_involving = AsyncMock(return_value=relations)
+
+            result_data = json.loads(await compute_critical_path.fn(project_id=5))
+
+        assert result_data["success"] is True
+        assert [t["id"] for t in result_data["critical_path"]] == [1, 2]
+        tasks = {t["id"]: t for t in result_data["tasks"]}
+        assert 9 not in tasks
+        assert tasks[2]["earliest_start"] == "2026-03-05"
+        assert tasks[2]["earliest_finish"] == "2026-03-09"
+        assert tasks[3]["slack_days"] == 4
+        assert result_data["project_finish"] == "2026-03-09"
+        assert result_data["conflicts"] == [{
+            "predecessor_id": 1, "successor_id": 2, "lag": 0,
+            "predecessor_due_date": "2026-03-04", "successor_start_date": "2026-03-04",
+            "required_start_date": "2026-03-05", "days_early": 1
+        }]
+
+    @pytest.mark.asyncio
+    async def test_due_only_task_starts_before_due_date(self):
+        """Test a task with only a due date is scheduled to end on it, not start on it."""
+        from src.mcp_server import compute_critical_path
+
+        work_packages = [
+            {"id": 1, "subject": "Kickoff", "startDate": "2026-03-02", "dueDate": "2026-03-02", "_links": {}},
+            {"id": 2, "subject": "Review", "dueDate": "2026-03-10", "estimatedTime": "PT24H", "_links": {}},
+        ]
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_all_project_work_packages = AsyncMock(return_value=work_packages)
+            mock_client.get_relations_involving = AsyncMock(return_value=[])
+
+            result_data = json.loads(await compute_critical_path.fn(project_id=5))
+
+        tasks = {t["id"]: t for t in result_data["tasks"]}
+        assert tasks[2]["duration_days"] == 3
+        assert tasks[2]["earliest_start"] == "2026-03-08"
+        assert tasks[2]["earliest_finish"] == "2026-03-10"
+
+
+class TestProjectMirrorSync:
+    """Tests for incremental work package sync."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Create a client with mocked requests and statuses."""
+        client = OpenProjectClient()
+        client._make_request = AsyncMock()
+        client.get_work_package_statuses = AsyncMock(return_value=[
+            {"id": 1, "isClosed": False}, {"id": 2, "isClosed": True}
+        ])
+        return client
+
+    @staticmethod
+    def _collection(*work_packages):
+        return {"total": len(work_packages), "_embedded": {"elements": list(work_packages)}}
+
+    @staticmethod
+    def _wp(wp_id, updated_at, status_id=1):
+        return {"id": wp_id, "updatedAt": updated_at,
+                "_links": {"status": {"href": f"/api/v3/statuses/{status_id}"}}}
+
+    @pytest.mark.asyncio
+    async def test_full_load_then_delta(self, mock_client):
+        """Test one full load, then a delta request filtered by the updatedAt watermark."""
+        mock_client._make_request.side_effect = [
+            self._collection(self._wp(1, "2026-02-01T10:00:00Z"), self._wp(2, "2026-02-02T10:00:00Z", status_id=2)),
+            self._collection(self._wp(1, "2026-02-03T10:00:00Z", status_id=2), self._wp(3, "2026-02-03T11:00:00Z")),
+            self._collection(self._wp(3, "2026-02-03T11:00:00Z")),
+        ]
+
+        first = await mock_client.get_mirrored_work_packages(7)
+        second = await mock_client.get_mirrored_work_packages(7, include_closed=True)
+
+        assert [wp.id for wp in first] == [1]
+        assert [wp.id for wp in second] == [1, 2, 3]
+
+        full_params = mock_client._make_request.call_args_list[0].kwargs["params"]
+        assert full_params["filters"] == "[]"
+        delta_params = mock_client._make_request.call_args_list[1].kwargs["params"]
+        assert json.loads(delta_params["filters"]) == [
+            {"updatedAt": {"operator": "<>d", "values": ["2026-02-02T10:00:00Z", ""]}}
+        ]
+
+        # Work package 1 was closed in the delta; the next delta starts at the new watermark
+        assert [wp.id for wp in await mock_client.get_mirrored_work_packages(7)] == [3]
+        third_params = mock_client._make_request.call_args_list[2].kwargs["params"]
+        assert "2026-02-03T11:00:00Z" in third_params["filters"]
+        assert mock_client.get_mirror_stats()[0]["delta_syncs"] == 2
+
+    @pytest.mark.asyncio
+    async def test_mirror_disabled_falls_back_to_full_fetch(self, mock_client, monkeypatch):
+        """Test the mirror can be switched off in favour of a plain full fetch."""
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "mirror_enabled", False)
+        mock_client._make_request.return_value = self._collection(self._wp(1, "2026-02-01T10:00:00Z"))
+
+        result = await mock_client.get_mirrored_work_packages(7)
+
+        assert [wp.id for wp in result] == [1]
+        assert mock_client._make_request.call_args.kwargs["params"]["filters"] == "[]"
+        assert mock_client.get_mirror_stats() == []
+
+    @pytest.mark.asyncio
+    async def test_mirror_restored_after_restart(self, monkeypatch, tmp_path):
+        """Test a new client resumes from the persisted snapshot with a delta request."""
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "persistent_cache_path", str(tmp_path / "cache.sqlite3"))
+        first = OpenProjectClient()
+        first._make_request = AsyncMock(return_value=self._collection(self._wp(1, "2026-02-01T10:00:00Z")))
+        await first.get_mirrored_work_packages(7, include_closed=True)
+        await first.close()
+
+        restarted = OpenProjectClient()
+        restarted._make_request = AsyncMock(return_value=self._collection(self._wp(2, "2026-02-04T10:00:00Z")))
+        result = await restarted.get_mirrored_work_packages(7, include_closed=True)
+        await restarted.close()
+
+        assert [wp.id for wp in result] == [1, 2]
+        restarted._make_request.assert_called_once()
+        assert "2026-02-01T10:00:00Z" in restarted._make_request.call_args.kwargs["params"]["filters"]
+
+
+class TestWorkPackageStorePrompts:
+    """Tests for prompts answered from the indexed work package store."""
+
+    @staticmethod
+    def _wp(wp_id, status_id, assignee_id=None, due_date=None, description=""):
+        links = {"status": {"href": f"/api/v3/statuses/{status_id}", "title": {1: "New", 2: "In progress", 3: "Closed"}[status_id]}}
+        if assignee_id:
+            links["assignee"] = {"href": f"/api/v3/users/{assignee_id}", "title": f"User {assignee_id}"}
+        return {"id": wp_id, "subject": f"WP {wp_id}", "dueDate": due_date, "updatedAt": "2026-01-01T00:00:00Z",
+                "description": {"raw": description}, "_links": links}
+
+    @pytest.fixture
+    def client(self):
+        """Create a client serving two projects from mocked collections."""
+        client = OpenProjectClient()
+        collections = {
+            "/projects/1/work_packages": [self._wp(1, 1, 5, "2020-01-01", "x" * 300), self._wp(2, 3, 5), self._wp(3, 2)],
+            "/projects/2/work_packages": [self._wp(4, 2, 5, "2999-01-01")],
+        }
+
+        async def fake_request(method, endpoint, params=None, **kwargs):
+            if endpoint not in collections:
+                raise OpenProjectAPIError("Not found", status_code=404)
+            elements = collections[endpoint]
+            return {"total": len(elements), "_embedded": {"elements": elements}}
+
+        client._make_request = AsyncMock(side_effect=fake_request)
+        client.get_work_package_statuses = AsyncMock(return_value=[
+            {"id": 1, "name": "New", "isClosed": False},
+            {"id": 2, "name": "In progress", "isClosed": False},
+            {"id": 3, "name": "Closed", "isClosed": True},
+        ])
+        return client
+
+    @pytest.mark.asyncio
+    async def test_work_package_summary_filters_from_store(self, client):
+        """Test status filters are answered by index lookups over the project mirror."""
+        from src.mcp_server import work_package_summary
+
+        with patch('src.mcp_server.openproject_client', client):
+            open_data = await work_package_summary.fn(project_id=1)
+            closed_data = await work_package_summary.fn(project_id=1, status_filter="closed")
+            in_progress = await work_package_summary.fn(project_id=1, status_filter="in_progress")
+
+        open_rows = json.loads(open_data[0]["content"].split(":\n\n", 1)[1].split("\n\nPlease organize")[0])
+        assert [wp["id"] for wp in open_rows] == [1, 3]
+        assert open_rows[0]["description"] == "x" * 200 + "..."
+        assert open_rows[1]["assignee"] == "Unassigned"
+        assert '"id": 2' in closed_data[0]["content"] and '"id": 1' not in closed_data[0]["content"]
+        assert '"id": 3' in in_progress[0]["content"] and '"id": 1,' not in in_progress[0]["content"]
+        # One full load; later prompts only send delta requests
+        assert client.get_mirror_stats()[0]["full_syncs"] == 1
+
+    @pytest.mark.asyncio
+    async def test_team_workload_analysis_uses_indexes(self, client):
+        """Test workload counts across projects, skipping inaccessible ones."""
+        from src.mcp_server import team_workload_analysis
+
+        with patch('src.mcp_server.openproject_client', client):
+            messages = await team_workload_analysis.fn(project_ids=[1, 2, 99])
+
+        content = messages[0]["content"]
+        assert "Total work packages analyzed: 4" in content
+        workload = json.loads(content.split("Team workload breakdown:\n", 1)[1].split("\n\nPlease provide")[0])
+        assert workload["User 5"] == {
+            "total_tasks": 3, "in_progress": 1, "completed": 1, "overdue": 1, "projects": [1, 2]
+        }
+        assert workload["Unassigned"]["in_progress"] == 1
+
+    @pytest.mark.asyncio
+    async def test_team_workload_analysis_streams_without_mirrors(self, client, monkeypatch):
+        """Test the same workload is aggregated page by page when mirroring is off."""
+        from src.mcp_server import team_workload_analysis
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "mirror_enabled", False)
+        client.get_paginated_results = AsyncMock(side_effect=AssertionError("collection materialised"))
+        with patch('src.mcp_server.openproject_client', client):
+            messages = await team_workload_analysis.fn(project_ids=[1, 2, 99])
+
+        content = messages[0]["content"]
+        assert "Total work packages analyzed: 4" in content
+        workload = json.loads(content.split("Team workload breakdown:\n", 1)[1].split("\n\nPlease provide")[0])
+        assert workload["User 5"] == {
+            "total_tasks": 3, "in_progress": 1, "completed": 1, "overdue": 1, "projects": [1, 2]
+        }
+        assert len(client.work_package_store) == 0
+        assert all(call.kwargs["params"]["pageSize"] for call in client._make_request.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_workload_beyond_store_budget_and_shared_rows(self, client, monkeypatch):
+        """Test projects beyond the mirror budget are still counted, and shared rows only once."""
+        from src.mcp_server import team_workload_analysis
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "mirror_max_projects", 1)
+        # Project 1 is the parent of project 2, so its collection includes work package 4
+        collections = {
+            "/projects/1/work_packages": [self._wp(1, 1, 5, "2020-01-01"), self._wp(4, 2, 5, "2999-01-01")],
+            "/projects/2/work_packages": [self._wp(4, 2, 5, "2999-01-01")],
+        }
+
+        async def fake_request(method, endpoint, params=None):
+            elements = collections[endpoint]
+            return {"total": len(elements), "_embedded": {"elements": elements}}
+
+        client._make_request = AsyncMock(side_effect=fake_request)
+        with patch('src.mcp_server.openproject_client', client):
+            messages = await team_workload_analysis.fn(project_ids=[1, 2])
+
+        content = messages[0]["content"]
+        assert "Total work packages analyzed: 2" in content
+        workload = json.loads(content.split("Team workload breakdown:\n", 1)[1].split("\n\nPlease provide")[0])
+        assert workload["User 5"]["projects"] == [1, 2]
+        assert [wp.id for wp in await client.query_work_packages([1, 2])] == [1, 4]
+        assert len(client._mirrors) == 1
+
+
+class TestProjectLookup:
+    """Tests for direct project lookups."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client answering project and work package requests by URL."""
+        client = OpenProjectClient()
+        client.get_work_package_statuses = AsyncMock(return_value=[{"id": 1, "isClosed": False}])
+
+        async def request(method, url, **kwargs):
+            if url == "/projects/5":
+                return {"id": 5, "name": "Apollo", "identifier": "apollo", "description": {"raw": "Moon"}}
+            if url == "/projects/5/work_packages":
+                return {"total": 1, "_embedded": {"elements": [{
+                    "id": 1, "updatedAt": "2026-02-01T10:00:00Z",
+                    "_links": {"status": {"href": "/api/v3/statuses/1", "title": "New"}}
+                }]}}
+            raise OpenProjectAPIError("Not found", status_code=404)
+
+        client._make_request = AsyncMock(side_effect=request)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_get_project_by_id_cached_and_missing(self, client):
+        """Test a lookup is cached and a 404 yields None, while other errors propagate."""
+        assert (await client.get_project_by_id(5))["name"] == "Apollo"
+        assert (await client.get_project_by_id(5))["name"] == "Apollo"
+        assert client._make_request.call_count == 1
+        assert await client.get_project_by_id(9) is None
+
+        client._make_request.side_effect = OpenProjectAPIError("Server error", status_code=500)
+        with pytest.raises(OpenProjectAPIError):
+            await client.get_project_by_id(6)
+
+    @pytest.mark.asyncio
+    async def test_project_summary_skips_project_list(self, client):
+        """Test the summary fetches only the project and its work packages."""
+        from src.mcp_server import get_project_summary
+
+        with patch('src.mcp_server.openproject_client', client):
+            found = json.loads(await get_project_summary.fn(project_id=5))
+            missing = json.loads(await get_project_summary.fn(project_id=9))
+
+        assert found["project"]["name"] == "Apollo"
+        assert found["summary"]["status_breakdown"] == {"New": 1}
+        assert missing == {"success": False, "error": "Project with ID 9 not found"}
+        urls = [call.args[1] for call in client._make_request.call_args_list]
+        assert "/projects" not in urls
+
+    @pytest.mark.asyncio
+    async def test_project_resource_counts_every_work_package(self):
+        """Test the project resource counts the mirrored work packages, not one API page."""
+        from src.mcp_server import project_resource
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_project_by_id = AsyncMock(return_value={"id": 5, "name": "Apollo", "identifier": "apollo"})
+            mock_client.get_mirrored_work_packages = AsyncMock(return_value=[object()] * 250)
+
+            result_data = json.loads(await project_resource.fn(project_id=5))
+            mock_client.get_work_packages.assert_not_called()
+
+        assert result_data["project"]["name"] == "Apollo"
+        assert result_data["work_packages_count"] == 250
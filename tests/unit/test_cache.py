@@ -0,0 +1,310 @@
+"""Unit tests for the bounded cache layer."""
+import asyncio
+import sqlite3
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.utils.cache import (
+    MISSING, Cache, MemoryCacheBackend, SingleFlight, SQLiteCacheBackend, TieredCacheBackend
+)
+
+
+class TestMemoryCacheBackend:
+    """Test LRU, expiry and size limits of the in-memory backend."""
+
+    def test_lru_eviction_by_entry_count(self):
+        """Test least recently used entries are evicted first."""
+        backend = MemoryCacheBackend(max_entries=2)
+        backend.set("a", 1, ttl=60)
+        backend.set("b", 2, ttl=60)
+        backend.get("a")  # "b" becomes least recently used
+        backend.set("c", 3, ttl=60)
+
+        assert backend.get("b") is MISSING
+        assert backend.get("a") == 1
+        assert backend.get("c") == 3
+        assert backend.stats()["evictions"] == 1
+
+    def test_eviction_by_bytes(self):
+        """Test entries are evicted to stay under the byte budget."""
+        backend = MemoryCacheBackend(max_entries=100, max_bytes=30)
+        backend.set("a", "x" * 10, ttl=60)
+        backend.set("b", "y" * 10, ttl=60)
+        backend.set("c", "z" * 10, ttl=60)
+
+        assert backend.get("a") is MISSING
+        assert backend.stats()["bytes"] <= 30
+
+        # Values larger than the whole budget are never stored
+        backend.set("huge", "w" * 100, ttl=60)
+        assert backend.get("huge") is MISSING
+
+    def test_expiry(self):
+        """Test entries expire after their TTL."""
+        backend = MemoryCacheBackend()
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            backend.set("a", 1, ttl=10)
+        with patch("src.utils.cache.time.time", return_value=1009.0):
+            assert backend.get("a") == 1
+        with patch("src.utils.cache.time.time", return_value=1010.0):
+            assert backend.get("a") is MISSING
+        assert backend.stats()["expirations"] == 1
+
+    def test_values_are_copied_and_sized_from_encoding(self):
+        """Test readers get private copies and given encodings set the entry size."""
+        backend = MemoryCacheBackend()
+        backend.set("a", {"elements": [1]}, ttl=60, encoded=b'{"elements":[1]}')
+        assert backend.stats()["bytes"] == len(b'{"elements":[1]}')
+
+        backend.get("a")["elements"].append(2)
+        assert backend.get("a") == {"elements": [1]}
+
+
+class TestCache:
+    """Test namespaced TTLs, invalidation and counters."""
+
+    def test_namespace_ttls(self):
+        """Test TTL is chosen by key namespace."""
+        cache = Cache(default_ttl=300, ttls={"statuses": 3600, "work_packages": 30})
+
+        assert cache.ttl_for("statuses") == 3600
+        assert cache.ttl_for("work_packages:/work_packages/1") == 30
+        assert cache.ttl_for("users:/users") == 300
+
+    def test_zero_ttl_disables_caching(self):
+        """Test a zero TTL namespace is never stored."""
+        cache = Cache(ttls={"work_packages": 0})
+        cache.set("work_packages:/work_packages/1", {"id": 1})
+
+        assert cache.get("work_packages:/work_packages/1") is MISSING
+
+    def test_invalidation_and_stats(self):
+        """Test namespace invalidation and hit/miss counters."""
+        cache = Cache()
+        cache.set("projects:/projects", [1])
+        cache.set("projects:/projects/2", {"id": 2})
+        cache.set("users:/users", [3])
+
+        assert cache.get("projects:/projects") == [1]
+        cache.invalidate_namespace("projects")
+        assert cache.get("projects:/projects") is MISSING
+        assert cache.get("projects:/projects/2") is MISSING
+        assert cache.get("users:/users") == [3]
+
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+        assert stats["invalidations"] == 2
+        assert stats["entries"] == 1
+
+    def test_response_entries(self):
+        """Test responses with validators outlive their TTL as stale entries, spliced from the raw body."""
+        cache = Cache(ttls={"work_packages": 30})
+        key = "work_packages:/work_packages/1"
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            cache.set_response(key, {"id": 1}, {"etag": '"v1"', "last_modified": None},
+                               encoded=b'{"id":1}', revalidate_for=3600)
+            cache.set_response("work_packages:/work_packages/2", {"id": 2})
+
+        with patch("src.utils.cache.time.time", return_value=1010.0):
+            entry = cache.get_response(key)
+            assert entry["fresh"] is True
+            assert entry["body"] == {"id": 1}
+
+        with patch("src.utils.cache.time.time", return_value=2000.0):
+            entry = cache.get_response(key)
+            assert entry["fresh"] is False
+            assert entry["etag"] == '"v1"'
+            assert "last_modified" not in entry
+            # Without validators the entry is gone once stale
+            assert cache.get_response("work_packages:/work_packages/2") is MISSING
+
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+
+class TestSQLiteCacheBackend:
+    """Test the persistent SQLite backend."""
+
+    def test_survives_reopen_and_opens_lazily(self, tmp_path):
+        """Test entries written by one instance are read back by a new one."""
+        path = str(tmp_path / "data" / "cache.sqlite3")
+        backend = SQLiteCacheBackend(path)
+        assert backend.stats()["open"] is False
+
+        backend.set("projects:/projects", {"elements": [1, 2]}, ttl=60)
+        backend.set("projects:/projects/1", {"id": 1}, ttl=60)
+        backend.close()
+
+        reopened = SQLiteCacheBackend(path)
+        assert reopened.get("projects:/projects") == {"elements": [1, 2]}
+        assert reopened.stats()["entries"] == 2
+        assert reopened.delete_prefix("projects:") == 2
+        assert reopened.get("projects:/projects/1") is MISSING
+
+    def test_expiry_and_eviction(self, tmp_path):
+        """Test expired rows are dropped and least recently used rows evicted."""
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.sqlite3"), max_entries=2)
+        with patch("src.utils.cache.time.time", return_value=1000.0):
+            backend.set("a", 1, ttl=10)
+            backend.set("b", 2, ttl=100)
+        with patch("src.utils.cache.time.time", return_value=1005.0):
+            assert backend.get("a") == 1  # "b" becomes least recently used
+            backend.set("c", 3, ttl=100)
+        with patch("src.utils.cache.time.time", return_value=1010.0):
+            assert backend.get("b") is MISSING
+            assert backend.get("a") is MISSING
+            assert backend.get("c") == 3
+
+        stats = backend.stats()
+        assert stats["evictions"] == 1
+        assert stats["expirations"] == 1
+        assert stats["entries"] == 1
+
+    def test_schema_version_mismatch_resets(self, tmp_path):
+        """Test a file from another schema version is wiped instead of misread."""
+        path = str(tmp_path / "cache.sqlite3")
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE cache (key TEXT, payload BLOB)")
+        conn.execute("INSERT INTO cache VALUES ('a', 'old')")
+        conn.execute("PRAGMA user_version = 99")
+        conn.commit()
+        conn.close()
+
+        backend = SQLiteCacheBackend(path)
+        assert backend.get("a") is MISSING
+        backend.set("a", 1, ttl=60)
+        assert backend.get("a") == 1
+        assert sqlite3.connect(path).execute("PRAGMA user_version").fetchone()[0] == SQLiteCacheBackend.SCHEMA_VERSION
+
+    def test_unusable_path_disables_backend(self, tmp_path):
+        """Test an unwritable location degrades to cache misses."""
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        backend = SQLiteCacheBackend(str(blocker / "cache.sqlite3"))
+
+        backend.set("a", 1, ttl=60)
+        assert backend.get("a") is MISSING
+        assert backend.stats()["disabled"] is True
+
+
+class TestTieredCacheBackend:
+    """Test the memory tier in front of the persistent tier."""
+
+    def test_warm_restart_promotes_disk_hits(self, tmp_path):
+        """Test a fresh memory tier is filled from disk and short TTLs stay in memory."""
+        path = str(tmp_path / "cache.sqlite3")
+        backend = TieredCacheBackend(MemoryCacheBackend(), SQLiteCacheBackend(path), persist_min_ttl=60)
+        backend.set("statuses", [1, 2], ttl=3600)
+        backend.set("work_packages:/work_packages/1", {"id": 1}, ttl=30)
+        backend.persistent.close()
+
+        restarted = TieredCacheBackend(MemoryCacheBackend(), SQLiteCacheBackend(path), persist_min_ttl=60)
+        assert restarted.get("statuses") == [1, 2]
+        assert restarted.memory.get("statuses") == [1, 2]
+        assert restarted.get("work_packages:/work_packages/1") is MISSING
+        assert restarted.stats()["persistent_hits"] == 1
+
+        restarted.delete("statuses")
+        assert restarted.persistent.get("statuses") is MISSING
+
+
+class TestClientCaching:
+    """Test the client's read paths go through the cache."""
+
+    @pytest.mark.asyncio
+    async def test_reads_cached_and_writes_invalidate(self):
+        """Test work package reads are cached until a write invalidates them."""
+        from src.openproject_client import OpenProjectClient
+
+        client = OpenProjectClient()
+        client._make_request = AsyncMock(return_value={"id": 5, "lockVersion": 1})
+
+        await client.get_work_package_by_id(5)
+        await client.get_work_package_by_id(5)
+        assert client._make_request.call_count == 1
+
+        await client.update_work_package(5, {"subject": "New", "lockVersion": 1})
+        await client.get_work_package_by_id(5)
+        assert client._make_request.call_count == 3
+
+        stats = client.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["invalidations"] >= 1
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent identical requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_result(self):
+        """Test concurrent callers for one key trigger a single call."""
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"value": calls}
+
+        results = await asyncio.gather(*(single_flight.do("k", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(r == {"value": 1} for r in results)
+        assert single_flight.coalesced == 4
+        assert single_flight.in_flight() == 0
+
+        # Once completed, the key is released and a new call is made
+        await single_flight.do("k", fetch)
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_joined_callers_get_copies(self):
+        """Test callers that joined receive copies when a copy function is given."""
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {"elements": []}
+
+        first, second = await asyncio.gather(
+            single_flight.do("k", fetch, copy=dict),
+            single_flight.do("k", fetch, copy=dict)
+        )
+        assert first == second
+        assert first is not second
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared(self):
+        """Test every waiting caller receives the shared exception."""
+        single_flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            *(single_flight.do("k", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_client_coalesces_status_fetches(self):
+        """Test concurrent cold-cache status lookups send one HTTP request."""
+        from src.openproject_client import OpenProjectClient
+
+        client = OpenProjectClient()
+
+        async def slow_send(method, url, **kwargs):
+            await asyncio.sleep(0.01)
+            return {"_embedded": {"elements": [{"id": 1, "name": "New"}]}}
+
+        client._send_request = AsyncMock(side_effect=slow_send)
+
+        results = await asyncio.gather(*(client.get_work_package_statuses() for _ in range(10)))
+
+        assert client._send_request.call_count == 1
+        assert all(r == [{"id": 1, "name": "New"}] for r in results)
+        # Each caller can modify its result without affecting the others
+        assert len({id(r) for r in results}) == len(results)
@@ -0,0 +1,72 @@
+"""Unit tests for OpenProject filter and select helpers."""
+import json
+import pytest
+
+from src.utils.filters import build_collection_params, build_select, build_work_package_filters
+
+
+class TestBuildWorkPackageFilters:
+    """Test translation of search criteria into OpenProject filter JSON."""
+
+    def test_no_criteria_returns_empty_list(self):
+        """Test that no criteria produce no filters."""
+        assert build_work_package_filters() == []
+
+    def test_status_ids_take_precedence_over_scope(self):
+        """Test explicit status IDs win over an open/closed scope."""
+        filters = build_work_package_filters(status_ids=[2, 3], status_scope="open")
+
+        assert filters == [{"status": {"operator": "=", "values": ["2", "3"]}}]
+
+    def test_status_scope(self):
+        """Test open/closed scopes map to OpenProject operators."""
+        assert build_work_package_filters(status_scope="open") == [{"status": {"operator": "o", "values": []}}]
+        assert build_work_package_filters(status_scope="Closed") == [{"status": {"operator": "c", "values": []}}]
+
+        with pytest.raises(ValueError):
+            build_work_package_filters(status_scope="pending")
+
+    def test_assignee_type_and_date_ranges(self):
+        """Test assignee, type, date range and updated-since filters."""
+        filters = build_work_package_filters(
+            assignee_ids=["me"],
+            type_ids=[1],
+            due_date_from="2026-01-01",
+            due_date_to="2026-01-31",
+            start_date_to="2026-01-15",
+            updated_since="2026-01-10T00:00:00Z"
+        )
+
+        assert filters == [
+            {"assignee": {"operator": "=", "values": ["me"]}},
+            {"type": {"operator": "=", "values": ["1"]}},
+            {"startDate": {"operator": "<>d", "values": ["", "2026-01-15"]}},
+            {"dueDate": {"operator": "<>d", "values": ["2026-01-01", "2026-01-31"]}},
+            {"updatedAt": {"operator": "<>d", "values": ["2026-01-10T00:00:00Z", ""]}},
+        ]
+
+
+class TestBuildSelect:
+    """Test server-side field projection."""
+
+    def test_select_always_includes_totals_and_id(self):
+        """Test select includes totals and IDs and maps field names."""
+        assert build_select(["subject", "due_date", "status"]) == (
+            "total,count,elements/id,elements/subject,elements/dueDate,elements/status"
+        )
+
+    def test_unknown_field_raises(self):
+        """Test unknown fields are rejected with the available list."""
+        with pytest.raises(ValueError) as exc_info:
+            build_select(["subject", "colour"])
+        assert "colour" in str(exc_info.value)
+        assert "due_date" in str(exc_info.value)
+
+    def test_collection_params(self):
+        """Test filters are JSON encoded and empty input adds nothing."""
+        assert build_collection_params() == {}
+        assert build_collection_params([]) == {"filters": "[]"}
+
+        params = build_collection_params(build_work_package_filters(status_scope="open"), ["subject"])
+        assert json.loads(params["filters"]) == [{"status": {"operator": "o", "values": []}}]
+        assert params["select"] == "total,count,elements/id,elements/subject"
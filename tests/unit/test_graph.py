@@ -0,0 +1,47 @@
+"""Unit tests for dependency graph helpers."""
+import pytest
+
+from src.utils.graph import find_cycle, normalize_relation, precedence_edge, topological_levels
+
+
+class TestRelationNormalization:
+    """Test canonical relation directions."""
+
+    def test_reverse_types_are_canonicalised(self):
+        """Test reverse types map onto their canonical counterpart."""
+        assert normalize_relation(1, 2, "precedes") == (2, 1, "follows")
+        assert normalize_relation(2, 1, "follows") == (2, 1, "follows")
+        assert normalize_relation(1, 2, "blocked") == (2, 1, "blocks")
+        assert normalize_relation(5, 3, "relates") == normalize_relation(3, 5, "relates")
+
+    def test_precedence_edges(self):
+        """Test scheduling relations become (predecessor, successor) edges."""
+        assert precedence_edge(2, 1, "follows") == (1, 2)
+        assert precedence_edge(1, 2, "precedes") == (1, 2)
+        assert precedence_edge(1, 2, "blocks") == (1, 2)
+        assert precedence_edge(1, 2, "relates") is None
+
+
+class TestCycles:
+    """Test cycle detection and topological levels."""
+
+    def test_find_cycle(self):
+        """Test a cycle is reported as a closed path."""
+        assert find_cycle([(1, 2), (2, 3), (1, 3)]) is None
+        cycle = find_cycle([(1, 2), (2, 3), (3, 1), (3, 4)])
+        assert cycle[0] == cycle[-1]
+        assert set(cycle) == {1, 2, 3}
+
+    def test_long_chain_does_not_recurse(self):
+        """Test deep graphs are handled iteratively."""
+        edges = [(i, i + 1) for i in range(5000)]
+        assert find_cycle(edges) is None
+        assert topological_levels(edges)[5000] == 5000
+
+    def test_topological_levels(self):
+        """Test levels use the longest path from a root."""
+        levels = topological_levels([(1, 2), (2, 3), (1, 3), (4, 3)])
+        assert levels == {1: 0, 4: 0, 2: 1, 3: 2}
+
+        with pytest.raises(ValueError):
+            topological_levels([(1, 2), (2, 1)])
@@ -0,0 +1,418 @@
+"""Unit tests for OpenProjectClient HTTP transport behaviour."""
+import asyncio
+import json
+import httpx
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.openproject_client import CircuitOpenError, OpenProjectAPIError, OpenProjectClient
+from src.utils.circuit_breaker import CircuitBreaker
+from src.utils.retry import RetryPolicy, parse_retry_after
+
+
+def _response(status_code, json_body=None, headers=None):
+    """Build an httpx response for a mocked transport."""
+    request = httpx.Request("GET", "https://op.example.com/api/v3/")
+    if json_body is None:
+        return httpx.Response(status_code, headers=headers, request=request)
+    return httpx.Response(status_code, json=json_body, headers=headers, request=request)
+
+
+@pytest.fixture
+def client():
+    """Create a client whose HTTP transport is mocked."""
+    client = OpenProjectClient()
+    client.client.request = AsyncMock()
+    return client
+
+
+class TestConditionalRequests:
+    """Test ETag / Last-Modified revalidation."""
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation_serves_stored_body(self, client):
+        """Test a 304 answer returns the body stored with the ETag."""
+        work_package = {"id": 42, "subject": "Polled", "lockVersion": 3}
+        client.client.request.side_effect = [
+            _response(200, work_package, {"ETag": 'W/"abc"'}),
+            _response(304),
+        ]
+
+        first = await client._get("/work_packages/42")
+        second = await client._get("/work_packages/42", use_cache=False)
+
+        assert first == work_package
+        assert second == work_package
+        conditional_call = client.client.request.call_args_list[1]
+        assert conditional_call.kwargs["headers"]["If-None-Match"] == 'W/"abc"'
+
+        stats = client.get_cache_stats()
+        assert stats["conditional_requests"] == 1
+        assert stats["not_modified_responses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_last_modified_and_changed_resource(self, client):
+        """Test If-Modified-Since is sent and a changed resource replaces the stored body."""
+        client.client.request.side_effect = [
+            _response(200, {"id": 1, "subject": "Old"}, {"Last-Modified": "Wed, 21 Oct 2026 07:28:00 GMT"}),
+            _response(200, {"id": 1, "subject": "New"}, {"ETag": '"v2"'}),
+            _response(304),
+        ]
+
+        await client._get("/work_packages/1")
+        changed = await client._get("/work_packages/1", use_cache=False)
+        revalidated = await client._get("/work_packages/1", use_cache=False)
+
+        headers = client.client.request.call_args_list[1].kwargs["headers"]
+        assert headers["If-Modified-Since"] == "Wed, 21 Oct 2026 07:28:00 GMT"
+        assert changed["subject"] == "New"
+        assert revalidated["subject"] == "New"
+        assert client.client.request.call_args_list[2].kwargs["headers"]["If-None-Match"] == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_one_entry_serves_hits_and_revalidation(self, client):
+        """Test a response is stored once and revalidated from that entry once stale."""
+        client._cache.ttls["work_packages"] = 0
+        client.client.request.side_effect = [
+            _response(200, {"id": 7, "subject": "Stored once"}, {"ETag": '"v1"'}),
+            _response(304),
+        ]
+
+        await client._get("/work_packages/7")
+        assert client.get_cache_stats()["entries"] == 1
+
+        # The namespace TTL is 0, so the entry is stale at once but kept for revalidation
+        revalidated = await client._get("/work_packages/7")
+
+        assert revalidated == {"id": 7, "subject": "Stored once"}
+        assert client.client.request.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"v1"'
+        stats = client.get_cache_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 0
+        assert stats["not_modified_responses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_writes_are_never_conditional(self, client):
+        """Test non-GET requests never carry validators."""
+        client.client.request.side_effect = [
+            _response(200, {"id": 1}, {"ETag": '"v1"'}),
+            _response(200, {"id": 1}, {"ETag": '"v2"'}),
+        ]
+
+        await client._get("/work_packages/1")
+        await client._make_request("PATCH", "/work_packages/1", json={"lockVersion": 1})
+
+        assert "headers" not in client.client.request.call_args_list[1].kwargs
+
+    @pytest.mark.asyncio
+    async def test_streamed_pages_are_not_cached(self, client):
+        """Test iter_paginated leaves the response cache and revalidation store empty."""
+        client.client.request.side_effect = [
+            _response(200, {"_embedded": {"elements": [{"id": 1}, {"id": 2}]}, "total": 3, "pageSize": 2},
+                      {"ETag": '"p1"'}),
+            _response(200, {"_embedded": {"elements": [{"id": 3}]}, "total": 3, "pageSize": 2},
+                      {"ETag": '"p2"'}),
+        ]
+
+        ids = [element["id"] async for element in client.iter_paginated("/projects")]
+
+        assert ids == [1, 2, 3]
+        stats = client.get_cache_stats()
+        assert stats["entries"] == 0
+        assert all("headers" not in call.kwargs for call in client.client.request.call_args_list)
+
+
+class TestConnectionPool:
+    """Test pool limits, timeouts and utilisation metrics."""
+
+    def test_pool_and_timeouts_follow_settings(self, monkeypatch):
+        """Test pool limits and split timeouts come from settings."""
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "http_max_connections", 7)
+        monkeypatch.setattr(settings, "http_max_keepalive_connections", 3)
+        monkeypatch.setattr(settings, "http_connect_timeout", 2.0)
+        monkeypatch.setattr(settings, "http_read_timeout", 45.0)
+
+        client = OpenProjectClient()
+
+        assert client.client.timeout.connect == 2.0
+        assert client.client.timeout.read == 45.0
+        stats = client.get_connection_stats()
+        assert stats["max_connections"] == 7
+        assert stats["max_keepalive_connections"] == 3
+
+    def test_http2_requires_h2(self, monkeypatch):
+        """Test HTTP/2 falls back to HTTP/1.1 when h2 is not installed."""
+        import src.openproject_client as client_module
+
+        monkeypatch.setattr(client_module.settings, "http2", True)
+        monkeypatch.setattr(client_module, "HTTP2_AVAILABLE", False)
+
+        assert OpenProjectClient().get_connection_stats()["http2"] is False
+
+    @pytest.mark.asyncio
+    async def test_in_flight_requests_are_tracked(self, client):
+        """Test concurrent requests are counted while they are in flight."""
+        in_flight = []
+
+        async def send(method, url, **kwargs):
+            in_flight.append(client.get_connection_stats()["in_flight_requests"])
+            await asyncio.sleep(0.01)
+            return _response(200, {"id": 1})
+
+        client.client.request.side_effect = send
+
+        await asyncio.gather(*(client._make_request("PATCH", f"/work_packages/{i}") for i in range(3)))
+
+        stats = client.get_connection_stats()
+        assert max(in_flight) == 3
+        assert stats["peak_in_flight_requests"] == 3
+        assert stats["in_flight_requests"] == 0
+        assert stats["total_requests"] == 3
+
+
+class TestRetry:
+    """Test retries of transient failures."""
+
+    def test_parse_retry_after(self):
+        """Test Retry-After in seconds and as an HTTP date."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after("Thu, 01 Jan 1970 00:00:00 GMT") == 0.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_policy_limits(self):
+        """Test method, status, attempt and deadline limits."""
+        policy = RetryPolicy(max_retries=2, backoff_base=1.0, backoff_max=4.0)
+
+        assert policy.next_delay("POST", 0, 60) is None
+        assert policy.next_delay("GET", 0, 60, status_code=404) is None
+        assert policy.next_delay("GET", 2, 60) is None
+        assert policy.next_delay("GET", 0, 60, status_code=429, retry_after="120") is None
+        assert policy.next_delay("GET", 0, 60, status_code=503, retry_after="3") == 3.0
+        assert 0 <= policy.next_delay("GET", 1, 60, status_code=502) <= 2.0
+
+    @pytest.mark.asyncio
+    async def test_get_retried_honouring_retry_after(self, client):
+        """Test a 429 is retried after the server-requested delay."""
+        client.client.request.side_effect = [
+            _response(429, {"message": "slow down"}, {"Retry-After": "2"}),
+            _response(200, {"id": 1}),
+        ]
+
+        with patch("src.openproject_client.asyncio.sleep", new=AsyncMock()) as sleep:
+            result = await client._make_request("GET", "/work_packages/1")
+
+        assert result == {"id": 1}
+        sleep.assert_awaited_once_with(2.0)
+        assert client.get_connection_stats()["retries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_transport_errors_retried_until_exhausted(self, client):
+        """Test connection errors are retried up to max_retries."""
+        client.retry_policy.max_retries = 2
+        client.client.request.side_effect = httpx.ConnectError("refused")
+
+        with patch("src.openproject_client.asyncio.sleep", new=AsyncMock()):
+            with pytest.raises(OpenProjectAPIError):
+                await client._make_request("GET", "/projects")
+
+        assert client.client.request.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_attempts_bounded_by_deadline(self, client):
+        """Test attempt timeouts are capped at the deadline and none start after it."""
+        client.retry_policy.deadline = 2.0
+        client.client.request.return_value = _response(200, {"id": 1})
+
+        await client._make_request("GET", "/projects/1")
+        timeout = client.client.request.call_args.kwargs["timeout"]
+        assert timeout.connect <= 2.0 and timeout.read <= 2.0
+
+        client.retry_policy.deadline = 0
+        with pytest.raises(OpenProjectAPIError, match="deadline"):
+            await client._make_request("GET", "/projects/2")
+        assert client.client.request.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_post_not_retried_by_default(self, client):
+        """Test non-idempotent requests fail without retrying."""
+        client.client.request.side_effect = [_response(503, {"message": "down"})]
+
+        with pytest.raises(OpenProjectAPIError) as exc_info:
+            await client._make_request("POST", "/projects", json={"name": "x"})
+
+        assert exc_info.value.status_code == 503
+        assert client.client.request.call_count == 1
+
+
+class TestCircuitBreaker:
+    """Test failing fast while the backend is down."""
+
+    def test_state_transitions(self):
+        """Test closed -> open -> half-open -> closed/open transitions."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10)
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure(breaker.allow_request())
+            assert breaker.state == "closed"
+            breaker.record_failure(breaker.allow_request())
+            assert breaker.state == "open"
+            assert breaker.allow_request() is None
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=110.0):
+            assert breaker.state == "half_open"
+            probe = breaker.allow_request()
+            assert probe.probe is True
+            # Only one probe at a time
+            assert breaker.allow_request() is None
+            breaker.record_failure(probe)
+            assert breaker.state == "open"
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=120.0):
+            breaker.record_success(breaker.allow_request())
+            assert breaker.state == "closed"
+
+        assert breaker.stats()["times_opened"] == 2
+
+    def test_only_probes_release_slots(self):
+        """Test calls admitted while closed do not free half-open probe slots."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            slow_call = breaker.allow_request()
+            breaker.record_failure(breaker.allow_request())
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=110.0):
+            assert breaker.allow_request().probe is True
+            breaker.release(slow_call)
+            assert breaker.allow_request() is None
+
+    def test_stats_do_not_change_state(self):
+        """Test reading stats reports half-open without moving the breaker there."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=100.0):
+            breaker.record_failure(breaker.allow_request())
+
+        with patch("src.utils.circuit_breaker.time.monotonic", return_value=110.0):
+            period = breaker._period
+            assert breaker.stats()["state"] == "half_open"
+            assert breaker.stats()["retry_after_seconds"] == 0.0
+            assert breaker._period == period
+
+    @pytest.mark.asyncio
+    async def test_deadline_before_send_does_not_trip(self, client):
+        """Test requests throttled past their deadline are not counted as backend failures."""
+        client.circuit_breaker.failure_threshold = 1
+        client.retry_policy.deadline = 0
+
+        for _ in range(3):
+            with pytest.raises(OpenProjectAPIError, match="deadline"):
+                await client._make_request("GET", "/projects")
+
+        client.client.request.assert_not_called()
+        assert client.get_circuit_breaker_state()["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_client_fails_fast_when_open(self, client):
+        """Test requests are rejected without network calls once the breaker opens."""
+        client.retry_policy.max_retries = 0
+        client.circuit_breaker.failure_threshold = 2
+        client.client.request.side_effect = httpx.ConnectTimeout("timed out")
+
+        for _ in range(2):
+            with pytest.raises(OpenProjectAPIError):
+                await client._make_request("GET", "/projects")
+
+        with pytest.raises(CircuitOpenError):
+            await client._make_request("GET", "/projects")
+
+        assert client.client.request.call_count == 2
+        assert client.get_circuit_breaker_state()["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_trip(self, client):
+        """Test 4xx responses count as a reachable backend."""
+        client.circuit_breaker.failure_threshold = 1
+        client.client.request.side_effect = [_response(404, {"message": "Not found"})] * 3
+
+        for _ in range(3):
+            with pytest.raises(OpenProjectAPIError) as exc_info:
+                await client._make_request("GET", "/work_packages/999")
+            assert not isinstance(exc_info.value, CircuitOpenError)
+
+        assert client.get_circuit_breaker_state()["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_health_check_reports_breaker_state(self):
+        """Test the health_check tool surfaces the breaker state."""
+        from src.mcp_server import health_check
+
+        with patch("src.mcp_server.openproject_client") as mock_client:
+            mock_client.test_connection = AsyncMock(return_value={"success": False, "message": "down"})
+            mock_client.get_circuit_breaker_state.return_value = {"state": "open"}
+
+            result = json.loads(await health_check.fn())
+
+        assert result["status"] == "degraded"
+        assert result["circuit_breaker"] == {"state": "open"}
+
+
+class TestLockVersionTracking:
+    """Test optimistic updates with remembered lockVersions."""
+
+    @pytest.mark.asyncio
+    async def test_read_then_update_skips_lock_version_fetch(self, client):
+        """Test an update after a read sends a single PATCH."""
+        client.client.request.side_effect = [
+            _response(200, {"_type": "WorkPackage", "id": 5, "lockVersion": 3}),
+            _response(200, {"_type": "WorkPackage", "id": 5, "lockVersion": 4}),
+        ]
+
+        await client.get_work_package_by_id(5)
+        await client.update_work_package(5, {"subject": "Edited"})
+
+        methods = [call.args[0] for call in client.client.request.call_args_list]
+        assert methods == ["GET", "PATCH"]
+        assert client.client.request.call_args_list[1].kwargs["json"]["lockVersion"] == 3
+        # The PATCH response's lockVersion is remembered for the next edit
+        assert client._lock_versions[5] == 4
+
+    @pytest.mark.asyncio
+    async def test_conflict_refetches_and_retries(self, client):
+        """Test a stale lockVersion falls back to fetch-and-retry."""
+        client._remember_lock_version(5, 3)
+        client.client.request.side_effect = [
+            _response(409, {"message": "Conflict"}),
+            _response(200, {"_type": "WorkPackage", "id": 5, "lockVersion": 6}),
+            _response(200, {"_type": "WorkPackage", "id": 5, "lockVersion": 7}),
+        ]
+
+        result = await client.update_work_package(5, {"subject": "Edited"})
+
+        assert result["lockVersion"] == 7
+        calls = client.client.request.call_args_list
+        assert [c.args[0] for c in calls] == ["PATCH", "GET", "PATCH"]
+        assert calls[2].kwargs["json"]["lockVersion"] == 6
+        assert client.get_cache_stats()["lock_conflicts"] == 1
+
+    @pytest.mark.asyncio
+    async def test_collections_recorded_and_map_bounded(self, client, monkeypatch):
+        """Test collection elements are recorded and the map stays bounded."""
+        from src.openproject_client import settings
+
+        monkeypatch.setattr(settings, "lock_version_cache_size", 2)
+        client.client.request.return_value = _response(200, {"_embedded": {"elements": [
+            {"id": 1, "lockVersion": 1}, {"id": 2, "lockVersion": 1}, {"id": 3, "lockVersion": 9},
+        ]}})
+
+        await client._make_request("GET", "/projects/1/work_packages")
+
+        assert dict(client._lock_versions) == {2: 1, 3: 9}
+
+        # Relations and other resources are ignored, and versions never go backwards
+        client._record_lock_versions("/work_packages/3/relations", {"id": 3, "lockVersion": 100})
+        client._record_lock_versions("/work_packages/3", {"id": 3, "lockVersion": 2})
+        assert client._lock_versions[3] == 9
@@ -0,0 +1,75 @@
+"""Unit tests for the project work package mirror."""
+import json
+
+from src.utils.mirror import ProjectMirror, parse_timestamp
+from src.utils.records import WorkPackageRecord
+
+
+def _wp(wp_id, updated_at, subject="Task"):
+    return {"id": wp_id, "subject": subject, "updatedAt": updated_at}
+
+
+class TestProjectMirror:
+    """Test full loads, delta merges and the watermark."""
+
+    def test_load_sets_watermark(self):
+        """Test a full load keeps every work package and the newest updatedAt."""
+        mirror = ProjectMirror(1)
+        assert mirror.needs_full_sync(3600)
+
+        mirror.load([_wp(2, "2026-01-02T10:00:00Z"), _wp(1, "2026-01-03T08:30:00.5Z")])
+
+        assert [wp.id for wp in mirror.work_packages()] == [1, 2]
+        assert mirror.watermark == "2026-01-03T08:30:00.5Z"
+        assert not mirror.needs_full_sync(3600)
+        assert mirror.needs_full_sync(0)
+
+    def test_merge_applies_newer_and_skips_stale(self):
+        """Test a delta replaces changed work packages but never with an older copy."""
+        mirror = ProjectMirror(1)
+        mirror.load([_wp(1, "2026-01-02T10:00:00Z"), _wp(2, "2026-01-05T10:00:00Z")])
+
+        applied = mirror.merge([
+            _wp(1, "2026-01-06T09:00:00Z", subject="Renamed"),
+            _wp(2, "2026-01-04T10:00:00Z", subject="Stale"),
+            _wp(3, "2026-01-06T12:00:00Z"),
+        ])
+
+        assert applied == 2
+        by_id = {wp.id: wp for wp in mirror.work_packages()}
+        assert by_id[1].subject == "Renamed"
+        assert by_id[2].subject == "Task"
+        assert mirror.watermark == "2026-01-06T12:00:00Z"
+        assert mirror.stats()["delta_rows"] == 2
+
+    def test_remove_and_reload(self):
+        """Test removals and that a full reload drops work packages no longer returned."""
+        mirror = ProjectMirror(1)
+        mirror.load([_wp(1, "2026-01-02T10:00:00Z"), _wp(2, "2026-01-05T10:00:00Z")])
+
+        assert mirror.remove(1) is True
+        assert mirror.remove(1) is False
+        mirror.load([_wp(3, "2026-01-01T00:00:00Z")])
+
+        assert [wp.id for wp in mirror.work_packages()] == [3]
+        assert mirror.watermark == "2026-01-01T00:00:00Z"
+        assert mirror.stats()["full_syncs"] == 2
+
+    def test_snapshot_round_trip_keeps_records(self):
+        """Test mirrored work packages are compact records that survive a snapshot."""
+        mirror = ProjectMirror(1)
+        mirror.load([_wp(1, "2026-01-02T10:00:00Z"), _wp(2, "2026-01-05T10:00:00Z")])
+
+        assert all(isinstance(wp, WorkPackageRecord) for wp in mirror.work_packages())
+        snapshot = json.loads(json.dumps(mirror.snapshot()))
+        restored = ProjectMirror.from_snapshot(snapshot)
+
+        assert restored.work_packages() == mirror.work_packages()
+        assert restored.watermark == "2026-01-05T10:00:00Z"
+        assert restored.upsert(_wp(2, "2026-01-05T10:00:00Z")) is False
+
+    def test_parse_timestamp(self):
+        """Test timestamp parsing tolerates missing and malformed values."""
+        assert parse_timestamp("2026-01-02T10:00:00Z") < parse_timestamp("2026-01-02T10:00:00.1Z")
+        assert parse_timestamp(None) is None
+        assert parse_timestamp("yesterday") is None
@@ -0,0 +1,150 @@
+"""Unit tests for cursor pagination."""
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from src.openproject_client import OpenProjectClient
+from src.utils.pagination import (
+    MAX_PAGE_LIMIT, decode_cursor, encode_cursor, next_cursor, query_fingerprint, resolve_page
+)
+
+
+class TestCursors:
+    """Test cursor encoding and tool argument resolution."""
+
+    def test_round_trip_and_fingerprint(self):
+        """Test a cursor decodes only for the query it was issued for."""
+        fingerprint = query_fingerprint("work_packages", 5, [{"status": {"operator": "o", "values": []}}])
+        cursor = encode_cursor(40, 20, fingerprint)
+
+        assert decode_cursor(cursor, fingerprint) == (40, 20)
+        with pytest.raises(ValueError, match="does not match"):
+            decode_cursor(cursor, query_fingerprint("work_packages", 6, None))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor("not a cursor!", fingerprint)
+
+    def test_resolve_page(self):
+        """Test defaults, limit overrides and range checks."""
+        fingerprint = query_fingerprint("projects")
+        cursor = encode_cursor(20, 20, fingerprint)
+
+        assert resolve_page(None, None, fingerprint) is None
+        assert resolve_page(10, None, fingerprint) == (0, 10)
+        assert resolve_page(None, cursor, fingerprint) == (20, 20)
+        assert resolve_page(5, cursor, fingerprint) == (20, 5)
+        for limit in (0, MAX_PAGE_LIMIT + 1):
+            with pytest.raises(ValueError, match="limit"):
+                resolve_page(limit, None, fingerprint)
+
+    def test_next_cursor_stops_at_total(self):
+        """Test no cursor is issued once the last row was returned."""
+        assert next_cursor(0, 10, 10, 25, "q") == encode_cursor(10, 10, "q")
+        assert next_cursor(20, 10, 5, 25, "q") is None
+        assert next_cursor(0, 10, 0, 25, "q") is None
+
+
+class TestGetPage:
+    """Test mapping row windows onto OpenProject pages."""
+
+    @staticmethod
+    def _pages(total, server_page_size=None):
+        """Return a _fetch_page mock serving rows 0..total-1."""
+        async def fetch(endpoint, params, offset, page_size, use_cache=True):
+            size = min(page_size, server_page_size or page_size)
+            start = (offset - 1) * size
+            rows = [{"id": i} for i in range(start, min(start + size, total))]
+            return {"total": total, "pageSize": size, "_embedded": {"elements": rows}}
+        return AsyncMock(side_effect=fetch)
+
+    @pytest.mark.asyncio
+    async def test_aligned_window_single_request(self):
+        """Test an aligned offset fetches exactly one page."""
+        client = OpenProjectClient()
+        client._fetch_page = self._pages(95)
+
+        rows, total = await client.get_page("/projects", None, 20, 10)
+
+        assert [r["id"] for r in rows] == list(range(20, 30))
+        assert total == 95
+        client._fetch_page.assert_awaited_once_with("/projects", None, 3, 10)
+
+    @pytest.mark.asyncio
+    async def test_unaligned_and_clamped_windows(self):
+        """Test windows spanning two pages and a server that clamps pageSize."""
+        client = OpenProjectClient()
+        client._fetch_page = self._pages(95)
+        rows, _ = await client.get_page("/projects", None, 15, 10)
+        assert [r["id"] for r in rows] == list(range(15, 25))
+
+        client._fetch_page = self._pages(95, server_page_size=4)
+        rows, _ = await client.get_page("/projects", None, 20, 10)
+        assert [r["id"] for r in rows] == list(range(20, 30))
+
+        rows, _ = await client.get_page("/projects", None, 90, 10)
+        assert [r["id"] for r in rows] == list(range(90, 95))
+
+
+class TestPaginatedTools:
+    """Test limit/cursor on list tools."""
+
+    @pytest.mark.asyncio
+    async def test_work_packages_follow_cursor(self):
+        """Test next_cursor walks the pages and is bound to the filters."""
+        from src.mcp_server import get_work_packages
+
+        async def page(project_id, offset, limit, filters=None, select=None):
+            rows = [{"id": i, "subject": f"WP {i}", "_links": {}} for i in range(offset, min(offset + limit, 5))]
+            return rows, 5
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_page = AsyncMock(side_effect=page)
+
+            first = json.loads(await get_work_packages.fn(project_id=7, limit=3))
+            second = json.loads(await get_work_packages.fn(project_id=7, cursor=first["next_cursor"]))
+            mismatch = json.loads(await get_work_packages.fn(
+                project_id=7, status="open", cursor=first["next_cursor"]
+            ))
+            mock_client.get_work_packages.assert_not_called()
+
+        assert [wp["id"] for wp in first["work_packages"]] == [0, 1, 2]
+        assert first["total"] == 5
+        assert [wp["id"] for wp in second["work_packages"]] == [3, 4]
+        assert second["next_cursor"] is None
+        assert mismatch["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_work_packages_bounded_by_default(self):
+        """Test work packages are fetched one page at a time unless fetch_all is set."""
+        from src.mcp_server import get_work_packages
+        from src.utils.pagination import DEFAULT_PAGE_LIMIT
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_work_packages_page = AsyncMock(return_value=([{"id": 1, "_links": {}}], 250))
+            mock_client.get_work_packages = AsyncMock(return_value=[{"id": 1, "_links": {}}])
+
+            bounded = json.loads(await get_work_packages.fn(project_id=7))
+            assert mock_client.get_work_packages_page.call_args.args == (7, 0, DEFAULT_PAGE_LIMIT)
+            mock_client.get_work_packages.assert_not_called()
+
+            everything = json.loads(await get_work_packages.fn(project_id=7, fetch_all=True))
+            assert mock_client.get_work_packages.call_args.kwargs["use_pagination"] is True
+
+            conflicting = json.loads(await get_work_packages.fn(project_id=7, limit=5, fetch_all=True))
+
+        assert bounded["total"] == 250
+        assert bounded["next_cursor"] is not None
+        assert "next_cursor" not in everything
+        assert conflicting["success"] is False
+
+    @pytest.mark.asyncio
+    async def test_unpaginated_call_unchanged(self):
+        """Test calls without limit or cursor still return every row."""
+        from src.mcp_server import get_projects
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_projects = AsyncMock(return_value=[{"id": 1, "name": "Apollo"}])
+            result = json.loads(await get_projects.fn())
+            mock_client.get_projects_page.assert_not_called()
+
+        assert [p["id"] for p in result["projects"]] == [1]
+        assert "next_cursor" not in result
@@ -0,0 +1,77 @@
+"""Unit tests for the client-side rate limiter."""
+import asyncio
+import time
+import pytest
+
+from src.utils.rate_limit import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test token bucket refill and bursts."""
+
+    def test_rejects_non_positive_rate(self):
+        """Test a bucket needs a positive rate."""
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    @pytest.mark.asyncio
+    async def test_burst_then_throttle(self):
+        """Test the burst is served immediately and further tokens at the rate."""
+        bucket = TokenBucket(rate=50, capacity=3)
+
+        start = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        burst_elapsed = time.monotonic() - start
+
+        for _ in range(2):
+            await bucket.acquire()
+        total_elapsed = time.monotonic() - start
+
+        assert burst_elapsed < 0.02
+        assert total_elapsed >= 0.035
+
+
+class TestRateLimiter:
+    """Test read/write classification and metrics."""
+
+    def test_classify(self):
+        """Test HTTP methods map to read or write classes."""
+        assert RateLimiter.classify("GET") == "read"
+        assert RateLimiter.classify("patch") == "write"
+        assert RateLimiter.classify("DELETE") == "write"
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_never_waits(self):
+        """Test a limiter without buckets is a no-op."""
+        limiter = RateLimiter()
+
+        assert await limiter.acquire("POST") == 0.0
+        assert limiter.stats()["enabled"] is False
+
+    def test_client_unlimited_by_default(self, monkeypatch):
+        """Test no limit applies unless one is configured."""
+        from src.config import Settings
+        from src.openproject_client import OpenProjectClient
+
+        for name in ("RATE_LIMIT", "RATE_LIMIT_BURST", "RATE_LIMIT_READ", "RATE_LIMIT_WRITE"):
+            monkeypatch.delenv(f"OPENPROJECT_{name}", raising=False)
+        monkeypatch.setattr("src.openproject_client.settings", Settings())
+        assert OpenProjectClient().get_rate_limit_stats()["enabled"] is False
+
+    @pytest.mark.asyncio
+    async def test_write_bucket_does_not_throttle_reads(self):
+        """Test writes are limited separately and queue metrics are recorded."""
+        limiter = RateLimiter(write_bucket=TokenBucket(rate=50, capacity=1))
+
+        await asyncio.gather(*(limiter.acquire("POST") for _ in range(3)))
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("GET") for _ in range(10)))
+
+        assert time.monotonic() - start < 0.01
+        stats = limiter.stats()
+        assert stats["acquired"] == 13
+        assert stats["delayed"] == 2
+        assert stats["peak_queue_depth"] == 2
+        assert stats["queue_depth"] == 0
+        assert stats["max_wait_seconds"] >= 0.03
@@ -0,0 +1,85 @@
+"""Unit tests for compact work package records."""
+from src.utils.filters import WORK_PACKAGE_FIELDS
+from src.utils.records import (
+    WorkPackageRecord, link_id, normalize_work_package, normalize_work_packages, parse_iso_duration
+)
+
+HAL_WORK_PACKAGE = {
+    "_type": "WorkPackage",
+    "id": 42,
+    "lockVersion": 3,
+    "subject": "Build",
+    "description": {"format": "markdown", "raw": "Details", "html": "<p>Details</p>"},
+    "startDate": "2026-03-02",
+    "dueDate": "2026-03-06",
+    "estimatedTime": "PT1H30M",
+    "percentageDone": 40,
+    "createdAt": "2026-01-01T00:00:00Z",
+    "updatedAt": "2026-02-01T00:00:00Z",
+    "_embedded": {"schema": {"_type": "Schema"}},
+    "_links": {
+        "self": {"href": "/api/v3/work_packages/42"},
+        "project": {"href": "/api/v3/projects/5", "title": "Apollo"},
+        "status": {"href": "/api/v3/statuses/7", "title": "In progress"},
+        "type": {"href": "/api/v3/types/1", "title": "Task"},
+        "priority": {"href": "/api/v3/priorities/8", "title": "Normal"},
+        "assignee": {"href": None},
+        "responsible": {"href": "/api/v3/users/3", "title": "Ann"},
+        "parent": {"href": "/api/v3/work_packages/40", "title": "Phase"},
+    },
+}
+
+
+class TestWorkPackageRecord:
+    """Test normalization of HAL work packages."""
+
+    def test_from_hal(self):
+        """Test fields, link IDs and titles are extracted once."""
+        record = WorkPackageRecord.from_hal(HAL_WORK_PACKAGE)
+
+        assert (record.id, record.subject, record.description) == (42, "Build", "Details")
+        assert (record.project_id, record.project) == (5, "Apollo")
+        assert (record.status_id, record.status, record.type, record.priority) == (7, "In progress", "Task", "Normal")
+        assert (record.assignee_id, record.assignee, record.responsible) == (None, None, "Ann")
+        assert record.parent_id == 40
+        assert record.estimated_hours == 1.5
+        assert (record.done_ratio, record.lock_version) == (40, 3)
+        assert not hasattr(record, "__dict__")
+
+    def test_attribute_names_match_tool_fields(self):
+        """Test every selectable tool field can be read from a record."""
+        record = WorkPackageRecord.from_hal(HAL_WORK_PACKAGE)
+        for field in WORK_PACKAGE_FIELDS:
+            getattr(record, field)
+
+    def test_sparse_and_legacy_payloads(self):
+        """Test missing links, non-dict descriptions and the pre-14 doneRatio field."""
+        record = WorkPackageRecord.from_hal({"id": 1, "description": None, "doneRatio": 10})
+
+        assert record.description == ""
+        assert record.status is None and record.project_id is None
+        assert record.done_ratio == 10
+        assert record.estimated_hours is None
+
+    def test_equality_and_hashing(self):
+        """Test records compare by fields and hash by id, so they work in sets and as keys."""
+        record = WorkPackageRecord.from_hal(HAL_WORK_PACKAGE)
+        same = WorkPackageRecord.from_hal(HAL_WORK_PACKAGE)
+        changed = WorkPackageRecord.from_hal({**HAL_WORK_PACKAGE, "subject": "Rebuild"})
+
+        assert record == same and hash(record) == hash(same)
+        assert record != changed
+        assert len({record, same, changed}) == 2
+
+    def test_normalize_passes_records_through(self):
+        """Test normalizing is idempotent."""
+        record = normalize_work_package(HAL_WORK_PACKAGE)
+        assert normalize_work_package(record) is record
+        assert [r.id for r in normalize_work_packages([record, {"id": 2}])] == [42, 2]
+
+    def test_helpers(self):
+        """Test link ID and duration parsing."""
+        assert link_id({"assignee": {"href": None}}, "assignee") is None
+        assert link_id({"user": {"href": "/api/v3/users/me"}}, "user") is None
+        assert parse_iso_duration("PT16H") == 16.0
+        assert parse_iso_duration("P1D") is None
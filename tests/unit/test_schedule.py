@@ -0,0 +1,42 @@
+"""Unit tests for critical path scheduling."""
+import pytest
+
+from src.utils.schedule import compute_schedule
+
+
+class TestComputeSchedule:
+    """Test forward/backward passes, slack and the critical path."""
+
+    def test_critical_path_and_slack(self):
+        """Test a diamond graph: the longer branch is critical."""
+        # 0 -> 1 -> 3 and 0 -> 2 -> 3
+        schedule = compute_schedule([2, 5, 1, 3], [(0, 1, 0), (0, 2, 0), (1, 3, 0), (2, 3, 0)])
+
+        assert list(schedule["es"]) == [0, 2, 2, 7]
+        assert list(schedule["ef"]) == [2, 7, 3, 10]
+        assert list(schedule["ls"]) == [0, 2, 6, 7]
+        assert list(schedule["slack"]) == [0, 0, 4, 0]
+        assert schedule["critical_path"] == [0, 1, 3]
+        assert schedule["project_finish"] == 10
+
+    def test_lag_and_start_constraints(self):
+        """Test lag delays successors and planned starts act as lower bounds."""
+        schedule = compute_schedule([2, 1, 1], [(0, 1, 3)], earliest_starts=[0, 0, 8])
+
+        assert schedule["es"][1] == 5
+        assert schedule["es"][2] == 8
+        assert schedule["critical_path"] == [2]
+        assert schedule["slack"][0] == 3
+
+    def test_cycle_rejected(self):
+        """Test cycles are reported instead of looping."""
+        with pytest.raises(ValueError):
+            compute_schedule([1, 1], [(0, 1, 0), (1, 0, 0)])
+
+    def test_long_chain(self):
+        """Test large chains are handled without recursion."""
+        n = 20000
+        schedule = compute_schedule([1] * n, [(i, i + 1, 0) for i in range(n - 1)])
+
+        assert schedule["project_finish"] == n
+        assert len(schedule["critical_path"]) == n
@@ -0,0 +1,69 @@
+"""Unit tests for the JSON serialization layer."""
+import json
+import pytest
+from unittest.mock import AsyncMock, patch
+
+import utils.serialization as serialization
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def codec(request, monkeypatch):
+    """Run a test with orjson (when installed) and with the stdlib fallback."""
+    if request.param == "orjson":
+        if not serialization.ORJSON_AVAILABLE:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+class TestSerialization:
+    """Test encoding, decoding and compact mode."""
+
+    def test_round_trip_matches_stdlib(self, codec):
+        """Test output decodes to the same data the stdlib would produce."""
+        data = {"name": "Café", "ids": [1, 2], "nested": {"ok": True, "none": None}}
+
+        assert json.loads(serialization.dumps(data, indent=2)) == data
+        assert serialization.dumps(data, indent=2) == json.dumps(data, indent=2, ensure_ascii=False)
+        assert serialization.loads(serialization.dumps_bytes(data)) == data
+        assert serialization.loads('{"a": [1]}') == {"a": [1]}
+
+    def test_compact_output_and_dates(self, codec, monkeypatch):
+        """Test compact mode drops whitespace, dates are ISO 8601 and other types are rejected."""
+        from datetime import date, datetime
+
+        monkeypatch.setattr(serialization, "_compact_output", True)
+
+        assert serialization.dumps({"a": [1, 2], 3: "three"}, indent=2) == '{"a":[1,2],"3":"three"}'
+        assert serialization.dumps({"due": date(2026, 3, 2), "at": datetime(2026, 3, 2, 9, 30)}) == (
+            '{"due":"2026-03-02","at":"2026-03-02T09:30:00"}'
+        )
+        with pytest.raises(TypeError):
+            serialization.dumps({"type": object})
+        with pytest.raises(TypeError):
+            serialization.dumps_bytes({"value": object()})
+
+    def test_invalid_json_raises_decode_error(self, codec):
+        """Test both codecs raise json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            serialization.loads(b"{not json")
+
+
+class TestCompactToolOutput:
+    """Test tool responses honour compact mode."""
+
+    @pytest.mark.asyncio
+    async def test_tool_response_compact(self, monkeypatch):
+        """Test a tool response has no indentation in compact mode."""
+        from src.mcp_server import get_projects
+
+        with patch('src.mcp_server.openproject_client') as mock_client:
+            mock_client.get_projects = AsyncMock(return_value=[{"id": 1, "name": "Apollo", "_links": {}}])
+            pretty = await get_projects.fn()
+            monkeypatch.setattr(serialization, "_compact_output", True)
+            compact = await get_projects.fn()
+
+        assert "\n" in pretty and "\n" not in compact
+        assert json.loads(pretty) == json.loads(compact)
+        assert len(compact) < len(pretty)
@@ -0,0 +1,88 @@
+"""Unit tests for the indexed work package store."""
+from src.utils.records import WorkPackageRecord
+from src.utils.store import WorkPackageStore
+
+
+def _wp(wp_id, status_id=1, assignee_id=None, type_id=1, due_date=None, project_id=1):
+    links = {
+        "project": {"href": f"/api/v3/projects/{project_id}"},
+        "status": {"href": f"/api/v3/statuses/{status_id}", "title": f"Status {status_id}"},
+        "type": {"href": f"/api/v3/types/{type_id}", "title": "Task"},
+        "assignee": {"href": f"/api/v3/users/{assignee_id}", "title": f"User {assignee_id}"} if assignee_id
+        else {"href": None},
+    }
+    return {"id": wp_id, "subject": f"WP {wp_id}", "dueDate": due_date, "_links": links}
+
+
+class TestWorkPackageStore:
+    """Test index maintenance and queries."""
+
+    def _store(self):
+        store = WorkPackageStore()
+        store.replace_project(1, [
+            _wp(1, status_id=1, assignee_id=3, due_date="2026-05-01"),
+            _wp(2, status_id=2, assignee_id=3, due_date="2026-05-10"),
+            _wp(3, status_id=1, due_date="2026-04-01"),
+        ])
+        store.replace_project(2, [_wp(4, status_id=1, assignee_id=4, type_id=2, project_id=2)])
+        return store
+
+    def test_index_queries(self):
+        """Test equality, unassigned, exclusion and due date range lookups."""
+        store = self._store()
+
+        assert [r.id for r in store.query(project_ids=[1], assignee_ids=[3])] == [1, 2]
+        assert [r.id for r in store.query(assignee_ids=[None])] == [3]
+        assert [r.id for r in store.query(exclude_status_ids=[2])] == [1, 3, 4]
+        assert [r.id for r in store.query(type_ids=[2])] == [4]
+        assert [r.id for r in store.query(due_after="2026-04-15", due_before="2026-05-01")] == [1]
+        assert [r.id for r in store.query(due_before="2026-05-10")] == [1, 2, 3]
+        assert store.query(project_ids=[9]) == []
+
+    def test_upsert_moves_between_index_entries(self):
+        """Test an update re-indexes the row and replace_project drops stale rows."""
+        store = self._store()
+        store.upsert(_wp(1, status_id=2, assignee_id=4, due_date="2026-06-01"), project_id=1)
+
+        assert [r.id for r in store.query(status_ids=[2])] == [1, 2]
+        assert [r.id for r in store.query(assignee_ids=[3])] == [2]
+        assert [r.id for r in store.query(due_after="2026-05-31")] == [1]
+
+        store.replace_project(1, [_wp(3)])
+        assert [r.id for r in store.query(project_ids=[1])] == [3]
+        assert store.stats()["work_packages"] == 2
+        assert store.remove_project(2) == 1
+        assert store.projects_of(3) == {1} and store.projects_of(4) == set()
+        assert store.stats() == {
+            "work_packages": 1, "projects": 1, "statuses": 1, "assignees": 1, "types": 1, "with_due_date": 0
+        }
+
+    def test_grouping_does_not_modify_shared_records(self):
+        """Test indexing a subproject record under its parent leaves the record untouched."""
+        store = WorkPackageStore()
+        record = WorkPackageRecord.from_hal(_wp(7, project_id=2))
+        store.upsert(record, project_id=1)
+
+        assert store.get(7) is record
+        assert record.project_id == 2
+        assert [r.id for r in store.query(project_ids=[1])] == [7]
+        assert store.query(project_ids=[2]) == []
+
+    def test_work_package_shared_by_parent_and_subproject(self):
+        """Test a subproject work package stays grouped under both projects across refreshes."""
+        store = WorkPackageStore()
+        store.replace_project(1, [_wp(1), _wp(7, project_id=2)])
+        store.replace_project(2, [_wp(7, status_id=2, project_id=2)])
+        # A delta refresh of the parent re-indexes the shared row
+        store.upsert(_wp(7, status_id=3, project_id=2), project_id=1)
+
+        assert [r.id for r in store.query(project_ids=[1])] == [1, 7]
+        assert [r.id for r in store.query(project_ids=[2])] == [7]
+        assert [r.id for r in store.query(project_ids=[2], status_ids=[3])] == [7]
+        assert store.projects_of(7) == {1, 2}
+
+        # Dropping one project keeps rows the other still references
+        assert store.remove_project(2) == 1
+        assert [r.id for r in store.query(project_ids=[1])] == [1, 7]
+        assert store.remove_project(1) == 2
+        assert len(store) == 0 and store.stats()["projects"] == 0
@@ -0,0 +1,102 @@
+"""Unit tests for the webhook receiver and push-based invalidation."""
+import hashlib
+import hmac
+import json
+import pytest
+from unittest.mock import AsyncMock
+
+from src.handlers.webhooks import WebhookHandler, verify_signature
+# Imported via the client so records come from the same module as its store's
+from src.openproject_client import MISSING, OpenProjectClient, ProjectMirror
+
+SECRET = "s3cret"
+
+
+def _sign(body, secret=SECRET):
+    return "sha1=" + hmac.new(secret.encode(), body, hashlib.sha1).hexdigest()
+
+
+def _wp(wp_id, project_id, subject, updated_at):
+    return {"id": wp_id, "subject": subject, "lockVersion": 4, "updatedAt": updated_at, "_links": {
+        "project": {"href": f"/api/v3/projects/{project_id}"},
+        "status": {"href": "/api/v3/statuses/1", "title": "New"},
+    }}
+
+
+class TestVerifySignature:
+    """Test HMAC signature checks."""
+
+    def test_valid_and_invalid_signatures(self):
+        """Test only a matching HMAC of the exact body is accepted."""
+        body = b'{"action": "project:updated"}'
+
+        assert verify_signature(body, _sign(body), SECRET)
+        assert verify_signature(body, "sha256=" + hmac.new(SECRET.encode(), body, hashlib.sha256).hexdigest(), SECRET)
+        assert not verify_signature(body + b" ", _sign(body), SECRET)
+        assert not verify_signature(body, _sign(body, "other"), SECRET)
+        assert not verify_signature(body, None, SECRET)
+        assert not verify_signature(body, "md5=abc", SECRET)
+
+
+class TestWebhookHandler:
+    """Test delivery handling and event application."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a client with mocked requests."""
+        client = OpenProjectClient()
+        client._make_request = AsyncMock()
+        return client
+
+    def test_rejects_bad_deliveries(self, client):
+        """Test disabled, unsigned and malformed deliveries are rejected without queuing."""
+        body = b'{"action": "project:updated"}'
+
+        assert WebhookHandler(client, "").handle(body, _sign(body))[0] == 404
+        handler = WebhookHandler(client, SECRET)
+        assert handler.handle(body, "sha1=deadbeef")[0] == 401
+        assert handler.handle(b"not json", _sign(b"not json"))[0] == 400
+        assert handler.handle(b'{"foo": 1}', _sign(b'{"foo": 1}'))[0] == 400
+        assert handler.stats() == {"enabled": True, "accepted": 0, "rejected": 3}
+        assert not client._pending_events
+
+    @pytest.mark.asyncio
+    async def test_work_package_event_patches_cache_and_mirror(self, client):
+        """Test a work package event replaces cached copies without a request."""
+        client._make_request.side_effect = [
+            _wp(5, 1, "Old", "2026-03-01T10:00:00Z"),
+            {"total": 1, "_embedded": {"elements": [_wp(5, 1, "Old", "2026-03-01T10:00:00Z")]}},
+        ]
+        await client.get_work_package_by_id(5)
+        await client.get_mirrored_work_packages(1, include_closed=True)
+
+        body = json.dumps({"action": "work_package:updated",
+                           "work_package": _wp(5, 1, "New", "2026-03-02T10:00:00Z")}).encode()
+        status, result = WebhookHandler(client, SECRET).handle(body, _sign(body))
+        assert (status, result) == (202, {"success": True, "action": "work_package:updated"})
+
+        # Applied before the next read; served from the patched cache
+        wp = await client.get_work_package_by_id(5)
+        assert wp["subject"] == "New"
+        assert client._make_request.call_count == 2
+        assert client._mirrors[1].get(5).subject == "New"
+        # The store indexes the mirror's record instead of holding a second copy
+        assert client.work_package_store.get(5) is client._mirrors[1].get(5)
+        # The watermark is left alone so the next delta still covers earlier changes
+        assert client._mirrors[1].watermark == "2026-03-01T10:00:00Z"
+        assert client.get_cache_stats()["webhook_events"] == 1
+
+    def test_move_and_project_events(self, client):
+        """Test a work package moved out of a mirrored project is dropped from it."""
+        client._cache.set(client._cache_key("/projects"), {"_embedded": {"elements": []}})
+        client._mirrors[1] = ProjectMirror(1)
+        client._mirrors[1].load([_wp(5, 1, "Task", "2026-03-01T10:00:00Z")])
+        client.work_package_store.replace_project(1, client._mirrors[1].work_packages())
+
+        assert client.apply_webhook_event("work_package:updated", {"work_package": _wp(5, 2, "Task", "2026-03-02T10:00:00Z")})
+        assert client._mirrors[1].get(5) is None
+        assert client.work_package_store.get(5) is None
+
+        assert client.apply_webhook_event("project:updated", {"project": {"id": 1}})
+        assert client._cache.get(client._cache_key("/projects")) is MISSING
+        assert not client.apply_webhook_event("time_entry:created", {})